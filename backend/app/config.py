@@ -4,6 +4,7 @@ Loads environment variables for Supabase, external APIs, and LLM.
 """
 
 import os
+import tempfile
 from typing import Optional
 
 
@@ -33,10 +34,81 @@ class Settings:
     LLM_MODEL: str = "claude-haiku-4-5-20251001"  # Fast, cost-effective
     LLM_TIMEOUT: int = 30  # seconds (target <60s end-to-end)
 
+    # Enrichment result cache (person sources by email, company sources by domain)
+    ENRICHMENT_CACHE_ENABLED: bool = os.getenv("ENRICHMENT_CACHE_ENABLED", "true").lower() == "true"
+    ENRICHMENT_CACHE_PERSON_TTL_HOURS: float = float(os.getenv("ENRICHMENT_CACHE_PERSON_TTL_HOURS", "168"))
+    ENRICHMENT_CACHE_COMPANY_TTL_HOURS: float = float(os.getenv("ENRICHMENT_CACHE_COMPANY_TTL_HOURS", "720"))
+    ENRICHMENT_CACHE_MEMORY_ENTRIES: int = int(os.getenv("ENRICHMENT_CACHE_MEMORY_ENTRIES", "2000"))
+
+    # Vendor rate limiting (token bucket per vendor + daily quota ledger)
+    GNEWS_DAILY_QUOTA: int = int(os.getenv("GNEWS_DAILY_QUOTA", "100"))  # Free tier: 100 requests/day
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "2.0"))
+
+    # Per-source circuit breakers (stop waiting on timeouts while a vendor is down)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "3"))
+    CIRCUIT_BREAKER_RESET_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", "30"))
+
+    # Enrichment latency budgets (sources still pending at the deadline are dropped; 0 = wait for all)
+    ENRICH_BUDGET_SECONDS: float = float(os.getenv("ENRICH_BUDGET_SECONDS", "15"))
+    QUICK_ENRICH_BUDGET_SECONDS: float = float(os.getenv("QUICK_ENRICH_BUDGET_SECONDS", "4"))
+
+    # raw_data background writer (batched multi-row inserts off the request path)
+    RAW_DATA_WRITE_BUFFER: int = int(os.getenv("RAW_DATA_WRITE_BUFFER", "1000"))
+    RAW_DATA_WRITE_BATCH_SIZE: int = int(os.getenv("RAW_DATA_WRITE_BATCH_SIZE", "100"))
+    RAW_DATA_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("RAW_DATA_FLUSH_INTERVAL_SECONDS", "0.5"))
+
+    # Job Queue (POST /rad/enrich?async=true)
+    JOB_WORKER_CONCURRENCY: int = int(os.getenv("JOB_WORKER_CONCURRENCY", "2"))  # 0 disables in-process worker
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+    JOB_POLL_INTERVAL_SECONDS: float = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1.0"))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+    # PDF Rendering (weasyprint process pool; 0 = render in a thread)
+    PDF_RENDER_WORKERS: int = int(os.getenv("PDF_RENDER_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PDF_RENDER_MAX_QUEUE: int = int(os.getenv("PDF_RENDER_MAX_QUEUE", "16"))
+    PDF_RENDER_TIMEOUT_SECONDS: float = float(os.getenv("PDF_RENDER_TIMEOUT_SECONDS", "60"))
+
+    # SMTP delivery (persistent authenticated connections, reused across sends)
+    SMTP_POOL_SIZE: int = int(os.getenv("SMTP_POOL_SIZE", "2"))
+    SMTP_IDLE_SECONDS: float = float(os.getenv("SMTP_IDLE_SECONDS", "60"))
+    SMTP_TIMEOUT_SECONDS: float = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+
+    # Email outbox (/rad/deliver queues the email; a background sender delivers it)
+    EMAIL_OUTBOX_ENABLED: bool = os.getenv("EMAIL_OUTBOX_ENABLED", "true").lower() == "true"
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+    EMAIL_OUTBOX_POLL_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "2.0"))
+    EMAIL_OUTBOX_LEASE_SECONDS: int = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "120"))  # Floor; extended to cover a full batch
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30"))
+    EMAIL_OUTBOX_MAX_BACKOFF_SECONDS: float = float(os.getenv("EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", "3600"))
+
+    # Rendered-PDF cache (keyed by HTML hash; empty PDF_CACHE_DIR = memory only)
+    PDF_CACHE_ENABLED: bool = os.getenv("PDF_CACHE_ENABLED", "true").lower() == "true"
+    PDF_CACHE_MEMORY_MB: int = int(os.getenv("PDF_CACHE_MEMORY_MB", "64"))
+    PDF_CACHE_DIR: str = os.getenv("PDF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "amd1-pdf-cache"))
+    PDF_CACHE_DISK_MB: int = int(os.getenv("PDF_CACHE_DISK_MB", "512"))
+
+    # LLM response cache (keyed by model + prompt hash; empty LLM_CACHE_DIR = memory only)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_HOURS: float = float(os.getenv("LLM_CACHE_TTL_HOURS", "24"))
+    LLM_CACHE_MEMORY_ENTRIES: int = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "1000"))
+    LLM_CACHE_DIR: str = os.getenv("LLM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "amd1-llm-cache"))
+    LLM_CACHE_DISK_ENTRIES: int = int(os.getenv("LLM_CACHE_DISK_ENTRIES", "10000"))
+
+    # Hedged LLM calls: if the current provider is slower than its recent
+    # LLM_HEDGE_PERCENTILE latency, start the next provider in parallel
+    LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true"
+    LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_DELAY_SECONDS: float = float(os.getenv("LLM_HEDGE_DELAY_SECONDS", "8"))  # Until enough samples
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "1"))
+    LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+    LLM_LATENCY_WINDOW: int = int(os.getenv("LLM_LATENCY_WINDOW", "200"))  # Recent calls kept per provider
+
     # App Configuration
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     MOCK_MODE: bool = os.getenv("MOCK_SUPABASE", "false").lower() == "true"
+    MOCK_STORE_MAX_ROWS: int = int(os.getenv("MOCK_STORE_MAX_ROWS", "0"))  # Per mock table; 0 = unlimited
 
     def validate(self) -> None:
         """Validate that required settings are present (skip in mock mode)."""
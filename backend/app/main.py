@@ -9,6 +9,13 @@ from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.routes import enrichment
+from app.services.http_pool import init_http_pool, close_http_pool
+from app.services.email_outbox import EmailSender
+from app.services.job_worker import JobWorker
+from app.services.pdf_render_service import init_pdf_renderer, close_pdf_renderer
+from app.services.raw_data_writer import init_raw_data_writer, close_raw_data_writer
+from app.services.smtp_pool import init_smtp_pool, close_smtp_pool
+from app.services.async_supabase_client import get_async_supabase_client, close_async_supabase_client
 
 # Configure logging
 logging.basicConfig(
@@ -32,10 +39,43 @@ async def lifespan(app: FastAPI):
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise
-    
+
+    # Shared keep-alive connections for all enrichment vendor APIs
+    init_http_pool()
+
+    # Persistent authenticated SMTP sessions (only when SMTP is configured)
+    init_smtp_pool()
+
+    # Warm weasyprint worker processes so renders don't block the event loop
+    await init_pdf_renderer()
+
+    # Batched raw_data inserts, written off the enrichment request path
+    init_raw_data_writer(get_async_supabase_client())
+
+    # In-process worker for POST /rad/enrich?async=true jobs
+    job_worker = None
+    if settings.JOB_WORKER_CONCURRENCY > 0:
+        job_worker = JobWorker(get_async_supabase_client())
+        job_worker.start()
+
+    # Background sender for the /rad/deliver email outbox
+    email_sender = None
+    if settings.EMAIL_OUTBOX_ENABLED:
+        email_sender = EmailSender(get_async_supabase_client())
+        email_sender.start()
+
     yield
-    
+
     logger.info("FastAPI app shutting down")
+    if job_worker is not None:
+        await job_worker.stop()
+    if email_sender is not None:
+        await email_sender.stop()
+    close_pdf_renderer()
+    await close_raw_data_writer()
+    await close_async_supabase_client()
+    await close_http_pool()
+    await close_smtp_pool()
 
 
 # Create FastAPI app
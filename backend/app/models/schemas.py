@@ -40,6 +40,8 @@ class EnrichmentRequest(BaseModel):
     signalAnswers: Optional[Dict[str, str]] = Field(None, description="Multi-signal wizard answers (infra_age, ai_readiness, spending_focus, team_composition)")
     # Cache control
     force_refresh: Optional[bool] = Field(False, description="Force re-enrichment even if data exists")
+    bypass_llm_cache: Optional[bool] = Field(False, description="Regenerate LLM content instead of reusing a cached response for identical prompts")
+    skip_legacy_personalization: Optional[bool] = Field(False, description="Skip legacy intro/CTA generation and only produce ebook personalization")
 
     class Config:
         json_schema_extra = {
@@ -9,8 +9,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
-from fastapi.responses import Response, JSONResponse
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from app.models.schemas import (
     EnrichmentRequest,
     EnrichmentResponse,
@@ -20,11 +20,14 @@ from app.models.schemas import (
     ErrorResponse,
     QuickEnrichRequest,
 )
-from app.services.supabase_client import SupabaseClient, get_supabase_client
+from app.config import settings
+from app.services.async_supabase_client import AsyncSupabaseClient, get_async_supabase_client
+from app.services.circuit_breaker import get_circuit_breaker
 from app.services.rad_orchestrator import RADOrchestrator
-from app.services.llm_service import LLMService
-from app.services.compliance import ComplianceService, validate_personalization
+from app.services.compliance import validate_personalization
 from app.services.pdf_service import PDFService
+from app.services.pdf_render_service import PDFRenderBusyError
+from app.services.email_outbox import enqueue_ebook_email
 from app.services.email_service import EmailService
 from app.services.executive_review_service import (
     ExecutiveReviewService,
@@ -38,7 +41,10 @@ from app.services.executive_review_service import (
 )
 from app.services.context_inference_service import infer_context
 from app.services.news_analysis_service import analyze_news
+from app.services.enrichment_pipeline import run_enrichment_pipeline
 from app.services.enrichment_apis import ApolloAPI, PDLAPI
+from app.services.single_flight import SingleFlight
+from app.services.progress import ProgressCallback, emit, stream_progress
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +57,9 @@ FREE_EMAIL_DOMAINS = {
 
 router = APIRouter(prefix="/rad", tags=["enrichment"])
 
+# Concurrent quick-enrich calls for the same email/domain share vendor calls
+_quick_enrich_flights = SingleFlight("quick_enrich")
+
 
 # =============================================================================
 # QUICK ENRICH (lightweight, for wizard pre-fill)
@@ -62,7 +71,8 @@ async def quick_enrich(request: QuickEnrichRequest):
     POST /rad/quick-enrich
 
     Lightweight enrichment for wizard pre-fill. Only calls Apollo (person)
-    and PDL Company (company data) in parallel. Returns in ~2-5 seconds.
+    and PDL Company (company data) in parallel, returning whatever arrives
+    within QUICK_ENRICH_BUDGET_SECONDS (default 4s).
 
     Skips free email providers (gmail, yahoo, etc.) immediately.
     Gracefully handles API failures — returns partial data or found=false.
@@ -82,19 +92,32 @@ async def quick_enrich(request: QuickEnrichRequest):
         apollo_api = ApolloAPI()
         pdl_api = PDLAPI()
 
-        # Run Apollo + PDL Company in parallel (15s timeout each)
-        results = await asyncio.gather(
-            apollo_api.enrich(email, domain),
-            pdl_api.enrich_company(domain),
-            return_exceptions=True,
-        )
-
-        apollo_data = results[0] if not isinstance(results[0], Exception) else {}
-        pdl_data = results[1] if not isinstance(results[1], Exception) else {}
-
-        if isinstance(results[0], Exception):
+        # Run Apollo + PDL Company in parallel, within the quick-enrich budget.
+        # A source still pending at the deadline is treated as missing; its
+        # shared fetch keeps running for any other caller.
+        tasks = [
+            asyncio.ensure_future(
+                _quick_enrich_flights.do(f"apollo:{email}", lambda: apollo_api.enrich(email, domain))
+            ),
+            asyncio.ensure_future(
+                _quick_enrich_flights.do(f"pdl_company:{domain}", lambda: pdl_api.enrich_company(domain))
+            ),
+        ]
+        _, pending = await asyncio.wait(tasks, timeout=settings.QUICK_ENRICH_BUDGET_SECONDS or None)
+        for task in pending:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        apollo_data = results[0] if not isinstance(results[0], BaseException) else {}
+        pdl_data = results[1] if not isinstance(results[1], BaseException) else {}
+
+        if isinstance(results[0], asyncio.CancelledError):
+            logger.warning(f"Quick-enrich Apollo timed out for {email}")
+        elif isinstance(results[0], Exception):
             logger.warning(f"Quick-enrich Apollo failed for {email}: {results[0]}")
-        if isinstance(results[1], Exception):
+        if isinstance(results[1], asyncio.CancelledError):
+            logger.warning(f"Quick-enrich PDL Company timed out for {domain}")
+        elif isinstance(results[1], Exception):
             logger.warning(f"Quick-enrich PDL Company failed for {domain}: {results[1]}")
 
         # Merge: prefer PDL Company for company data, Apollo for person data
@@ -134,6 +157,34 @@ async def quick_enrich(request: QuickEnrichRequest):
         return {"found": False}
 
 
+# Server-Sent Events headers (disable proxy buffering so events arrive as emitted)
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _cached_enrichment(
+    request: EnrichmentRequest,
+    supabase: AsyncSupabaseClient,
+    job_id: str
+) -> Optional[dict]:
+    """Response for an already-enriched email, or None if it needs (re-)enrichment."""
+    email = request.email.lower().strip()
+    existing_record = await supabase.get_finalize_data(email)
+    if not existing_record or request.force_refresh:
+        return None
+
+    logger.info(f"[{job_id}] Using cached data for {email} (use force_refresh=true to re-enrich)")
+    # Return cached data with cache indicator
+    return {
+        "job_id": job_id,
+        "email": email,
+        "status": "completed",
+        "created_at": existing_record.get("resolved_at", datetime.utcnow().isoformat()),
+        "cached": True,
+        "data_quality_score": existing_record.get("normalized_data", {}).get("data_quality_score", 0),
+        "message": "Using cached enrichment data. Set force_refresh=true to re-enrich."
+    }
+
+
 @router.post(
     "/enrich",
     responses={
@@ -143,18 +194,21 @@ async def quick_enrich(request: QuickEnrichRequest):
 )
 async def enrich_profile(
     request: EnrichmentRequest,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    async_mode: bool = Query(False, alias="async", description="Queue the job and return immediately"),
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> EnrichmentResponse:
     """
     POST /rad/enrich
     
     Kick off enrichment for a given email.
-    Returns immediately with job_id for async tracking.
     
-    In alpha: We run enrichment synchronously but return job_id for future async support.
+    By default enrichment runs synchronously. With ?async=true the request is
+    persisted to personalization_jobs and the job_id is returned immediately;
+    a JobWorker processes it and GET /rad/jobs/{job_id} reports the result.
     
     Args:
         request: EnrichmentRequest with email and optional domain
+        async_mode: Queue the job instead of running it inline
         supabase: Supabase client (injected)
         
     Returns:
@@ -172,173 +226,34 @@ async def enrich_profile(
         domain = request.domain or email.split("@")[1]
 
         # Check for existing enrichment data (cache)
-        existing_record = supabase.get_finalize_data(email)
-        if existing_record and not request.force_refresh:
-            logger.info(f"[{job_id}] Using cached data for {email} (use force_refresh=true to re-enrich)")
-            # Return cached data with cache indicator
+        cached = await _cached_enrichment(request, supabase, job_id)
+        if cached:
+            return cached
+
+        if async_mode:
+            job = await supabase.create_job(
+                email=email,
+                domain=domain,
+                cta=request.cta,
+                persona=request.persona,
+                buyer_stage=request.goal,
+                company_name=request.company,
+                industry=request.industry,
+                company_size=request.companySize,
+                request_payload=request.model_dump(mode="json")
+            )
+            logger.info(f"[{job_id}] Queued as job {job['id']}")
             return {
-                "job_id": job_id,
+                "job_id": str(job["id"]),
                 "email": email,
-                "status": "completed",
-                "created_at": existing_record.get("resolved_at", datetime.utcnow().isoformat()),
-                "cached": True,
-                "data_quality_score": existing_record.get("normalized_data", {}).get("data_quality_score", 0),
-                "message": "Using cached enrichment data. Set force_refresh=true to re-enrich."
+                "status": "queued",
+                "created_at": job.get("created_at", datetime.utcnow().isoformat())
             }
 
-        # Create services
-        orchestrator = RADOrchestrator(supabase)
-        llm_service = LLMService()
-        compliance_service = ComplianceService()
-
-        # Run enrichment (sync in alpha, could be async/queued later)
-        # Pass user-provided company so it's used for GNews search and company resolution
-        finalized = await orchestrator.enrich(email, domain, user_company=request.company)
-
-        # Log which data sources returned real vs mock data
-        logger.info(f"[{job_id}] Data sources used: {orchestrator.data_sources}")
-        logger.info(f"[{job_id}] Quality score: {finalized.get('data_quality_score', 0)}")
-
-        # Run news analysis on enriched articles
-        news_articles = finalized.get("recent_news", []) or []
-        news_analysis = analyze_news(news_articles)
-        finalized["news_analysis"] = {
-            "sentiment": news_analysis["sentiment"]["overall"],
-            "sentiment_detail": news_analysis["sentiment"],
-            "ai_readiness": news_analysis["ai_readiness"]["stage"],
-            "ai_readiness_detail": news_analysis["ai_readiness"],
-            "crisis": news_analysis["crisis"],
-            "entities": news_analysis["entities"],
-        }
-
-        if news_analysis["crisis"]["is_crisis"]:
-            logger.warning(
-                f"[{job_id}] Crisis detected for {email}: "
-                f"{news_analysis['crisis']['type']} - {news_analysis['crisis']['details']}"
-            )
-            finalized["tone_guidance"] = "empathetic"
-
-        # Override enriched data with user-provided info (when available)
-        if request.firstName:
-            finalized["first_name"] = request.firstName
-        if request.lastName:
-            finalized["last_name"] = request.lastName
-        if request.company:
-            finalized["company_name"] = request.company
-        if request.companySize:
-            finalized["company_size"] = request.companySize
-        if request.industry:
-            finalized["industry"] = request.industry
-        if request.persona:
-            finalized["title"] = request.persona
-
-        # Run context inference to fill gaps
-        inferred = infer_context(finalized, user_goal=request.goal)
-
-        # Build user context from enriched + inferred data
-        user_context = {
-            "goal": request.goal or inferred["journey_stage"],
-            "persona": request.persona or finalized.get("title"),
-            "industry_input": request.industry or finalized.get("industry"),
-            "company": request.company or finalized.get("company_name"),
-            "company_size": request.companySize or finalized.get("company_size"),
-            "first_name": request.firstName or finalized.get("first_name"),
-            "last_name": request.lastName or finalized.get("last_name"),
-            "inferred_context": inferred,
-            "news_analysis": finalized.get("news_analysis"),
-        }
-
-        # Get company news from Tavily (if available in enrichment)
-        company_news = finalized.get("company_context", "")
-
-        # Generate AMD ebook personalization (3 sections)
-        ebook_personalization = await llm_service.generate_ebook_personalization(
-            profile=finalized,
-            user_context=user_context,
-            company_news=company_news
+        return await run_enrichment_pipeline(
+            request, supabase, job_id, budget_seconds=settings.ENRICH_BUDGET_SECONDS
         )
 
-        # Also generate legacy personalization for backward compatibility
-        use_opus = llm_service.should_use_opus(finalized)
-        personalization = await llm_service.generate_personalization(
-            finalized,
-            use_opus=use_opus,
-            user_context=user_context
-        )
-
-        intro_hook = personalization.get("intro_hook", "")
-        cta = personalization.get("cta", "")
-
-        # Run compliance check on all personalized content
-        compliance_service = ComplianceService()
-        compliance_result = compliance_service.check(intro_hook, cta, auto_correct=True)
-
-        if not compliance_result.passed and compliance_result.corrected_intro:
-            intro_hook = compliance_result.corrected_intro
-            cta = compliance_result.corrected_cta
-            logger.info(f"[{job_id}] Using compliance-corrected content")
-        elif not compliance_result.passed:
-            intro_hook = compliance_service.get_safe_intro(finalized)
-            cta = compliance_service.get_safe_cta(finalized)
-            logger.warning(f"[{job_id}] Compliance failed, using fallback content")
-
-        # Also check ebook personalization
-        ebook_hook = ebook_personalization.get("personalized_hook", "")
-        ebook_cta = ebook_personalization.get("personalized_cta", "")
-        ebook_compliance = compliance_service.check(ebook_hook, ebook_cta, auto_correct=True)
-        if not ebook_compliance.passed and ebook_compliance.corrected_intro:
-            ebook_personalization["personalized_hook"] = ebook_compliance.corrected_intro
-            ebook_personalization["personalized_cta"] = ebook_compliance.corrected_cta
-
-        # Store ebook personalization in normalized_data for PDF generation
-        finalized["ebook_personalization"] = ebook_personalization
-        finalized["user_context"] = user_context
-
-        # Update finalize_data with personalization (non-fatal - log error but continue)
-        try:
-            supabase.upsert_finalize_data(
-                email=email,
-                normalized_data=finalized,
-                intro=intro_hook,
-                cta=cta,
-                data_sources=orchestrator.data_sources
-            )
-        except Exception as db_err:
-            import traceback
-            logger.error(f"[{job_id}] Failed to store finalize_data: {db_err}")
-            logger.error(f"[{job_id}] DB error traceback: {traceback.format_exc()}")
-        
-        logger.info(f"[{job_id}] Enrichment completed for {email}")
-        
-        # Build response with data source info
-        response = EnrichmentResponse(
-            job_id=job_id,
-            email=email,
-            status="completed",
-            created_at=datetime.utcnow()
-        )
-
-        # Add extra info about data sources and personalization (for frontend)
-        return {
-            **response.model_dump(),
-            "data_sources": orchestrator.data_sources,
-            "data_quality_score": finalized.get("data_quality_score", 0),
-            "enriched_fields": {
-                "first_name": finalized.get("first_name"),
-                "company_name": finalized.get("company_name"),
-                "title": finalized.get("title"),
-                "industry": finalized.get("industry"),
-                "employee_count": finalized.get("employee_count"),
-                "latest_funding_stage": finalized.get("latest_funding_stage"),
-                "news_themes": finalized.get("news_themes", []),
-                "recent_news": finalized.get("recent_news", [])[:3],  # First 3 headlines
-                "skills": finalized.get("skills", [])[:5],  # First 5 skills
-            },
-            # Include ebook personalization for frontend rendering
-            "ebook_personalization": ebook_personalization,
-            "user_context": user_context
-        }
-        
     except ValueError as e:
         logger.warning(f"Validation error for enrichment: {e}")
         raise HTTPException(
@@ -356,6 +271,105 @@ async def enrich_profile(
         )
 
 
+@router.post("/enrich/stream")
+async def enrich_profile_stream(
+    request: EnrichmentRequest,
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
+) -> StreamingResponse:
+    """
+    POST /rad/enrich/stream
+
+    Streaming variant of POST /rad/enrich (Server-Sent Events). Emits a
+    "source" event as each enrichment source resolves (with the profile
+    merged so far), then "enrichment", "news_analysis", "context" and one
+    "llm_section" per LLM result, and finally "result" with the same
+    payload /rad/enrich returns (or "error").
+    """
+    job_id = str(uuid.uuid4())
+    logger.info(f"[{job_id}] Streaming enrichment request for {request.email}")
+
+    async def run(progress: ProgressCallback) -> dict:
+        cached = await _cached_enrichment(request, supabase, job_id)
+        if cached:
+            return cached
+        return await run_enrichment_pipeline(
+            request, supabase, job_id,
+            budget_seconds=settings.ENRICH_BUDGET_SECONDS,
+            progress=progress
+        )
+
+    return StreamingResponse(
+        stream_progress(
+            run, lambda e: f"Enrichment processing failed: {type(e).__name__}: {str(e)[:200]}"
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+# Long-poll settings for GET /rad/jobs/{job_id}
+JOB_WAIT_MAX_SECONDS = 30
+JOB_WAIT_POLL_SECONDS = 0.5
+
+
+@router.get(
+    "/jobs/{job_id}",
+    responses={
+        404: {"model": ErrorResponse}
+    }
+)
+async def get_job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=JOB_WAIT_MAX_SECONDS, description="Seconds to long-poll for completion"),
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
+):
+    """
+    GET /rad/jobs/{job_id}
+
+    Poll a job queued via POST /rad/enrich?async=true.
+    With ?wait=N the request is held until the job finishes or N seconds pass.
+
+    Args:
+        job_id: Job ID returned by the async enrich call
+        wait: Long-poll duration in seconds (0 = return immediately)
+        supabase: Supabase client (injected)
+
+    Returns:
+        Job status, plus the enrichment result once completed
+
+    Raises:
+        HTTPException: 404 if the job does not exist
+    """
+    job = await supabase.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    deadline = asyncio.get_running_loop().time() + wait
+    while job["status"] not in ("completed", "failed") and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(JOB_WAIT_POLL_SECONDS)
+        job = await supabase.get_job(job_id) or job
+
+    result = None
+    if job["status"] == "completed":
+        output = await supabase.get_output_for_job(job["id"])
+        result = output.get("output_json") if output else None
+
+    return {
+        "job_id": str(job["id"]),
+        "email": job.get("email"),
+        "status": job["status"],
+        "attempts": job.get("attempts", 0),
+        "created_at": job.get("created_at"),
+        "started_at": job.get("started_at"),
+        "completed_at": job.get("completed_at"),
+        "error_message": job.get("error_message"),
+        "result": result
+    }
+
+
 @router.get(
     "/profile/{email}",
     response_model=ProfileResponse,
@@ -366,7 +380,7 @@ async def enrich_profile(
 )
 async def get_profile(
     email: str,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> ProfileResponse:
     """
     GET /rad/profile/{email}
@@ -389,7 +403,7 @@ async def get_profile(
         logger.info(f"Profile lookup for {email}")
         
         # Fetch from finalize_data table
-        finalized_record = supabase.get_finalize_data(email)
+        finalized_record = await supabase.get_finalize_data(email)
         
         if not finalized_record:
             logger.warning(f"Profile not found for {email}")
@@ -443,7 +457,7 @@ async def get_profile(
 
 
 @router.get("/health")
-async def health_check(supabase: SupabaseClient = Depends(get_supabase_client)) -> dict:
+async def health_check(supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)) -> dict:
     """
     GET /rad/health
 
@@ -451,7 +465,7 @@ async def health_check(supabase: SupabaseClient = Depends(get_supabase_client))
     Verifies Supabase connectivity and returns diagnostic info on failure.
     """
     try:
-        is_healthy = supabase.health_check()
+        is_healthy = await supabase.health_check()
         result = {
             "status": "healthy" if is_healthy else "unhealthy",
             "service": "rad_enrichment",
@@ -460,14 +474,7 @@ async def health_check(supabase: SupabaseClient = Depends(get_supabase_client))
         }
         if not is_healthy:
             # Try individual table checks for diagnostics
-            diagnostics = {}
-            for table in ["finalize_data", "raw_data", "personalization_jobs"]:
-                try:
-                    supabase.client.table(table).select("id").limit(1).execute()
-                    diagnostics[table] = "ok"
-                except Exception as table_err:
-                    diagnostics[table] = str(table_err)[:200]
-            result["diagnostics"] = diagnostics
+            result["diagnostics"] = await supabase.check_tables()
         return result
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -520,10 +527,10 @@ async def api_status() -> dict:
     GET /rad/status
 
     Check status of all configured APIs and services.
-    Shows which APIs have real keys vs using mock data.
+    Shows which APIs have real keys vs using mock data, and the circuit
+    breaker state of each enrichment source.
     """
     import os
-    from app.config import settings
 
     def check_key(key: str) -> str:
         value = getattr(settings, key, None)
@@ -560,6 +567,10 @@ async def api_status() -> dict:
             "gnews": check_key("GNEWS_API_KEY"),
             "zoominfo": check_key("ZOOMINFO_API_KEY"),
         },
+        "circuit_breakers": {
+            source: get_circuit_breaker(source).snapshot()
+            for source in ["apollo", "pdl", "pdl_company", "hunter", "zoominfo", "gnews"]
+        },
         "llm_providers": {
             "anthropic": check_key("ANTHROPIC_API_KEY"),
             "openai": check_key("OPENAI_API_KEY"),
@@ -587,7 +598,7 @@ async def api_status() -> dict:
 )
 async def generate_pdf(
     email: str,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> dict:
     """
     POST /rad/pdf/{email}
@@ -610,7 +621,7 @@ async def generate_pdf(
         logger.info(f"PDF generation requested for {email}")
 
         # Fetch profile
-        finalized_record = supabase.get_finalize_data(email)
+        finalized_record = await supabase.get_finalize_data(email)
 
         if not finalized_record:
             raise HTTPException(
@@ -648,7 +659,7 @@ async def generate_pdf(
 
         # Store PDF delivery record
         try:
-            supabase.create_pdf_delivery(
+            await supabase.create_pdf_delivery(
                 job_id=job_id,
                 pdf_url=result.get("pdf_url"),
                 storage_path=result.get("storage_path"),
@@ -670,6 +681,12 @@ async def generate_pdf(
 
     except HTTPException:
         raise
+    except PDFRenderBusyError as e:
+        logger.warning(f"PDF render queue full: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer busy, retry shortly"
+        )
     except Exception as e:
         logger.error(f"PDF generation failed for {email}: {e}")
         raise HTTPException(
@@ -678,6 +695,31 @@ async def generate_pdf(
         )
 
 
+async def _create_delivery_record(
+    supabase: AsyncSupabaseClient,
+    job_id: int,
+    pdf_result: dict
+) -> Optional[dict]:
+    """Store the pdf_deliveries record for a delivery (non-fatal; None on failure)."""
+    try:
+        return await supabase.create_pdf_delivery(
+            job_id=job_id,
+            pdf_url=pdf_result.get("pdf_url"),
+            storage_path=pdf_result.get("storage_path"),
+            file_size_bytes=pdf_result.get("file_size_bytes")
+        )
+    except Exception as e:
+        logger.warning(f"Failed to store PDF delivery record: {e}")
+        return None
+
+
+def _email_status(email_result: dict) -> str:
+    """Delivery state for the client: "queued" (outbox), "sent" or "failed"."""
+    if email_result.get("queued"):
+        return "queued"
+    return "sent" if email_result.get("success") else "failed"
+
+
 @router.post(
     "/deliver/{email}",
     responses={
@@ -687,12 +729,14 @@ async def generate_pdf(
 )
 async def deliver_ebook(
     email: str,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> dict:
     """
     POST /rad/deliver/{email}
 
     Generate personalized PDF and send it via email.
+    With EMAIL_OUTBOX_ENABLED (default) the email is queued in the outbox and
+    sent in the background; the response returns once the PDF is stored.
     Returns email delivery status with download URL as fallback.
 
     Args:
@@ -700,7 +744,7 @@ async def deliver_ebook(
         supabase: Supabase client (injected)
 
     Returns:
-        Dict with email_sent status, pdf_url fallback, delivery details
+        Dict with email_sent/email_status ("sent", "queued" or "failed"), pdf_url fallback, delivery details
 
     Raises:
         HTTPException: 404 if profile not found, 500 on generation/delivery failure
@@ -710,7 +754,7 @@ async def deliver_ebook(
         logger.info(f"Ebook delivery requested for {email}")
 
         # Fetch profile
-        finalized_record = supabase.get_finalize_data(email)
+        finalized_record = await supabase.get_finalize_data(email)
 
         if not finalized_record:
             raise HTTPException(
@@ -729,25 +773,17 @@ async def deliver_ebook(
         pdf_service = PDFService(supabase)
         email_service = EmailService()
 
-        # Generate PDF (get raw bytes for email attachment)
-        if ebook_personalization:
-            html_content = pdf_service._render_amd_ebook_template(
-                profile=profile,
-                personalized_hook=ebook_personalization.get("personalized_hook", ""),
-                case_study=pdf_service._get_case_study_for_profile(profile, user_context),
-                case_study_framing=ebook_personalization.get("case_study_framing", ""),
-                personalized_cta=ebook_personalization.get("personalized_cta", ""),
-                user_context=user_context
-            )
-        else:
-            html_content = pdf_service._render_template(profile, intro_hook, cta)
-        pdf_bytes = await pdf_service._html_to_pdf(html_content)
-
-        if not pdf_bytes:
-            raise ValueError("PDF generation returned empty content")
+        # Render once; the same bytes are attached to the email and uploaded
+        rendered = await pdf_service.render_ebook(
+            profile=profile,
+            personalization=ebook_personalization,
+            user_context=user_context,
+            intro_hook=intro_hook,
+            cta=cta
+        )
+        pdf_bytes = rendered["pdf_bytes"]
 
-        # Try to send email
-        email_result = await email_service.send_ebook(
+        email_kwargs = dict(
             to_email=email,
             pdf_bytes=pdf_bytes,
             profile=profile,
@@ -755,36 +791,33 @@ async def deliver_ebook(
             cta=ebook_personalization.get("personalized_cta", cta)
         )
 
-        # Also store PDF for fallback download
-        if ebook_personalization:
-            pdf_result = await pdf_service.generate_amd_ebook(
-                job_id=job_id,
-                profile=profile,
-                personalization=ebook_personalization,
-                user_context=user_context
-            )
+        if settings.EMAIL_OUTBOX_ENABLED:
+            # Store the PDF, then queue the email; the outbox sender delivers
+            # it (with retries) so this request never waits on the provider
+            pdf_result = await pdf_service.store_rendered_pdf(pdf_bytes, job_id, profile)
+            delivery = await _create_delivery_record(supabase, job_id, pdf_result)
+            try:
+                queued = await enqueue_ebook_email(
+                    supabase, email_service, delivery_id=delivery.get("id") if delivery else None, **email_kwargs
+                )
+                # Accepted for delivery: email_sent stays truthful for the client
+                email_result = {"success": True, "queued": True, "provider": email_service.provider,
+                                "outbox_id": queued.get("id")}
+            except Exception as e:
+                logger.warning(f"Failed to queue email for {email}, sending directly: {e}")
+                email_result = await email_service.send_ebook(**email_kwargs)
         else:
-            pdf_result = await pdf_service.generate_pdf(
-                job_id=job_id,
-                profile=profile,
-                intro_hook=intro_hook,
-                cta=cta
-            )
-
-        # Store delivery record
-        try:
-            supabase.create_pdf_delivery(
-                job_id=job_id,
-                pdf_url=pdf_result.get("pdf_url"),
-                storage_path=pdf_result.get("storage_path"),
-                file_size_bytes=pdf_result.get("file_size_bytes")
+            # Send email and store PDF for fallback download concurrently
+            email_result, pdf_result = await asyncio.gather(
+                email_service.send_ebook(**email_kwargs),
+                pdf_service.store_rendered_pdf(pdf_bytes, job_id, profile)
             )
-        except Exception as e:
-            logger.warning(f"Failed to store PDF delivery record: {e}")
+            await _create_delivery_record(supabase, job_id, pdf_result)
 
         response = {
             "email": email,
             "email_sent": email_result.get("success", False),
+            "email_status": _email_status(email_result),
             "email_provider": email_result.get("provider"),
             "message_id": email_result.get("message_id"),
             "pdf_url": pdf_result.get("pdf_url"),  # Fallback download URL
@@ -792,7 +825,10 @@ async def deliver_ebook(
             "delivered_at": datetime.utcnow().isoformat()
         }
 
-        if not email_result.get("success"):
+        if email_result.get("queued"):
+            response["outbox_id"] = email_result.get("outbox_id")
+            logger.info(f"Ebook email for {email} queued (outbox {email_result.get('outbox_id')})")
+        elif not email_result.get("success"):
             response["email_error"] = email_result.get("error", "Unknown error")
             logger.warning(f"Email delivery failed for {email}, fallback URL provided")
         else:
@@ -802,6 +838,12 @@ async def deliver_ebook(
 
     except HTTPException:
         raise
+    except PDFRenderBusyError as e:
+        logger.warning(f"PDF render queue full: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer busy, retry shortly"
+        )
     except Exception as e:
         logger.error(f"Ebook delivery failed for {email}: {e}")
         raise HTTPException(
@@ -881,6 +923,145 @@ def _infer_segment_from_employee_count(count) -> str:
     return "Enterprise"
 
 
+async def _build_executive_review(
+    request: EnrichmentRequest,
+    supabase: AsyncSupabaseClient,
+    progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Enrich, analyze and generate the executive review for one request.
+    Shared by POST /rad/executive-review and its streaming variant.
+
+    Args:
+        request: EnrichmentRequest - only email is required
+        supabase: Supabase client
+        progress: Optional callback for streaming progress events
+
+    Returns:
+        Executive review response payload
+    """
+    email = request.email.lower().strip()
+    domain = request.domain or email.split("@")[1]
+    logger.info(f"Executive review generation for {email}")
+
+    # Step 1: Enrich from email via APIs
+    orchestrator = RADOrchestrator(supabase, progress=progress)
+    finalized = await orchestrator.enrich(
+        email, domain, user_company=request.company,
+        budget_seconds=settings.ENRICH_BUDGET_SECONDS,
+        use_cache=not request.force_refresh
+    )
+
+    logger.info(f"Enrichment complete. Quality: {finalized.get('data_quality_score', 0)}, Sources: {orchestrator.data_sources}")
+
+    # Step 2: Analyze news for deeper insights
+    news_articles = finalized.get("recent_news", []) or []
+    news_analysis = analyze_news(news_articles)
+    news_summary = {
+        "sentiment": news_analysis["sentiment"]["overall"],
+        "ai_readiness": news_analysis["ai_readiness"]["stage"],
+        "crisis": news_analysis["crisis"]["is_crisis"],
+    }
+    emit(progress, "news_analysis", news_summary)
+
+    # Step 3: Infer context from enrichment data
+    inferred = infer_context(finalized, user_goal=request.goal)
+    logger.info(f"Context inferred: {inferred}")
+    emit(progress, "context", inferred)
+
+    # Step 4: Resolve final values - user input wins over API data
+    # (APIs may return the person's CURRENT employer, not the company they entered)
+    company_name = request.company or finalized.get("company_name") or domain.split(".")[0].title()
+    raw_industry = finalized.get("industry") or request.industry or "technology"
+    industry = map_industry_display(raw_industry)
+
+    # Segment from employee count (enriched) or company size (form)
+    employee_count = finalized.get("employee_count")
+    if employee_count:
+        segment = _infer_segment_from_employee_count(employee_count)
+    else:
+        segment = map_company_size_to_segment(request.companySize or "enterprise")
+
+    # Persona from enriched title
+    enriched_title = finalized.get("title") or ""
+    if request.persona:
+        persona = map_role_to_persona(request.persona)
+    else:
+        departments = finalized.get("departments") or []
+        persona = _infer_persona_from_title(enriched_title, departments)
+
+    # Stage, priority, challenge — user wizard selections win, inferred is fallback
+    stage = map_it_environment_to_stage(request.itEnvironment or inferred["it_environment"])
+    priority = map_priority_display(request.businessPriority or inferred["business_priority"])
+    challenge = map_challenge_display(request.challenge or inferred["primary_challenge"])
+
+    logger.info(f"Resolved: company={company_name}, industry={industry}, segment={segment}, "
+                 f"persona={persona}, stage={stage}, priority={priority}, challenge={challenge}")
+
+    # Step 5: Generate executive review with enrichment context
+    enrichment_context = {
+        "employee_count": employee_count,
+        "founded_year": finalized.get("founded_year"),
+        "employee_growth_rate": finalized.get("employee_growth_rate"),
+        "latest_funding_stage": finalized.get("latest_funding_stage"),
+        "total_funding": finalized.get("total_funding_raised"),
+        "company_summary": finalized.get("company_summary"),
+        "recent_news": finalized.get("recent_news", []),
+        "news_themes": finalized.get("news_themes", []),
+        "title": enriched_title,
+        "news_analysis": news_summary,
+    }
+
+    # Include signal answers from wizard for richer LLM personalization
+    if request.signalAnswers:
+        enrichment_context["signal_answers"] = request.signalAnswers
+
+    service = ExecutiveReviewService()
+    result = await service.generate_executive_review(
+        company_name=company_name,
+        industry=industry,
+        segment=segment,
+        persona=persona,
+        stage=stage,
+        priority=priority,
+        challenge=challenge,
+        enrichment_context=enrichment_context,
+        use_cache=not request.bypass_llm_cache,
+    )
+
+    logger.info(f"Executive review generated for {company_name}")
+    emit(progress, "llm_section", {"section": "executive_review", "content": result})
+
+    return {
+        "success": True,
+        "company_name": company_name,
+        "inputs": {
+            "industry": industry,
+            "segment": segment,
+            "persona": persona,
+            "stage": stage,
+            "priority": priority,
+            "challenge": challenge,
+        },
+        "executive_review": result,
+        # Include enrichment data for frontend display
+        "enrichment": {
+            "first_name": finalized.get("first_name"),
+            "last_name": finalized.get("last_name"),
+            "title": enriched_title,
+            "company_name": company_name,
+            "employee_count": employee_count,
+            "founded_year": finalized.get("founded_year"),
+            "industry": raw_industry,
+            "data_quality_score": finalized.get("data_quality_score", 0),
+            "news_themes": finalized.get("news_themes", []),
+            "recent_news": (finalized.get("recent_news") or [])[:3],
+        },
+        "inferred_context": inferred,
+        "news_analysis": news_summary,
+    }
+
+
 @router.post(
     "/executive-review",
     responses={
@@ -890,7 +1071,7 @@ def _infer_segment_from_employee_count(count) -> str:
 )
 async def generate_executive_review(
     request: EnrichmentRequest,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> dict:
     """
     POST /rad/executive-review
@@ -906,122 +1087,7 @@ async def generate_executive_review(
         ExecutiveReviewContent with all personalized sections + enrichment data
     """
     try:
-        email = request.email.lower().strip()
-        domain = request.domain or email.split("@")[1]
-        logger.info(f"Executive review generation for {email}")
-
-        # Step 1: Enrich from email via APIs
-        orchestrator = RADOrchestrator(supabase)
-        finalized = await orchestrator.enrich(email, domain, user_company=request.company)
-
-        logger.info(f"Enrichment complete. Quality: {finalized.get('data_quality_score', 0)}, Sources: {orchestrator.data_sources}")
-
-        # Step 2: Analyze news for deeper insights
-        news_articles = finalized.get("recent_news", []) or []
-        news_analysis = analyze_news(news_articles)
-
-        # Step 3: Infer context from enrichment data
-        inferred = infer_context(finalized, user_goal=request.goal)
-        logger.info(f"Context inferred: {inferred}")
-
-        # Step 4: Resolve final values - user input wins over API data
-        # (APIs may return the person's CURRENT employer, not the company they entered)
-        company_name = request.company or finalized.get("company_name") or domain.split(".")[0].title()
-        raw_industry = finalized.get("industry") or request.industry or "technology"
-        industry = map_industry_display(raw_industry)
-
-        # Segment from employee count (enriched) or company size (form)
-        employee_count = finalized.get("employee_count")
-        if employee_count:
-            segment = _infer_segment_from_employee_count(employee_count)
-        else:
-            segment = map_company_size_to_segment(request.companySize or "enterprise")
-
-        # Persona from enriched title
-        enriched_title = finalized.get("title") or ""
-        if request.persona:
-            persona = map_role_to_persona(request.persona)
-        else:
-            departments = finalized.get("departments") or []
-            persona = _infer_persona_from_title(enriched_title, departments)
-
-        # Stage, priority, challenge — user wizard selections win, inferred is fallback
-        stage = map_it_environment_to_stage(request.itEnvironment or inferred["it_environment"])
-        priority = map_priority_display(request.businessPriority or inferred["business_priority"])
-        challenge = map_challenge_display(request.challenge or inferred["primary_challenge"])
-
-        logger.info(f"Resolved: company={company_name}, industry={industry}, segment={segment}, "
-                     f"persona={persona}, stage={stage}, priority={priority}, challenge={challenge}")
-
-        # Step 5: Generate executive review with enrichment context
-        enrichment_context = {
-            "employee_count": employee_count,
-            "founded_year": finalized.get("founded_year"),
-            "employee_growth_rate": finalized.get("employee_growth_rate"),
-            "latest_funding_stage": finalized.get("latest_funding_stage"),
-            "total_funding": finalized.get("total_funding_raised"),
-            "company_summary": finalized.get("company_summary"),
-            "recent_news": finalized.get("recent_news", []),
-            "news_themes": finalized.get("news_themes", []),
-            "title": enriched_title,
-            "news_analysis": {
-                "sentiment": news_analysis["sentiment"]["overall"],
-                "ai_readiness": news_analysis["ai_readiness"]["stage"],
-                "crisis": news_analysis["crisis"]["is_crisis"],
-            },
-        }
-
-        # Include signal answers from wizard for richer LLM personalization
-        if request.signalAnswers:
-            enrichment_context["signal_answers"] = request.signalAnswers
-
-        service = ExecutiveReviewService()
-        result = await service.generate_executive_review(
-            company_name=company_name,
-            industry=industry,
-            segment=segment,
-            persona=persona,
-            stage=stage,
-            priority=priority,
-            challenge=challenge,
-            enrichment_context=enrichment_context,
-        )
-
-        logger.info(f"Executive review generated for {company_name}")
-
-        return {
-            "success": True,
-            "company_name": company_name,
-            "inputs": {
-                "industry": industry,
-                "segment": segment,
-                "persona": persona,
-                "stage": stage,
-                "priority": priority,
-                "challenge": challenge,
-            },
-            "executive_review": result,
-            # Include enrichment data for frontend display
-            "enrichment": {
-                "first_name": finalized.get("first_name"),
-                "last_name": finalized.get("last_name"),
-                "title": enriched_title,
-                "company_name": company_name,
-                "employee_count": employee_count,
-                "founded_year": finalized.get("founded_year"),
-                "industry": raw_industry,
-                "data_quality_score": finalized.get("data_quality_score", 0),
-                "news_themes": finalized.get("news_themes", []),
-                "recent_news": (finalized.get("recent_news") or [])[:3],
-            },
-            "inferred_context": inferred,
-            "news_analysis": {
-                "sentiment": news_analysis["sentiment"]["overall"],
-                "ai_readiness": news_analysis["ai_readiness"]["stage"],
-                "crisis": news_analysis["crisis"]["is_crisis"],
-            },
-        }
-
+        return await _build_executive_review(request, supabase)
     except Exception as e:
         import traceback
         logger.error(f"Executive review generation failed: {e}")
@@ -1032,6 +1098,29 @@ async def generate_executive_review(
         )
 
 
+@router.post("/executive-review/stream")
+async def generate_executive_review_stream(
+    request: EnrichmentRequest,
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
+) -> StreamingResponse:
+    """
+    POST /rad/executive-review/stream
+
+    Streaming variant of POST /rad/executive-review (Server-Sent Events).
+    Emits "source" events as enrichment sources resolve, then "enrichment",
+    "news_analysis", "context", "llm_section" and finally "result" with the
+    same payload /rad/executive-review returns (or "error").
+    """
+    return StreamingResponse(
+        stream_progress(
+            lambda progress: _build_executive_review(request, supabase, progress),
+            lambda e: f"Executive review generation failed: {str(e)}"
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
 @router.post(
     "/executive-review-pdf",
     responses={
@@ -1080,6 +1169,7 @@ async def generate_executive_review_pdf(
             stage=stage,
             priority=priority,
             challenge=challenge,
+            use_cache=not request.bypass_llm_cache,
         )
 
         # Generate PDF from JSON
@@ -1108,6 +1198,12 @@ async def generate_executive_review_pdf(
             }
         )
 
+    except PDFRenderBusyError as e:
+        logger.warning(f"PDF render queue full: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer busy, retry shortly"
+        )
     except Exception as e:
         import traceback
         error_traceback = traceback.format_exc()
@@ -1211,7 +1307,7 @@ async def extract_pdf_json(
 )
 async def download_pdf(
     email: str,
-    supabase: SupabaseClient = Depends(get_supabase_client)
+    supabase: AsyncSupabaseClient = Depends(get_async_supabase_client)
 ) -> Response:
     """
     GET /rad/download/{email}
@@ -1231,7 +1327,7 @@ async def download_pdf(
         logger.info(f"PDF download requested for {email}")
 
         # Fetch profile
-        finalized_record = supabase.get_finalize_data(email)
+        finalized_record = await supabase.get_finalize_data(email)
 
         if not finalized_record:
             raise HTTPException(
@@ -1251,21 +1347,14 @@ async def download_pdf(
         user_context = profile.get("user_context", {})
 
         # Generate PDF bytes directly
-        if ebook_personalization:
-            html_content = pdf_service._render_amd_ebook_template(
-                profile=profile,
-                personalized_hook=ebook_personalization.get("personalized_hook", ""),
-                case_study=pdf_service._get_case_study_for_profile(profile, user_context),
-                case_study_framing=ebook_personalization.get("case_study_framing", ""),
-                personalized_cta=ebook_personalization.get("personalized_cta", ""),
-                user_context=user_context
-            )
-        else:
-            html_content = pdf_service._render_template(profile, intro_hook, cta)
-        pdf_bytes = await pdf_service._html_to_pdf(html_content)
-
-        if not pdf_bytes:
-            raise ValueError("PDF generation returned empty content")
+        rendered = await pdf_service.render_ebook(
+            profile=profile,
+            personalization=ebook_personalization,
+            user_context=user_context,
+            intro_hook=intro_hook,
+            cta=cta
+        )
+        pdf_bytes = rendered["pdf_bytes"]
 
         # Generate filename
         first_name = profile.get("first_name", "user")
@@ -1285,6 +1374,12 @@ async def download_pdf(
 
     except HTTPException:
         raise
+    except PDFRenderBusyError as e:
+        logger.warning(f"PDF render queue full: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer busy, retry shortly"
+        )
     except Exception as e:
         logger.error(f"PDF download failed for {email}: {e}")
         raise HTTPException(
@@ -0,0 +1,1192 @@
+"""
+Async Supabase data access layer.
+
+Same method surface as SupabaseClient, but every call is a coroutine backed
+by supabase-py's async client (httpx.AsyncClient under PostgREST and
+Storage), so route handlers and RADOrchestrator.enrich no longer block the
+event loop on database round-trips. One client is shared per process; its
+httpx sessions keep connections alive (HTTP/2 where available) and are
+reused across requests.
+
+Mock mode delegates to a SupabaseClient in-memory store, so tests and local
+runs see the same data through either client.
+"""
+
+import asyncio
+import logging
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.supabase_client import MOCK_MODE, SupabaseClient, is_fresh
+
+logger = logging.getLogger(__name__)
+
+# Tables probed by the /rad/health endpoint
+HEALTH_CHECK_TABLES = ["finalize_data", "raw_data", "personalization_jobs"]
+
+
+class AsyncSupabaseClient:
+    """
+    Async wrapper around Supabase for RAD enrichment data.
+
+    Args:
+        mock_store: In-memory SupabaseClient to delegate to in mock mode
+            (defaults to a fresh one when MOCK_MODE is set)
+    """
+
+    def __init__(self, mock_store: Optional[SupabaseClient] = None):
+        self.mock_mode = MOCK_MODE or (mock_store is not None and mock_store.mock_mode)
+        self._store: Optional[SupabaseClient] = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+
+        if self.mock_mode:
+            self._store = mock_store or SupabaseClient()
+            logger.info("Async Supabase client initialized in MOCK MODE (local testing)")
+
+    @property
+    def client(self):
+        """Underlying supabase AsyncClient (None until first use or in mock mode)."""
+        return self._client
+
+    @property
+    def store(self) -> Optional[SupabaseClient]:
+        """In-memory store backing mock mode."""
+        return self._store
+
+    async def get_client(self):
+        """Create the supabase AsyncClient on first use and reuse it afterwards."""
+        if self._client is not None:
+            return self._client
+        async with self._client_lock:
+            if self._client is None:
+                from supabase import acreate_client
+                self._client = await acreate_client(
+                    supabase_url=settings.SUPABASE_URL,
+                    supabase_key=settings.SUPABASE_KEY
+                )
+                logger.info("Async Supabase client initialized")
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled PostgREST and Storage connections."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await client.postgrest.aclose()
+            session = getattr(client.storage, "session", None)
+            if session is not None:
+                await session.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close async Supabase client: {e}")
+
+    async def _table(self, name: str):
+        client = await self.get_client()
+        return client.table(name)
+
+    # ========================================================================
+    # RAW_DATA TABLE (External API responses)
+    # ========================================================================
+
+    async def store_raw_data(
+        self,
+        email: str,
+        source: str,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Store raw API response for an email/source.
+
+        Args:
+            email: User email
+            source: API source (apollo, pdl, hunter, gnews)
+            payload: Raw response data
+
+        Returns:
+            Inserted record
+        """
+        if self.mock_mode:
+            return self._store.store_raw_data(email, source, payload)
+
+        data = {
+            "email": email,
+            "source": source,
+            "payload": payload,
+            "fetched_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("raw_data")
+            result = await table.insert(data).execute()
+            logger.info(f"Stored raw_data for {email} from {source}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error storing raw_data for {email}: {e}")
+            raise
+
+    async def store_raw_data_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store several raw API responses in one multi-row insert.
+
+        Args:
+            rows: Records with email, source, payload (fetched_at defaults to now)
+
+        Returns:
+            Inserted records
+        """
+        if self.mock_mode:
+            return self._store.store_raw_data_many(rows)
+        if not rows:
+            return []
+
+        now = datetime.utcnow().isoformat()
+        data = [{**row, "fetched_at": row.get("fetched_at") or now} for row in rows]
+        try:
+            table = await self._table("raw_data")
+            result = await table.insert(data).execute()
+            logger.info(f"Stored {len(data)} raw_data rows")
+            return result.data if result.data else data
+        except Exception as e:
+            logger.error(f"Error storing {len(data)} raw_data rows: {e}")
+            raise
+
+    async def get_raw_data_for_email(self, email: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve all raw data records for a given email.
+
+        Args:
+            email: User email
+
+        Returns:
+            List of raw_data records
+        """
+        if self.mock_mode:
+            return self._store.get_raw_data_for_email(email)
+
+        try:
+            table = await self._table("raw_data")
+            result = await table.select("*").eq("email", email).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error fetching raw_data for {email}: {e}")
+            return []
+
+    async def get_latest_raw_data(
+        self,
+        key: str,
+        source: str,
+        max_age_hours: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the newest raw_data record for a key/source if fresh enough.
+
+        Args:
+            key: Value of the email column (email or domain)
+            source: raw_data source name
+            max_age_hours: Maximum record age in hours
+
+        Returns:
+            Record with 'payload' key, or None if stale/missing
+        """
+        if self.mock_mode:
+            return self._store.get_latest_raw_data(key, source, max_age_hours)
+
+        try:
+            table = await self._table("raw_data")
+            result = await table.select("*").eq(
+                "email", key
+            ).eq("source", source).order(
+                "fetched_at", desc=True
+            ).limit(1).execute()
+            record = result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching {source} raw_data for {key}: {e}")
+            return None
+
+        return record if is_fresh(record, max_age_hours) else None
+
+    # ========================================================================
+    # DOMAIN_CACHE TABLE (Company-level responses shared across employees)
+    # ========================================================================
+
+    async def store_domain_cache(
+        self,
+        domain: str,
+        source: str,
+        payload: Dict[str, Any],
+        ttl_hours: float = 24
+    ) -> Dict[str, Any]:
+        """
+        Cache a company-level response for a domain (single upsert on domain+source).
+
+        Args:
+            domain: Company domain
+            source: Cached source (gnews, pdl_company, zoominfo)
+            payload: Response to cache
+            ttl_hours: Hours until the entry expires
+
+        Returns:
+            Stored record
+        """
+        if self.mock_mode:
+            return self._store.store_domain_cache(domain, source, payload, ttl_hours)
+
+        now = datetime.utcnow()
+        data = {
+            "domain": domain,
+            "source": source,
+            "payload": payload,
+            "fetched_at": now.isoformat(),
+            "expires_at": (now + timedelta(hours=ttl_hours)).isoformat()
+        }
+        try:
+            table = await self._table("domain_cache")
+            result = await table.upsert(data, on_conflict="domain,source").execute()
+            logger.info(f"Cached {source} for domain {domain}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error caching {source} for {domain}: {e}")
+            raise
+
+    async def get_domain_cache(
+        self,
+        domain: str,
+        source: str,
+        max_age_hours: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve an unexpired company-level cache entry (primary key lookup).
+
+        Args:
+            domain: Company domain
+            source: Cached source (gnews, pdl_company, zoominfo)
+            max_age_hours: Optional tighter freshness bound than the stored TTL
+
+        Returns:
+            Record with 'payload' key, or None if expired/missing
+        """
+        if self.mock_mode:
+            return self._store.get_domain_cache(domain, source, max_age_hours)
+
+        try:
+            table = await self._table("domain_cache")
+            result = await table.select("*").eq("domain", domain).eq(
+                "source", source
+            ).gt("expires_at", datetime.utcnow().isoformat()).limit(1).execute()
+            record = result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching {source} cache for {domain}: {e}")
+            return None
+
+        if max_age_hours is not None and not is_fresh(record, max_age_hours):
+            return None
+        return record
+
+    async def purge_expired_domain_cache(self) -> int:
+        """
+        Delete expired domain_cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.mock_mode:
+            return self._store.purge_expired_domain_cache()
+
+        try:
+            client = await self.get_client()
+            result = await client.rpc("purge_expired_domain_cache", {}).execute()
+            return result.data or 0
+        except Exception as e:
+            logger.error(f"Error purging expired domain cache: {e}")
+            return 0
+
+    async def store_news_cache(
+        self,
+        domain: str,
+        payload: Dict[str, Any],
+        ttl_hours: float = 24
+    ) -> Dict[str, Any]:
+        """
+        Cache news results for a company domain.
+
+        Args:
+            domain: Company domain (used as key)
+            payload: News response to cache
+            ttl_hours: Hours until the entry expires
+
+        Returns:
+            Stored record
+        """
+        return await self.store_domain_cache(domain, "gnews", payload, ttl_hours)
+
+    async def get_cached_news(
+        self,
+        domain: str,
+        max_age_hours: int = 24
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached news for a domain if fresh enough.
+
+        Args:
+            domain: Company domain
+            max_age_hours: Maximum cache age in hours (default 24)
+
+        Returns:
+            Cached record with 'payload' key, or None if stale/missing
+        """
+        return await self.get_domain_cache(domain, "gnews", max_age_hours)
+
+    # ========================================================================
+    # STAGING_NORMALIZED TABLE (Resolution in progress)
+    # ========================================================================
+
+    async def create_staging_record(
+        self,
+        email: str,
+        normalized_fields: Dict[str, Any],
+        status: str = "resolving"
+    ) -> Dict[str, Any]:
+        """
+        Create a staging_normalized record for an email.
+
+        Args:
+            email: User email
+            normalized_fields: Partial normalized profile
+            status: 'resolving' or 'ready'
+
+        Returns:
+            Inserted record
+        """
+        if self.mock_mode:
+            return self._store.create_staging_record(email, normalized_fields, status)
+
+        data = {
+            "email": email,
+            "normalized_fields": normalized_fields,
+            "status": status,
+            "created_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("staging_normalized")
+            result = await table.insert(data).execute()
+            logger.info(f"Created staging record for {email} with status={status}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error creating staging record for {email}: {e}")
+            raise
+
+    async def update_staging_record(
+        self,
+        email: str,
+        normalized_fields: Dict[str, Any],
+        status: str = "ready"
+    ) -> Dict[str, Any]:
+        """
+        Update existing staging_normalized record.
+
+        Args:
+            email: User email
+            normalized_fields: Updated normalized profile
+            status: New status
+
+        Returns:
+            Updated record
+        """
+        if self.mock_mode:
+            return self._store.update_staging_record(email, normalized_fields, status)
+
+        data = {
+            "normalized_fields": normalized_fields,
+            "status": status,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("staging_normalized")
+            result = await table.update(data).eq("email", email).execute()
+            logger.info(f"Updated staging record for {email}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error updating staging record for {email}: {e}")
+            raise
+
+    # ========================================================================
+    # FINALIZE_DATA TABLE (Final output for personalization)
+    # ========================================================================
+
+    async def write_finalize_data(
+        self,
+        email: str,
+        normalized_data: Dict[str, Any],
+        intro: Optional[str] = None,
+        cta: Optional[str] = None,
+        data_sources: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Write finalized profile + personalization content.
+
+        Args:
+            email: User email
+            normalized_data: Complete normalized profile
+            intro: LLM-generated intro hook
+            cta: LLM-generated CTA
+            data_sources: List of APIs that contributed to this record
+
+        Returns:
+            Inserted record
+        """
+        if self.mock_mode:
+            return self._store.write_finalize_data(email, normalized_data, intro, cta, data_sources)
+
+        data = {
+            "email": email,
+            "normalized_data": normalized_data,
+            "personalization_intro": intro,
+            "personalization_cta": cta,
+            "data_sources": data_sources or [],
+            "resolved_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("finalize_data")
+            result = await table.insert(data).execute()
+            logger.info(f"Wrote finalize_data for {email}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error writing finalize_data for {email}: {e}")
+            raise
+
+    async def get_finalize_data(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve finalized profile for a given email.
+
+        Args:
+            email: User email
+
+        Returns:
+            finalize_data record, or None if not found
+        """
+        if self.mock_mode:
+            return self._store.get_finalize_data(email)
+
+        try:
+            table = await self._table("finalize_data")
+            result = await table.select("*").eq(
+                "email", email
+            ).order("resolved_at", desc=True).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching finalize_data for {email}: {e}")
+            return None
+
+    async def upsert_finalize_data(
+        self,
+        email: str,
+        normalized_data: Dict[str, Any],
+        intro: Optional[str] = None,
+        cta: Optional[str] = None,
+        data_sources: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Upsert finalized profile (update if exists, insert if not).
+
+        Args:
+            email: User email
+            normalized_data: Complete normalized profile
+            intro: LLM-generated intro hook
+            cta: LLM-generated CTA
+            data_sources: List of APIs that contributed
+
+        Returns:
+            Upserted record
+        """
+        if self.mock_mode:
+            return self._store.upsert_finalize_data(email, normalized_data, intro, cta, data_sources)
+
+        data = {
+            "email": email,
+            "normalized_data": normalized_data,
+            "personalization_intro": intro,
+            "personalization_cta": cta,
+            "data_sources": data_sources or [],
+            "resolved_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("finalize_data")
+            result = await table.upsert(
+                data,
+                on_conflict="email"
+            ).execute()
+            logger.info(f"Upserted finalize_data for {email}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error upserting finalize_data for {email}: {e}")
+            raise
+
+    # ========================================================================
+    # PERSONALIZATION_JOBS TABLE (Job tracking)
+    # ========================================================================
+
+    async def create_job(
+        self,
+        email: str,
+        domain: Optional[str] = None,
+        cta: Optional[str] = None,
+        persona: Optional[str] = None,
+        buyer_stage: Optional[str] = None,
+        company_name: Optional[str] = None,
+        industry: Optional[str] = None,
+        company_size: Optional[str] = None,
+        request_payload: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new personalization job.
+
+        Args:
+            email: User email
+            domain: Company domain
+            cta: Call-to-action type
+            persona: Inferred persona
+            buyer_stage: Buyer journey stage
+            company_name: Company name
+            industry: Industry sector
+            company_size: Company size range
+            request_payload: Original /rad/enrich request body (queued jobs only)
+
+        Returns:
+            Created job record with id
+        """
+        if self.mock_mode:
+            return self._store.create_job(
+                email, domain, cta, persona, buyer_stage,
+                company_name, industry, company_size, request_payload
+            )
+
+        data = {
+            "email": email,
+            "domain": domain,
+            "cta": cta,
+            "persona": persona,
+            "buyer_stage": buyer_stage,
+            "company_name": company_name,
+            "industry": industry,
+            "company_size": company_size,
+            "status": "pending",
+            "created_at": datetime.utcnow().isoformat()
+        }
+        if request_payload is not None:
+            data["request_payload"] = request_payload
+
+        try:
+            table = await self._table("personalization_jobs")
+            result = await table.insert(data).execute()
+            logger.info(f"Created job for {email}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error creating job for {email}: {e}")
+            raise
+
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        leased_by: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update job status.
+
+        Args:
+            job_id: Job ID
+            status: New status (pending, processing, completed, failed)
+            error_message: Error message if failed
+            leased_by: Only update while this worker holds the job's lease
+
+        Returns:
+            Updated job record, or None if leased_by no longer holds the lease
+        """
+        if self.mock_mode:
+            return self._store.update_job_status(job_id, status, error_message, leased_by)
+
+        data = {"status": status}
+        if status == "processing":
+            data["started_at"] = datetime.utcnow().isoformat()
+        elif status in ("completed", "failed"):
+            data["completed_at"] = datetime.utcnow().isoformat()
+        if error_message:
+            data["error_message"] = error_message
+
+        try:
+            table = await self._table("personalization_jobs")
+            query = table.update(data).eq("id", job_id)
+            if leased_by is not None:
+                query = query.eq("leased_by", leased_by).eq("status", "processing")
+            result = await query.execute()
+            if leased_by is not None and not result.data:
+                logger.warning(f"Job {job_id} no longer leased by {leased_by}; status {status} not recorded")
+                return None
+            logger.info(f"Updated job {job_id} status to {status}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error updating job {job_id}: {e}")
+            raise
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job record or None
+        """
+        if self.mock_mode:
+            return self._store.get_job(job_id)
+
+        try:
+            table = await self._table("personalization_jobs")
+            result = await table.select("*").eq("id", job_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching job {job_id}: {e}")
+            return None
+
+    async def get_pending_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get pending jobs for processing.
+
+        Args:
+            limit: Maximum number of jobs to return
+
+        Returns:
+            List of pending job records
+        """
+        if self.mock_mode:
+            return self._store.get_pending_jobs(limit)
+
+        try:
+            table = await self._table("personalization_jobs")
+            result = await table.select("*").eq(
+                "status", "pending"
+            ).order("created_at").limit(limit).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error fetching pending jobs: {e}")
+            return []
+
+    async def claim_jobs(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically lease queued jobs for a worker (see SupabaseClient.claim_jobs).
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of jobs to claim
+            lease_seconds: How long the lease is held before others may reclaim
+
+        Returns:
+            List of claimed job records (status=processing, attempts incremented)
+        """
+        if self.mock_mode:
+            return self._store.claim_jobs(worker_id, limit, lease_seconds)
+
+        try:
+            client = await self.get_client()
+            result = await client.rpc("claim_personalization_jobs", {
+                "p_worker_id": worker_id,
+                "p_batch_size": limit,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error claiming jobs for worker {worker_id}: {e}")
+            return []
+
+    async def extend_job_lease(self, job_id: str, worker_id: str, lease_seconds: int = 300) -> bool:
+        """
+        Push back a job's lease expiry while its worker is still running it
+        (see SupabaseClient.extend_job_lease).
+
+        Returns:
+            True if renewed, False if the worker no longer holds the lease
+        """
+        if self.mock_mode:
+            return self._store.extend_job_lease(job_id, worker_id, lease_seconds)
+
+        try:
+            client = await self.get_client()
+            result = await client.rpc("renew_personalization_job_lease", {
+                "p_job_id": job_id,
+                "p_worker_id": worker_id,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return bool(result.data)
+        except Exception as e:
+            logger.error(f"Error renewing lease on job {job_id}: {e}")
+            raise
+
+    # ========================================================================
+    # PERSONALIZATION_OUTPUTS TABLE (LLM outputs)
+    # ========================================================================
+
+    async def store_personalization_output(
+        self,
+        job_id: int,
+        output_json: Dict[str, Any],
+        intro_hook: Optional[str] = None,
+        cta: Optional[str] = None,
+        model_used: Optional[str] = None,
+        tokens_used: Optional[int] = None,
+        latency_ms: Optional[int] = None,
+        compliance_passed: bool = True,
+        compliance_issues: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Store LLM personalization output.
+
+        Args:
+            job_id: Associated job ID
+            output_json: Full LLM response
+            intro_hook: Extracted intro hook
+            cta: Extracted CTA
+            model_used: LLM model name
+            tokens_used: Total tokens consumed
+            latency_ms: LLM call latency
+            compliance_passed: Whether output passed compliance
+            compliance_issues: List of compliance issues if any
+
+        Returns:
+            Stored output record
+        """
+        if self.mock_mode:
+            return self._store.store_personalization_output(
+                job_id, output_json, intro_hook, cta, model_used,
+                tokens_used, latency_ms, compliance_passed, compliance_issues
+            )
+
+        data = {
+            "job_id": job_id,
+            "output_json": output_json,
+            "intro_hook": intro_hook,
+            "cta": cta,
+            "model_used": model_used,
+            "tokens_used": tokens_used,
+            "latency_ms": latency_ms,
+            "compliance_passed": compliance_passed,
+            "compliance_issues": compliance_issues or [],
+            "created_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("personalization_outputs")
+            result = await table.insert(data).execute()
+            logger.info(f"Stored personalization output for job {job_id}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error storing output for job {job_id}: {e}")
+            raise
+
+    async def get_output_for_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get personalization output for a job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Output record or None
+        """
+        if self.mock_mode:
+            return self._store.get_output_for_job(job_id)
+
+        try:
+            table = await self._table("personalization_outputs")
+            result = await table.select("*").eq(
+                "job_id", job_id
+            ).order("created_at", desc=True).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching output for job {job_id}: {e}")
+            return None
+
+    # ========================================================================
+    # PDF_DELIVERIES TABLE (PDF tracking)
+    # ========================================================================
+
+    async def create_pdf_delivery(
+        self,
+        job_id: str,
+        pdf_url: Optional[str] = None,
+        storage_path: Optional[str] = None,
+        file_size_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create PDF delivery record.
+
+        Args:
+            job_id: Associated job ID
+            pdf_url: Public URL to PDF
+            storage_path: Storage bucket path
+            file_size_bytes: File size
+
+        Returns:
+            Created delivery record
+        """
+        if self.mock_mode:
+            return self._store.create_pdf_delivery(job_id, pdf_url, storage_path, file_size_bytes)
+
+        data = {
+            "job_id": job_id,
+            "pdf_url": pdf_url,
+            "storage_path": storage_path,
+            "file_size_bytes": file_size_bytes,
+            "delivery_status": "pending",
+            "created_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("pdf_deliveries")
+            result = await table.insert(data).execute()
+            logger.info(f"Created PDF delivery for job {job_id}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error creating PDF delivery for job {job_id}: {e}")
+            raise
+
+    async def update_pdf_delivery(
+        self,
+        delivery_id: str,
+        status: str,
+        delivery_channel: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Update PDF delivery status.
+
+        Args:
+            delivery_id: Delivery record ID
+            status: New status (pending, delivered, failed)
+            delivery_channel: Channel used (email, webhook, etc)
+            error_message: Error if failed
+
+        Returns:
+            Updated delivery record
+        """
+        if self.mock_mode:
+            return self._store.update_pdf_delivery(delivery_id, status, delivery_channel, error_message)
+
+        data = {"delivery_status": status}
+        if status == "delivered":
+            data["delivered_at"] = datetime.utcnow().isoformat()
+        if delivery_channel:
+            data["delivery_channel"] = delivery_channel
+        if error_message:
+            data["error_message"] = error_message
+
+        try:
+            table = await self._table("pdf_deliveries")
+            result = await table.update(data).eq("id", delivery_id).execute()
+            logger.info(f"Updated PDF delivery {delivery_id} to {status}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error updating PDF delivery {delivery_id}: {e}")
+            raise
+
+    # ========================================================================
+    # API_QUOTA_USAGE TABLE (Daily vendor quota ledger)
+    # ========================================================================
+
+    async def consume_api_quota(
+        self,
+        vendor: str,
+        usage_date: str,
+        amount: int,
+        daily_limit: int
+    ) -> bool:
+        """
+        Atomically charge `amount` requests against a vendor's daily quota.
+
+        Args:
+            vendor: Vendor name (e.g. 'gnews')
+            usage_date: UTC date (YYYY-MM-DD)
+            amount: Requests to charge
+            daily_limit: Vendor's daily request limit
+
+        Returns:
+            True if the requests fit within today's quota
+        """
+        if self.mock_mode:
+            return self._store.consume_api_quota(vendor, usage_date, amount, daily_limit)
+
+        try:
+            client = await self.get_client()
+            result = await client.rpc("consume_api_quota", {
+                "p_vendor": vendor,
+                "p_usage_date": usage_date,
+                "p_amount": amount,
+                "p_limit": daily_limit
+            }).execute()
+            return bool(result.data)
+        except Exception as e:
+            logger.error(f"Error charging {vendor} quota: {e}")
+            raise
+
+    async def exhaust_api_quota(self, vendor: str, usage_date: str, daily_limit: int) -> None:
+        """
+        Record that a vendor's quota is used up for the day.
+
+        Args:
+            vendor: Vendor name
+            usage_date: UTC date (YYYY-MM-DD)
+            daily_limit: Vendor's daily request limit
+        """
+        if self.mock_mode:
+            return self._store.exhaust_api_quota(vendor, usage_date, daily_limit)
+
+        data = {
+            "vendor": vendor,
+            "usage_date": usage_date,
+            "used": daily_limit,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+        try:
+            table = await self._table("api_quota_usage")
+            await table.upsert(data, on_conflict="vendor,usage_date").execute()
+        except Exception as e:
+            logger.error(f"Error marking {vendor} quota exhausted: {e}")
+            raise
+
+    # ========================================================================
+    # EMAIL_OUTBOX TABLE (Durable outbound email queue)
+    # ========================================================================
+
+    async def enqueue_email(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a fully built email to the outbox (see SupabaseClient.enqueue_email).
+
+        Args:
+            data: to_email, subject, html_body, text_body and optional
+                attachment_base64, attachment_filename, delivery_id
+
+        Returns:
+            Created outbox record (status=pending, due immediately)
+        """
+        if self.mock_mode:
+            return self._store.enqueue_email(data)
+
+        now = datetime.utcnow().isoformat()
+        data = {
+            **data,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now
+        }
+        try:
+            table = await self._table("email_outbox")
+            result = await table.insert(data).execute()
+            logger.info(f"Queued email to {data.get('to_email')}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error queueing email to {data.get('to_email')}: {e}")
+            raise
+
+    async def claim_outbox_emails(
+        self,
+        worker_id: str,
+        limit: int = 50,
+        lease_seconds: int = 120
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically lease due outbox emails (see SupabaseClient.claim_outbox_emails).
+
+        Args:
+            worker_id: Identifier of the claiming sender
+            limit: Maximum number of emails to claim
+            lease_seconds: How long the lease is held before others may reclaim
+
+        Returns:
+            List of claimed outbox records (status=sending, attempts incremented)
+        """
+        if self.mock_mode:
+            return self._store.claim_outbox_emails(worker_id, limit, lease_seconds)
+
+        try:
+            client = await self.get_client()
+            result = await client.rpc("claim_email_outbox", {
+                "p_worker_id": worker_id,
+                "p_batch_size": limit,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error claiming outbox emails for {worker_id}: {e}")
+            return []
+
+    async def update_outbox_email(self, email_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update an outbox record (status, schedule, provider result).
+
+        Args:
+            email_id: Outbox record ID
+            changes: Columns to set
+
+        Returns:
+            Updated record, or None if not found
+        """
+        if self.mock_mode:
+            return self._store.update_outbox_email(email_id, changes)
+
+        try:
+            table = await self._table("email_outbox")
+            result = await table.update(changes).eq("id", email_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error updating outbox email {email_id}: {e}")
+            raise
+
+    async def get_outbox_email(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an outbox record by ID.
+
+        Args:
+            email_id: Outbox record ID
+
+        Returns:
+            Outbox record or None
+        """
+        if self.mock_mode:
+            return self._store.get_outbox_email(email_id)
+
+        try:
+            table = await self._table("email_outbox")
+            result = await table.select("*").eq("id", email_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching outbox email {email_id}: {e}")
+            return None
+
+    # ========================================================================
+    # STORAGE (PDF bucket)
+    # ========================================================================
+
+    async def upload_file(
+        self,
+        bucket: str,
+        path: str,
+        content: bytes,
+        content_type: str = "application/pdf"
+    ) -> None:
+        """
+        Upload a file to a Storage bucket.
+
+        Args:
+            bucket: Storage bucket name
+            path: Object path within the bucket
+            content: File bytes
+            content_type: MIME type
+        """
+        client = await self.get_client()
+        await client.storage.from_(bucket).upload(
+            path, content, {"content-type": content_type}
+        )
+
+    async def create_signed_url(self, bucket: str, path: str, expires_in: int) -> Optional[str]:
+        """
+        Create a signed download URL for a Storage object.
+
+        Args:
+            bucket: Storage bucket name
+            path: Object path within the bucket
+            expires_in: URL lifetime in seconds
+
+        Returns:
+            Signed URL, or None if the response carried none
+        """
+        client = await self.get_client()
+        signed = await client.storage.from_(bucket).create_signed_url(path, expires_in)
+        return signed.get("signedURL") or signed.get("signedUrl")
+
+    # ========================================================================
+    # HEALTH CHECK
+    # ========================================================================
+
+    async def health_check(self) -> bool:
+        """
+        Verify Supabase connection is alive.
+
+        Returns:
+            True if connection is healthy
+        """
+        if self.mock_mode:
+            return self._store.health_check()
+
+        try:
+            table = await self._table("finalize_data")
+            result = await table.select("id").limit(1).execute()
+            logger.info(f"Supabase health check passed (rows: {len(result.data) if result.data else 0})")
+            return True
+        except Exception as e:
+            logger.error(f"Supabase health check failed: {type(e).__name__}: {e}")
+            logger.error(f"Health check traceback: {traceback.format_exc()}")
+            return False
+
+    async def check_tables(self, tables: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Probe each table concurrently with a one-row select.
+
+        Returns:
+            Mapping of table name to "ok" or the (truncated) error message
+        """
+        tables = tables or HEALTH_CHECK_TABLES
+        if self.mock_mode:
+            return {table: "ok" for table in tables}
+
+        async def probe(name: str) -> str:
+            try:
+                table = await self._table(name)
+                await table.select("id").limit(1).execute()
+                return "ok"
+            except Exception as e:
+                return str(e)[:200]
+
+        results = await asyncio.gather(*(probe(table) for table in tables))
+        return dict(zip(tables, results))
+
+
+def as_async_client(supabase) -> "AsyncSupabaseClient":
+    """
+    Adapt a data access client for async callers.
+
+    A mock-mode SupabaseClient is wrapped so both views share one in-memory
+    store; a real SupabaseClient is swapped for the process-wide async client.
+    Anything else (already async, or a test double) is returned unchanged.
+    """
+    if isinstance(supabase, SupabaseClient):
+        if supabase.mock_mode:
+            return AsyncSupabaseClient(mock_store=supabase)
+        return get_async_supabase_client()
+    return supabase
+
+
+# Global instance (lazy-loaded in routes, closed in app.main.lifespan)
+_async_supabase_client: Optional[AsyncSupabaseClient] = None
+
+
+def get_async_supabase_client() -> AsyncSupabaseClient:
+    """Get or create the global async Supabase client."""
+    global _async_supabase_client
+    if _async_supabase_client is None:
+        _async_supabase_client = AsyncSupabaseClient()
+    return _async_supabase_client
+
+
+async def close_async_supabase_client() -> None:
+    """Close the global async Supabase client's pooled connections."""
+    global _async_supabase_client
+    if _async_supabase_client is not None:
+        await _async_supabase_client.aclose()
+        _async_supabase_client = None
@@ -0,0 +1,141 @@
+"""
+Per-source circuit breakers for enrichment vendors.
+
+While a vendor is down every call waits out the full HTTP timeout (45-60s)
+before failing. A breaker trips after a run of consecutive failures and
+fails calls immediately while open; after a cool-down it lets a single
+half-open probe through, closing again if the probe succeeds.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open breaker."""
+
+    def __init__(self, source: str, retry_in: float):
+        self.source = source
+        self.retry_in = retry_in
+        super().__init__(f"{source}: circuit open (retry in {retry_in:.0f}s)")
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Args:
+        name: Source the breaker guards
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds to stay open before allowing a probe
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = (
+            reset_timeout if reset_timeout is not None else settings.CIRCUIT_BREAKER_RESET_SECONDS
+        )
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def before_call(self) -> None:
+        """
+        Admit a call or refuse it.
+
+        Raises:
+            CircuitOpenError: Circuit open, or a half-open probe already running
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and not self._probe_in_flight:
+            logger.info(f"[circuit:{self.name}] Half-open, probing")
+            self._probe_in_flight = True
+            return
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info(f"[circuit:{self.name}] Probe succeeded, closing circuit")
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self, error: Any = None) -> None:
+        self.consecutive_failures += 1
+        self.last_error = str(error)[:200] if error is not None else None
+        probe_failed = self._probe_in_flight
+        self._probe_in_flight = False
+        if probe_failed or self.consecutive_failures >= self.failure_threshold:
+            if self.opened_at is None or probe_failed:
+                logger.warning(
+                    f"[circuit:{self.name}] Opening after {self.consecutive_failures} "
+                    f"consecutive failures: {self.last_error}"
+                )
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a call without judging the source's health (e.g. locally rate limited)."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state for status endpoints."""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_in_seconds": (
+                round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 1)
+                if state == OPEN else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+# Global registry (breakers must be shared by every request in the process)
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(source: str) -> CircuitBreaker:
+    """Get or create the breaker for an enrichment source."""
+    breaker = _breakers.get(source)
+    if breaker is None:
+        breaker = _breakers[source] = CircuitBreaker(source)
+    return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every breaker created so far."""
+    return {source: breaker.snapshot() for source, breaker in sorted(_breakers.items())}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breaker state."""
+    _breakers.clear()
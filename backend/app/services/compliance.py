@@ -207,6 +207,29 @@ class ComplianceService:
         logger.info(f"Compliance check: passed={result.passed}, issues={len(result.issues)}")
         return result
 
+    def check_field(self, content: str, content_type: str) -> Tuple[str, List[str]]:
+        """
+        Check one streamed field on its own, before the rest has arrived.
+
+        Only banned terms are removed here; the full check() on the finished
+        content stays authoritative.
+
+        Args:
+            content: Field text
+            content_type: Field name, used in issue descriptions
+
+        Returns:
+            Tuple of (content with banned terms removed, issues found)
+        """
+        issues = self._check_content(content, content_type)
+        corrected = content
+        for issue in issues:
+            if "banned term" in issue:
+                term_match = re.search(r"'([^']+)'", issue)
+                if term_match:
+                    corrected = self._remove_term(corrected, term_match.group(1))
+        return corrected, issues
+
     def _check_content(self, content: str, content_type: str) -> List[str]:
         """
         Check a single piece of content for issues.
@@ -0,0 +1,274 @@
+"""
+Durable outbound email queue for POST /rad/deliver.
+
+The route builds the email, writes it (with the PDF attachment) to
+email_outbox and returns. EmailSender leases due rows in batches via
+AsyncSupabaseClient.claim_outbox_emails, hands each batch to
+EmailService.send_batch, and records the outcome: sent rows drop their
+attachment, failed rows are rescheduled with exponential backoff until
+EMAIL_OUTBOX_MAX_ATTEMPTS, then marked failed. A sender that dies
+mid-batch loses its lease and another one retries the rows.
+
+Runs in-process (started from app.main.lifespan) or standalone:
+    python -m app.services.email_outbox
+"""
+
+import asyncio
+import base64
+import logging
+import math
+import os
+import random
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.async_supabase_client import (
+    AsyncSupabaseClient,
+    as_async_client,
+    close_async_supabase_client,
+    get_async_supabase_client,
+)
+from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+ATTACHMENT_FILENAME = "your-personalized-ebook.pdf"
+
+
+def backoff_seconds(attempts: int) -> float:
+    """
+    Delay before the next attempt after `attempts` failures.
+
+    Doubles from EMAIL_OUTBOX_BACKOFF_SECONDS up to the configured cap, with
+    up to 20% jitter so a provider outage does not release every queued
+    email in the same second once it recovers.
+    """
+    delay = min(
+        settings.EMAIL_OUTBOX_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0)),
+        settings.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS
+    )
+    return delay * random.uniform(0.8, 1.0)
+
+
+async def enqueue_ebook_email(
+    supabase: AsyncSupabaseClient,
+    email_service: EmailService,
+    to_email: str,
+    pdf_bytes: bytes,
+    profile: Dict[str, Any],
+    intro_hook: str,
+    cta: str,
+    delivery_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the ebook email and persist it to the outbox.
+
+    Args:
+        supabase: Async Supabase client
+        email_service: Builds the message content
+        to_email: Recipient email address
+        pdf_bytes: Rendered PDF to attach
+        profile: User profile data for personalization
+        intro_hook: Personalized intro hook
+        cta: Personalized CTA
+        delivery_id: pdf_deliveries record to update once the send settles
+
+    Returns:
+        Created outbox record
+    """
+    message = email_service.build_ebook_email(to_email, profile, intro_hook, cta)
+    return await as_async_client(supabase).enqueue_email({
+        **message,
+        "attachment_base64": base64.b64encode(pdf_bytes).decode(),
+        "attachment_filename": ATTACHMENT_FILENAME,
+        "delivery_id": delivery_id
+    })
+
+
+class EmailSender:
+    """
+    Background sender that drains the email outbox in batches.
+    One batch is in flight at a time; EmailService.send_batch handles
+    per-provider connection reuse within it.
+    """
+
+    def __init__(
+        self,
+        supabase: AsyncSupabaseClient,
+        email_service: Optional[EmailService] = None,
+        batch_size: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        worker_id: Optional[str] = None
+    ):
+        self.supabase = as_async_client(supabase)
+        self.email_service = email_service or EmailService()
+        self.batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.lease_seconds = lease_seconds or settings.EMAIL_OUTBOX_LEASE_SECONDS
+        self.poll_interval = poll_interval or settings.EMAIL_OUTBOX_POLL_SECONDS
+        self.max_attempts = max_attempts or settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def run_once(self) -> int:
+        """
+        Claim one batch of due emails, send it, and record each outcome.
+
+        Returns:
+            Number of emails claimed
+        """
+        rows = await self.supabase.claim_outbox_emails(
+            self.worker_id, limit=self.batch_size, lease_seconds=self.batch_lease_seconds()
+        )
+        if not rows:
+            return 0
+
+        messages = [
+            {
+                "to_email": row["to_email"],
+                "subject": row["subject"],
+                "html_body": row["html_body"],
+                "text_body": row["text_body"],
+                "pdf_bytes": base64.b64decode(row.get("attachment_base64") or ""),
+            }
+            for row in rows
+        ]
+        results = await self.email_service.send_batch(messages)
+
+        await asyncio.gather(*(
+            self._record_result(row, result) for row, result in zip(rows, results)
+        ))
+        sent = sum(1 for result in results if result.get("success"))
+        logger.info(f"Email sender {self.worker_id}: {sent}/{len(rows)} sent")
+        return len(rows)
+
+    def batch_lease_seconds(self) -> int:
+        """
+        Lease long enough for a full batch to finish, so a slow batch is never
+        reclaimed (and sent twice) by another sender while still in flight.
+        EMAIL_OUTBOX_LEASE_SECONDS is the floor, plus the same again as margin
+        for recording outcomes.
+        """
+        worst_case = self.email_service.max_batch_seconds(self.batch_size)
+        return math.ceil(max(self.lease_seconds, worst_case + self.lease_seconds))
+
+    async def _record_result(self, row: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Mark one email sent, reschedule it, or give up on it."""
+        email_id = row["id"]
+        try:
+            if result.get("success"):
+                await self.supabase.update_outbox_email(email_id, {
+                    "status": "sent",
+                    "provider": result.get("provider"),
+                    "message_id": result.get("message_id"),
+                    "sent_at": datetime.utcnow().isoformat(),
+                    "attachment_base64": None,
+                    "leased_by": None,
+                    "lease_expires_at": None
+                })
+                await self._update_delivery(row, "delivered")
+                return
+
+            error = str(result.get("error", "Unknown error"))[:500]
+            attempts = row.get("attempts", 1)
+            if attempts >= self.max_attempts:
+                logger.warning(f"Giving up on email {email_id} to {row['to_email']} after {attempts} attempts")
+                await self.supabase.update_outbox_email(email_id, {
+                    "status": "failed",
+                    "last_error": error,
+                    "leased_by": None,
+                    "lease_expires_at": None
+                })
+                await self._update_delivery(row, "failed", error)
+                return
+
+            delay = backoff_seconds(attempts)
+            logger.info(f"Email {email_id} attempt {attempts} failed, retrying in {delay:.0f}s: {error}")
+            await self.supabase.update_outbox_email(email_id, {
+                "status": "pending",
+                "last_error": error,
+                "next_attempt_at": (datetime.utcnow() + timedelta(seconds=delay)).isoformat(),
+                "leased_by": None,
+                "lease_expires_at": None
+            })
+        except Exception as e:
+            # Lease expiry will hand the row to another attempt
+            logger.error(f"Failed to record outcome for email {email_id}: {e}")
+
+    async def _update_delivery(self, row: Dict[str, Any], status: str, error: Optional[str] = None) -> None:
+        """Mirror the final outcome onto the pdf_deliveries record, if any."""
+        if not row.get("delivery_id"):
+            return
+        try:
+            await self.supabase.update_pdf_delivery(
+                row["delivery_id"], status, delivery_channel="email", error_message=error
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update PDF delivery {row['delivery_id']}: {e}")
+
+    async def _loop(self) -> None:
+        """Drain full batches back to back; sleep when the outbox is idle."""
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Email sender {self.worker_id} loop error: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Start the sender loop as a background task on the running loop."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Email sender {self.worker_id} started ({self.email_service.provider})")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop claiming new batches and wait briefly for the one in flight.
+        A batch cut off after `timeout` is retried once its lease expires.
+        """
+        self._stopping.set()
+        if self._task is None:
+            return
+        _, pending = await asyncio.wait([self._task], timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._task = None
+        logger.info(f"Email sender {self.worker_id} stopped")
+
+
+async def _run_standalone() -> None:
+    """Run a sender process until interrupted."""
+    from app.services.smtp_pool import init_smtp_pool, close_smtp_pool
+
+    settings.validate()
+    init_smtp_pool()
+    sender = EmailSender(get_async_supabase_client())
+    sender.start()
+    try:
+        await sender._task
+    finally:
+        await sender.stop()
+        await close_async_supabase_client()
+        await close_smtp_pool()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    try:
+        asyncio.run(_run_standalone())
+    except KeyboardInterrupt:
+        pass
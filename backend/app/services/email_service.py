@@ -4,21 +4,31 @@ Supports multiple providers: SMTP, SendGrid, Resend.
 Falls back gracefully if email delivery fails.
 """
 
+import asyncio
 import logging
+import math
 import os
 import smtplib
+from contextlib import asynccontextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
 
 import httpx
 
 from app.config import settings
+from app.services.smtp_pool import get_smtp_pool
 
 logger = logging.getLogger(__name__)
 
+# Concurrent provider API calls per send_batch (over one shared HTTP client)
+BATCH_HTTP_CONCURRENCY = 10
+
+# Per-request timeout for the SendGrid/Resend APIs
+HTTP_TIMEOUT_SECONDS = 30.0
+
 
 class EmailService:
     """
@@ -70,21 +80,106 @@ class EmailService:
         Returns:
             Dict with success status, message_id, provider
         """
+        message = self.build_ebook_email(to_email, profile, intro_hook, cta)
+        return await self._deliver(message, pdf_bytes)
+
+    def build_ebook_email(
+        self,
+        to_email: str,
+        profile: Dict[str, Any],
+        intro_hook: str,
+        cta: str
+    ) -> Dict[str, str]:
+        """
+        Build the ebook email content (everything but the attachment).
+
+        Args:
+            to_email: Recipient email address
+            profile: User profile data for personalization
+            intro_hook: Personalized intro hook
+            cta: Personalized CTA
+
+        Returns:
+            Dict with to_email, subject, html_body, text_body
+        """
         first_name = profile.get("first_name", "there")
         company = profile.get("company_name", "your company")
 
-        subject = f"{first_name}, your personalized ebook is ready!"
-        html_body = self._build_email_html(first_name, company, intro_hook, cta)
-        text_body = self._build_email_text(first_name, company, intro_hook, cta)
+        return {
+            "to_email": to_email,
+            "subject": f"{first_name}, your personalized ebook is ready!",
+            "html_body": self._build_email_html(first_name, company, intro_hook, cta),
+            "text_body": self._build_email_text(first_name, company, intro_hook, cta),
+        }
+
+    async def send_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several prebuilt emails, reusing one provider connection.
+
+        HTTP providers share a single keep-alive client for the whole batch;
+        SMTP sends go through the pooled sessions. Each email still gets its
+        own result, so one bad address does not fail the rest.
+
+        Args:
+            messages: Dicts from build_ebook_email plus pdf_bytes
+
+        Returns:
+            One send_ebook-style result dict per message, in order
+        """
+        if self.provider in ("sendgrid", "resend"):
+            limit = asyncio.Semaphore(BATCH_HTTP_CONCURRENCY)
+            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SECONDS) as client:
+                async def send_one(message: Dict[str, Any]) -> Dict[str, Any]:
+                    async with limit:
+                        return await self._deliver(message, message["pdf_bytes"], client)
+                return list(await asyncio.gather(*(send_one(m) for m in messages)))
+
+        return list(await asyncio.gather(*(self._deliver(m, m["pdf_bytes"]) for m in messages)))
+
+    def max_batch_seconds(self, count: int) -> float:
+        """
+        Upper bound on how long send_batch can take for `count` emails.
+
+        Sends run `concurrency` at a time and each can use its full timeout;
+        an SMTP send may also need a fresh handshake and one reconnect, so it
+        is budgeted at two timeouts.
+
+        Args:
+            count: Number of emails in the batch
+
+        Returns:
+            Worst-case duration in seconds (0 for the mock provider)
+        """
+        if self.provider in ("sendgrid", "resend"):
+            per_send, concurrency = HTTP_TIMEOUT_SECONDS, BATCH_HTTP_CONCURRENCY
+        elif self.provider == "smtp":
+            pool = get_smtp_pool()
+            per_send = 2 * settings.SMTP_TIMEOUT_SECONDS
+            concurrency = pool.size if pool is not None else settings.SMTP_POOL_SIZE
+        else:
+            return 0.0
+        return math.ceil(count / max(concurrency, 1)) * per_send
+
+    async def _deliver(
+        self,
+        message: Dict[str, Any],
+        pdf_bytes: bytes,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
+        """Send one built email through the configured provider; never raises."""
+        to_email = message["to_email"]
+        subject = message["subject"]
+        html_body = message["html_body"]
+        text_body = message["text_body"]
 
         try:
             if self.provider == "sendgrid":
                 result = await self._send_via_sendgrid(
-                    to_email, subject, html_body, text_body, pdf_bytes
+                    to_email, subject, html_body, text_body, pdf_bytes, client
                 )
             elif self.provider == "resend":
                 result = await self._send_via_resend(
-                    to_email, subject, html_body, pdf_bytes
+                    to_email, subject, html_body, pdf_bytes, client
                 )
             elif self.provider == "smtp":
                 result = await self._send_via_smtp(
@@ -105,6 +200,15 @@ class EmailService:
                 "timestamp": datetime.utcnow().isoformat()
             }
 
+    @asynccontextmanager
+    async def _http_client(self, client: Optional[httpx.AsyncClient]) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the caller's shared client, or a short-lived one for a single send."""
+        if client is not None:
+            yield client
+            return
+        async with httpx.AsyncClient() as own_client:
+            yield own_client
+
     def _build_email_html(
         self,
         first_name: str,
@@ -183,15 +287,16 @@ This email was sent because you requested a personalized ebook.
         subject: str,
         html_body: str,
         text_body: str,
-        pdf_bytes: bytes
+        pdf_bytes: bytes,
+        client: Optional[httpx.AsyncClient] = None
     ) -> Dict[str, Any]:
         """Send email via SendGrid API."""
         import base64
 
         api_key = os.getenv("SENDGRID_API_KEY")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        async with self._http_client(client) as http:
+            response = await http.post(
                 "https://api.sendgrid.com/v3/mail/send",
                 headers={
                     "Authorization": f"Bearer {api_key}",
@@ -212,7 +317,7 @@ This email was sent because you requested a personalized ebook.
                         "disposition": "attachment"
                     }]
                 },
-                timeout=30.0
+                timeout=HTTP_TIMEOUT_SECONDS
             )
 
         if response.status_code in (200, 202):
@@ -230,15 +335,16 @@ This email was sent because you requested a personalized ebook.
         to_email: str,
         subject: str,
         html_body: str,
-        pdf_bytes: bytes
+        pdf_bytes: bytes,
+        client: Optional[httpx.AsyncClient] = None
     ) -> Dict[str, Any]:
         """Send email via Resend API."""
         import base64
 
         api_key = os.getenv("RESEND_API_KEY")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        async with self._http_client(client) as http:
+            response = await http.post(
                 "https://api.resend.com/emails",
                 headers={
                     "Authorization": f"Bearer {api_key}",
@@ -254,7 +360,7 @@ This email was sent because you requested a personalized ebook.
                         "filename": "your-personalized-ebook.pdf"
                     }]
                 },
-                timeout=30.0
+                timeout=HTTP_TIMEOUT_SECONDS
             )
 
         if response.status_code == 200:
@@ -268,21 +374,15 @@ This email was sent because you requested a personalized ebook.
         else:
             raise Exception(f"Resend API error: {response.status_code} - {response.text}")
 
-    async def _send_via_smtp(
+    def _build_smtp_message(
         self,
         to_email: str,
         subject: str,
         html_body: str,
         text_body: str,
         pdf_bytes: bytes
-    ) -> Dict[str, Any]:
-        """Send email via SMTP."""
-        smtp_host = os.getenv("SMTP_HOST")
-        smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        smtp_user = os.getenv("SMTP_USER", "")
-        smtp_pass = os.getenv("SMTP_PASS", "")
-        use_tls = os.getenv("SMTP_TLS", "true").lower() == "true"
-
+    ) -> MIMEMultipart:
+        """Build the multipart/mixed message (text + html + PDF attachment) for SMTP."""
         msg = MIMEMultipart("mixed")
         msg["From"] = f"{self.from_name} <{self.from_email}>"
         msg["To"] = to_email
@@ -302,14 +402,30 @@ This email was sent because you requested a personalized ebook.
             filename="your-personalized-ebook.pdf"
         )
         msg.attach(pdf_attachment)
+        return msg
 
-        # Send via SMTP
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            if use_tls:
-                server.starttls()
-            if smtp_user and smtp_pass:
-                server.login(smtp_user, smtp_pass)
-            server.send_message(msg)
+    async def _send_via_smtp(
+        self,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: str,
+        pdf_bytes: bytes
+    ) -> Dict[str, Any]:
+        """
+        Send email via SMTP.
+
+        Uses the shared connection pool when the app lifespan created one;
+        otherwise (scripts, tests) opens a one-off session in a worker thread.
+        Either way the event loop is never blocked on the SMTP server.
+        """
+        msg = self._build_smtp_message(to_email, subject, html_body, text_body, pdf_bytes)
+
+        pool = get_smtp_pool()
+        if pool is not None:
+            await pool.send(msg)
+        else:
+            await asyncio.to_thread(self._send_smtp_once, msg)
 
         return {
             "success": True,
@@ -318,6 +434,21 @@ This email was sent because you requested a personalized ebook.
             "timestamp": datetime.utcnow().isoformat()
         }
 
+    def _send_smtp_once(self, msg: MIMEMultipart) -> None:
+        """Send one message on a short-lived SMTP session (blocking; run in a thread)."""
+        smtp_host = os.getenv("SMTP_HOST")
+        smtp_port = int(os.getenv("SMTP_PORT", "587"))
+        smtp_user = os.getenv("SMTP_USER", "")
+        smtp_pass = os.getenv("SMTP_PASS", "")
+        use_tls = os.getenv("SMTP_TLS", "true").lower() == "true"
+
+        with smtplib.SMTP(smtp_host, smtp_port, timeout=settings.SMTP_TIMEOUT_SECONDS) as server:
+            if use_tls:
+                server.starttls()
+            if smtp_user and smtp_pass:
+                server.login(smtp_user, smtp_pass)
+            server.send_message(msg)
+
     def _send_mock(self, to_email: str, subject: str) -> Dict[str, Any]:
         """Mock email send for testing."""
         logger.info(f"[MOCK] Would send email to {to_email}: {subject}")
@@ -1,6 +1,7 @@
 """
 Enrichment API integrations for RAD pipeline.
 Real implementations for: Apollo, PDL, Hunter, Tavily, ZoomInfo.
+HTTP connections come from the shared vendor pool in http_pool.
 All API keys loaded from environment variables.
 """
 
@@ -14,6 +15,8 @@ import httpx
 from abc import ABC, abstractmethod
 
 from app.config import settings
+from app.services.http_pool import pooled_client
+from app.services.rate_limiter import VendorLimitError, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,9 @@ DEFAULT_TIMEOUT = 45.0
 # Extended timeout for deep enrichment queries
 DEEP_ENRICHMENT_TIMEOUT = 60.0
 
+# Timeout for the free Google News RSS fallback
+RSS_TIMEOUT = 30.0
+
 
 # ============================================================================
 # Module-level news analysis functions (shared by GNewsAPI and RSS fetcher)
@@ -94,6 +100,19 @@ class BaseEnrichmentAPI(ABC):
         """Enrich data for given email/domain."""
         pass
 
+    async def _acquire_rate_limit(self, cost: int = 1) -> None:
+        """
+        Take rate-limit tokens (and daily quota) before calling the vendor.
+
+        Raises:
+            EnrichmentAPIError: With status 429 when the call is refused
+        """
+        try:
+            await get_rate_limiter().acquire(self.source_name, cost)
+        except VendorLimitError as e:
+            logger.warning(f"Skipping {self.source_name} call: {e}")
+            raise EnrichmentAPIError(self.source_name, str(e), status_code=429) from e
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle API error response."""
         if response.status_code >= 400:
@@ -132,10 +151,13 @@ class ApolloAPI(BaseEnrichmentAPI):
         if not self.api_key:
             return self._mock_response(email, domain)
 
+        await self._acquire_rate_limit()
+
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with pooled_client(self.source_name, DEFAULT_TIMEOUT) as client:
                 response = await client.post(
                     f"{self.base_url}/people/match",
+                    timeout=DEFAULT_TIMEOUT,
                     headers={
                         "Content-Type": "application/json",
                         "X-Api-Key": self.api_key
@@ -244,10 +266,13 @@ class PDLAPI(BaseEnrichmentAPI):
         if not self.api_key:
             return self._mock_response(email, domain)
 
+        await self._acquire_rate_limit()
+
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with pooled_client(self.source_name, DEFAULT_TIMEOUT) as client:
                 response = await client.get(
                     f"{self.base_url}/person/enrich",
+                    timeout=DEFAULT_TIMEOUT,
                     headers={"X-Api-Key": self.api_key},
                     params={"email": email}
                 )
@@ -312,10 +337,13 @@ class PDLAPI(BaseEnrichmentAPI):
         if not self.api_key:
             return self._mock_company_response(domain)
 
+        await self._acquire_rate_limit()
+
         try:
-            async with httpx.AsyncClient(timeout=DEEP_ENRICHMENT_TIMEOUT) as client:
+            async with pooled_client(self.source_name, DEEP_ENRICHMENT_TIMEOUT) as client:
                 response = await client.get(
                     f"{self.base_url}/company/enrich",
+                    timeout=DEEP_ENRICHMENT_TIMEOUT,
                     headers={"X-Api-Key": self.api_key},
                     params={"website": domain}
                 )
@@ -413,10 +441,13 @@ class HunterAPI(BaseEnrichmentAPI):
         if not self.api_key:
             return self._mock_response(email, domain)
 
+        await self._acquire_rate_limit()
+
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with pooled_client(self.source_name, DEFAULT_TIMEOUT) as client:
                 response = await client.get(
                     f"{self.base_url}/email-verifier",
+                    timeout=DEFAULT_TIMEOUT,
                     params={
                         "email": email,
                         "api_key": self.api_key
@@ -534,6 +565,7 @@ class GNewsAPI(BaseEnrichmentAPI):
                 "fetched_at": datetime.utcnow().isoformat(),
                 "_query_stats": getattr(self, "_last_query_stats", {}),
                 "_quota_exhausted": getattr(self, "_last_quota_exhausted", False),
+                "_rate_limited": getattr(self, "_last_rate_limited", False),
             }
 
             return result
@@ -564,8 +596,20 @@ class GNewsAPI(BaseEnrichmentAPI):
 
         self._last_query_stats = {"total": len(search_queries), "succeeded": 0, "failed": 0}
         self._last_quota_exhausted = False
+        self._last_rate_limited = False
 
-        async with httpx.AsyncClient(timeout=DEEP_ENRICHMENT_TIMEOUT) as client:
+        # Skip the round-trip when the shared daily quota is already spent;
+        # callers see result_count=0 / _quota_exhausted and fall back to RSS
+        try:
+            await get_rate_limiter().acquire(self.source_name, cost=len(search_queries))
+        except VendorLimitError as e:
+            logger.warning(f"Skipping GNews queries for {company_name}: {e}")
+            self._last_quota_exhausted = e.quota_exhausted
+            self._last_rate_limited = not e.quota_exhausted
+            self._last_query_stats["failed"] = len(search_queries)
+            return []
+
+        async with pooled_client(self.source_name, DEEP_ENRICHMENT_TIMEOUT) as client:
             tasks = []
             for query in search_queries:
                 tasks.append(
@@ -577,7 +621,8 @@ class GNewsAPI(BaseEnrichmentAPI):
                             "lang": "en",
                             "max": 5,
                             "sortby": "relevance"
-                        }
+                        },
+                        timeout=DEEP_ENRICHMENT_TIMEOUT,
                     )
                 )
 
@@ -622,7 +667,11 @@ class GNewsAPI(BaseEnrichmentAPI):
                     self._last_query_stats["failed"] += 1
                     logger.warning(f"Failed to parse GNews response {i}: {e}")
 
-            return all_articles
+        if self._last_quota_exhausted:
+            # Tell the other workers too, so nobody pays for another 403 today
+            await get_rate_limiter().mark_exhausted(self.source_name)
+
+        return all_articles
 
     def _get_query_category(self, query_index: int) -> str:
         """Map query index to category name."""
@@ -738,6 +787,7 @@ class GNewsAPI(BaseEnrichmentAPI):
                 "fetched_at": datetime.utcnow().isoformat(),
                 "_query_stats": getattr(self, "_last_query_stats", {}),
                 "_quota_exhausted": getattr(self, "_last_quota_exhausted", False),
+                "_rate_limited": getattr(self, "_last_rate_limited", False),
             }
 
         except httpx.TimeoutException:
@@ -816,11 +866,14 @@ class ZoomInfoAPI(BaseEnrichmentAPI):
 
         domain = domain or email.split("@")[1]
 
+        await self._acquire_rate_limit()
+
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
+            async with pooled_client(self.source_name, DEFAULT_TIMEOUT) as client:
                 # ZoomInfo requires OAuth token, simplified here
                 response = await client.post(
                     f"{self.base_url}/search/company",
+                    timeout=DEFAULT_TIMEOUT,
                     headers={
                         "Authorization": f"Bearer {self.api_key}",
                         "Content-Type": "application/json"
@@ -909,8 +962,8 @@ class GoogleNewsRSSFetcher:
         url = f"{self.RSS_URL}?q={query}&hl=en-US&gl=US&ceid=US:en"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
+            async with pooled_client("google_news_rss", RSS_TIMEOUT) as client:
+                response = await client.get(url, timeout=RSS_TIMEOUT)
 
                 if response.status_code != 200:
                     logger.warning(
@@ -999,6 +1052,8 @@ class GoogleNewsRSSFetcher:
 def get_enrichment_apis() -> Dict[str, BaseEnrichmentAPI]:
     """
     Get all configured enrichment API clients.
+    Clients are cheap to build; their connections come from the shared
+    HTTPClientPool created in app.main.lifespan.
 
     Returns:
         Dict mapping source name to API client
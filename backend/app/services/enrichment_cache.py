@@ -0,0 +1,190 @@
+"""
+Per-source enrichment cache for RADOrchestrator.
+
+Two tiers:
+  - in-process LRU shared by every request in this worker
+  - Supabase rows, so the cache survives restarts and is shared across workers
+
+Person sources (Apollo, PDL person, Hunter) are keyed by email and read back
+from the raw_data rows RADOrchestrator.enrich already writes. Company sources
+(PDL Company, ZoomInfo) are keyed by domain and stored in domain_cache, so the
+second employee from a company costs zero company-API calls.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.services.async_supabase_client import AsyncSupabaseClient, as_async_client
+
+logger = logging.getLogger(__name__)
+
+PERSON_SCOPE = "person"
+COMPANY_SCOPE = "company"
+
+# Cache scope and TTL per source. Sources not listed here are never cached.
+SOURCE_CACHE_CONFIG = {
+    "apollo": {"scope": PERSON_SCOPE, "ttl_hours": settings.ENRICHMENT_CACHE_PERSON_TTL_HOURS},
+    "pdl": {"scope": PERSON_SCOPE, "ttl_hours": settings.ENRICHMENT_CACHE_PERSON_TTL_HOURS},
+    "hunter": {"scope": PERSON_SCOPE, "ttl_hours": settings.ENRICHMENT_CACHE_PERSON_TTL_HOURS},
+    "zoominfo": {"scope": COMPANY_SCOPE, "ttl_hours": settings.ENRICHMENT_CACHE_COMPANY_TTL_HOURS},
+    "pdl_company": {"scope": COMPANY_SCOPE, "ttl_hours": settings.ENRICHMENT_CACHE_COMPANY_TTL_HOURS},
+}
+
+
+def is_cacheable(payload: Optional[Dict[str, Any]]) -> bool:
+    """Only real vendor responses are cached; errors and mock data are not."""
+    return bool(payload) and not payload.get("_error") and not payload.get("_mock")
+
+
+def _parse_utc(value: Any) -> Optional[datetime]:
+    """Naive UTC datetime from a stored ISO timestamp (None if unparseable)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def remaining_ttl_seconds(record: Dict[str, Any], ttl_hours: float) -> float:
+    """
+    Seconds a persisted cache row has left, from its fetched_at and (for
+    domain_cache rows) expires_at. Rows without usable timestamps get the
+    full TTL.
+    """
+    now = datetime.utcnow()
+    remaining = ttl_hours * 3600
+    fetched_at = _parse_utc(record.get("fetched_at"))
+    if fetched_at is not None:
+        remaining = min(remaining, ttl_hours * 3600 - (now - fetched_at).total_seconds())
+    expires_at = _parse_utc(record.get("expires_at"))
+    if expires_at is not None:
+        remaining = min(remaining, (expires_at - now).total_seconds())
+    return max(remaining, 0.0)
+
+
+class MemoryLRU:
+    """Small in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any], ttl_seconds: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide memory tier (shared across orchestrator instances)
+_memory_tier = MemoryLRU(settings.ENRICHMENT_CACHE_MEMORY_ENTRIES)
+
+
+def get_memory_tier() -> MemoryLRU:
+    """Get the process-wide memory tier (tests clear it between cases)."""
+    return _memory_tier
+
+
+class EnrichmentCache:
+    """
+    Cache lookups for one orchestrator run.
+
+    Args:
+        supabase: Supabase client backing the persistent tier (sync clients
+            are adapted to the async one)
+        memory: Memory tier (defaults to the process-wide LRU)
+    """
+
+    def __init__(self, supabase: AsyncSupabaseClient, memory: Optional[MemoryLRU] = None):
+        self.supabase = as_async_client(supabase)
+        self.memory = memory or _memory_tier
+        self.enabled = settings.ENRICHMENT_CACHE_ENABLED
+
+    @staticmethod
+    def cache_key(source: str, email: str, domain: str) -> Optional[str]:
+        """Email for person sources, domain for company sources."""
+        config = SOURCE_CACHE_CONFIG.get(source)
+        if not config:
+            return None
+        return email if config["scope"] == PERSON_SCOPE else domain
+
+    async def get(self, source: str, email: str, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response for a source.
+
+        Returns:
+            Cached payload, or None on miss / expired / uncached source
+        """
+        key = self.cache_key(source, email, domain)
+        if not self.enabled or key is None:
+            return None
+
+        memory_key = f"{source}:{key}"
+        payload = self.memory.get(memory_key)
+        if payload is not None:
+            logger.info(f"Enrichment cache HIT (memory) for {source}:{key}")
+            return payload
+
+        config = SOURCE_CACHE_CONFIG[source]
+        ttl_hours = config["ttl_hours"]
+        try:
+            if config["scope"] == PERSON_SCOPE:
+                record = await self.supabase.get_latest_raw_data(key, source, ttl_hours)
+            else:
+                record = await self.supabase.get_domain_cache(key, source, ttl_hours)
+        except Exception as e:
+            logger.warning(f"Enrichment cache lookup failed for {source}:{key}: {e}")
+            return None
+
+        payload = record.get("payload") if record else None
+        if not is_cacheable(payload):
+            return None
+
+        # Promote for what is left of the row's lifetime, not a fresh TTL
+        self.memory.put(memory_key, payload, remaining_ttl_seconds(record, ttl_hours))
+        logger.info(f"Enrichment cache HIT (supabase) for {source}:{key}")
+        return payload
+
+    async def put(self, source: str, email: str, domain: str, payload: Dict[str, Any]) -> None:
+        """
+        Cache a fresh vendor response.
+
+        Person payloads go to memory only here; their Supabase copy is the
+        raw_data row written by RADOrchestrator.enrich.
+        """
+        key = self.cache_key(source, email, domain)
+        if not self.enabled or key is None or not is_cacheable(payload):
+            return
+
+        config = SOURCE_CACHE_CONFIG[source]
+        self.memory.put(f"{source}:{key}", payload, config["ttl_hours"] * 3600)
+
+        if config["scope"] == COMPANY_SCOPE:
+            try:
+                await self.supabase.store_domain_cache(key, source, payload, config["ttl_hours"])
+            except Exception as e:
+                logger.warning(f"Failed to cache {source} for {key}: {e}")
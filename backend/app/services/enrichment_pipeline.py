@@ -0,0 +1,261 @@
+"""
+Enrichment pipeline: enrichment + LLM personalization + compliance for one email.
+Shared by the synchronous /rad/enrich route and the background job worker.
+"""
+
+import asyncio
+import logging
+import traceback
+from datetime import datetime
+from typing import Optional
+
+from app.models.schemas import EnrichmentRequest, EnrichmentResponse
+from app.services.async_supabase_client import AsyncSupabaseClient
+from app.services.rad_orchestrator import RADOrchestrator
+from app.services.llm_service import LLMService
+from app.services.compliance import ComplianceService
+from app.services.context_inference_service import infer_context
+from app.services.news_analysis_service import analyze_news
+from app.services.progress import ProgressCallback, emit
+
+logger = logging.getLogger(__name__)
+
+
+async def _generate_ebook_content(
+    llm_service: LLMService,
+    compliance_service: ComplianceService,
+    finalized: dict,
+    user_context: dict,
+    company_news: str,
+    job_id: str,
+    progress: Optional[ProgressCallback] = None,
+    use_cache: bool = True
+) -> dict:
+    """Generate the 3-section ebook personalization and apply compliance corrections."""
+    # Stream each section to the client as soon as the model finishes it
+    def report_field(field: str, value: str) -> None:
+        corrected, issues = compliance_service.check_field(value, field)
+        if issues:
+            logger.info(f"[{job_id}] Streamed {field} flagged: {issues}")
+        emit(progress, "llm_section", {
+            "section": "ebook_personalization", "field": field, "content": corrected
+        })
+
+    on_field = report_field if progress is not None else None
+
+    ebook_personalization = await llm_service.generate_ebook_personalization(
+        profile=finalized,
+        user_context=user_context,
+        company_news=company_news,
+        on_field=on_field,
+        use_cache=use_cache
+    )
+
+    ebook_hook = ebook_personalization.get("personalized_hook", "")
+    ebook_cta = ebook_personalization.get("personalized_cta", "")
+    ebook_compliance = compliance_service.check(ebook_hook, ebook_cta, auto_correct=True)
+    if not ebook_compliance.passed and ebook_compliance.corrected_intro:
+        ebook_personalization["personalized_hook"] = ebook_compliance.corrected_intro
+        ebook_personalization["personalized_cta"] = ebook_compliance.corrected_cta
+        logger.info(f"[{job_id}] Using compliance-corrected ebook content")
+
+    emit(progress, "llm_section", {"section": "ebook_personalization", "content": ebook_personalization})
+    return ebook_personalization
+
+
+async def _generate_legacy_content(
+    llm_service: LLMService,
+    compliance_service: ComplianceService,
+    finalized: dict,
+    user_context: dict,
+    job_id: str,
+    progress: Optional[ProgressCallback] = None,
+    use_cache: bool = True
+) -> tuple:
+    """Generate the legacy intro hook + CTA and apply compliance corrections."""
+    use_opus = llm_service.should_use_opus(finalized)
+    personalization = await llm_service.generate_personalization(
+        finalized,
+        use_opus=use_opus,
+        user_context=user_context,
+        use_cache=use_cache
+    )
+
+    intro_hook = personalization.get("intro_hook", "")
+    cta = personalization.get("cta", "")
+
+    compliance_result = compliance_service.check(intro_hook, cta, auto_correct=True)
+    if not compliance_result.passed and compliance_result.corrected_intro:
+        intro_hook = compliance_result.corrected_intro
+        cta = compliance_result.corrected_cta
+        logger.info(f"[{job_id}] Using compliance-corrected content")
+    elif not compliance_result.passed:
+        intro_hook = compliance_service.get_safe_intro(finalized)
+        cta = compliance_service.get_safe_cta(finalized)
+        logger.warning(f"[{job_id}] Compliance failed, using fallback content")
+
+    emit(progress, "llm_section", {"section": "intro", "intro_hook": intro_hook, "cta": cta})
+    return intro_hook, cta
+
+
+async def run_enrichment_pipeline(
+    request: EnrichmentRequest,
+    supabase: AsyncSupabaseClient,
+    job_id: str,
+    budget_seconds: Optional[float] = None,
+    progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Run the full /rad/enrich pipeline and persist the result to finalize_data.
+
+    Args:
+        request: EnrichmentRequest with email and user-provided context
+        supabase: Supabase client
+        job_id: Job identifier used for log correlation
+        budget_seconds: Enrichment latency budget (None = wait for every
+            source, as the background worker does)
+        progress: Optional callback for streaming progress events
+
+    Returns:
+        Response dict (EnrichmentResponse fields plus enrichment/personalization extras)
+    """
+    email = request.email.lower().strip()
+    domain = request.domain or email.split("@")[1]
+
+    # Create services
+    orchestrator = RADOrchestrator(supabase, progress=progress)
+    llm_service = LLMService()
+    compliance_service = ComplianceService()
+
+    # Run enrichment (sync in alpha, could be async/queued later)
+    # Pass user-provided company so it's used for GNews search and company resolution
+    finalized = await orchestrator.enrich(
+        email, domain, user_company=request.company, budget_seconds=budget_seconds,
+        use_cache=not request.force_refresh
+    )
+
+    # Log which data sources returned real vs mock data
+    logger.info(f"[{job_id}] Data sources used: {orchestrator.data_sources}")
+    logger.info(f"[{job_id}] Quality score: {finalized.get('data_quality_score', 0)}")
+
+    # Run news analysis on enriched articles
+    news_articles = finalized.get("recent_news", []) or []
+    news_analysis = analyze_news(news_articles)
+    finalized["news_analysis"] = {
+        "sentiment": news_analysis["sentiment"]["overall"],
+        "sentiment_detail": news_analysis["sentiment"],
+        "ai_readiness": news_analysis["ai_readiness"]["stage"],
+        "ai_readiness_detail": news_analysis["ai_readiness"],
+        "crisis": news_analysis["crisis"],
+        "entities": news_analysis["entities"],
+    }
+    emit(progress, "news_analysis", finalized["news_analysis"])
+
+    if news_analysis["crisis"]["is_crisis"]:
+        logger.warning(
+            f"[{job_id}] Crisis detected for {email}: "
+            f"{news_analysis['crisis']['type']} - {news_analysis['crisis']['details']}"
+        )
+        finalized["tone_guidance"] = "empathetic"
+
+    # Override enriched data with user-provided info (when available)
+    if request.firstName:
+        finalized["first_name"] = request.firstName
+    if request.lastName:
+        finalized["last_name"] = request.lastName
+    if request.company:
+        finalized["company_name"] = request.company
+    if request.companySize:
+        finalized["company_size"] = request.companySize
+    if request.industry:
+        finalized["industry"] = request.industry
+    if request.persona:
+        finalized["title"] = request.persona
+
+    # Run context inference to fill gaps
+    inferred = infer_context(finalized, user_goal=request.goal)
+    emit(progress, "context", inferred)
+
+    # Build user context from enriched + inferred data
+    user_context = {
+        "goal": request.goal or inferred["journey_stage"],
+        "persona": request.persona or finalized.get("title"),
+        "industry_input": request.industry or finalized.get("industry"),
+        "company": request.company or finalized.get("company_name"),
+        "company_size": request.companySize or finalized.get("company_size"),
+        "first_name": request.firstName or finalized.get("first_name"),
+        "last_name": request.lastName or finalized.get("last_name"),
+        "inferred_context": inferred,
+        "news_analysis": finalized.get("news_analysis"),
+    }
+
+    # Get company news from Tavily (if available in enrichment)
+    company_news = finalized.get("company_context", "")
+
+    # Generate AMD ebook personalization (3 sections) and, unless skipped,
+    # the legacy intro/CTA concurrently. Each runs its own compliance check
+    # as soon as its LLM call returns.
+    use_llm_cache = not request.bypass_llm_cache
+    ebook_coro = _generate_ebook_content(
+        llm_service, compliance_service, finalized, user_context, company_news, job_id, progress,
+        use_cache=use_llm_cache
+    )
+    if request.skip_legacy_personalization:
+        ebook_personalization = await ebook_coro
+        intro_hook, cta = None, None
+    else:
+        legacy_coro = _generate_legacy_content(
+            llm_service, compliance_service, finalized, user_context, job_id, progress,
+            use_cache=use_llm_cache
+        )
+        ebook_personalization, (intro_hook, cta) = await asyncio.gather(ebook_coro, legacy_coro)
+
+    # Store ebook personalization in normalized_data for PDF generation
+    finalized["ebook_personalization"] = ebook_personalization
+    finalized["user_context"] = user_context
+
+    # Update finalize_data with personalization (non-fatal - log error but continue)
+    try:
+        await supabase.upsert_finalize_data(
+            email=email,
+            normalized_data=finalized,
+            intro=intro_hook,
+            cta=cta,
+            data_sources=orchestrator.data_sources
+        )
+    except Exception as db_err:
+        logger.error(f"[{job_id}] Failed to store finalize_data: {db_err}")
+        logger.error(f"[{job_id}] DB error traceback: {traceback.format_exc()}")
+
+    logger.info(f"[{job_id}] Enrichment completed for {email}")
+
+    # Build response with data source info
+    response = EnrichmentResponse(
+        job_id=job_id,
+        email=email,
+        status="completed",
+        created_at=datetime.utcnow()
+    )
+
+    # Add extra info about data sources and personalization (for frontend)
+    return {
+        **response.model_dump(mode="json"),
+        "data_sources": orchestrator.data_sources,
+        "data_quality_score": finalized.get("data_quality_score", 0),
+        "enriched_fields": {
+            "first_name": finalized.get("first_name"),
+            "company_name": finalized.get("company_name"),
+            "title": finalized.get("title"),
+            "industry": finalized.get("industry"),
+            "employee_count": finalized.get("employee_count"),
+            "latest_funding_stage": finalized.get("latest_funding_stage"),
+            "news_themes": finalized.get("news_themes", []),
+            "recent_news": finalized.get("recent_news", [])[:3],  # First 3 headlines
+            "skills": finalized.get("skills", [])[:5],  # First 5 skills
+        },
+        # Include ebook personalization for frontend rendering
+        "ebook_personalization": ebook_personalization,
+        "user_context": user_context,
+        "personalization_intro": intro_hook,
+        "personalization_cta": cta
+    }
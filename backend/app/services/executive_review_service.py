@@ -18,6 +18,8 @@ from typing import Optional
 from anthropic import AsyncAnthropic
 
 from app.config import settings
+from app.services.llm_cache import get_llm_cache, llm_cache_key
+from app.services.llm_providers import cached_text_block, log_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +139,8 @@ BANNED_IN_HEADLINES = [
 # ANTHROPIC TOOL_USE SCHEMA
 # =============================================================================
 
+EXECUTIVE_REVIEW_MODEL = "claude-sonnet-4-20250514"
+
 EXECUTIVE_REVIEW_TOOL_SCHEMA = {
     "name": "generate_executive_review",
     "description": "Generate a personalized executive review with executive summary, advantages, risks, recommendations, and case study relevance. Each field has strict character limits.",
@@ -1204,9 +1208,12 @@ class ExecutiveReviewService:
         priority: str,
         challenge: str,
         enrichment_context: dict | None = None,
+        use_cache: bool = True,
     ) -> dict:
         """
         Generate executive review content using few-shot prompting.
+        A validated review for byte-identical prompts is served from the
+        LLM response cache.
 
         Args:
             company_name: Company name
@@ -1216,6 +1223,8 @@ class ExecutiveReviewService:
             stage: Modernization stage (Observer/Challenger/Leader)
             priority: Business priority (display text)
             challenge: Challenge (display text)
+            enrichment_context: Company intelligence woven into the prompt
+            use_cache: False to regenerate even if an identical review is cached
 
         Returns:
             Dict with stage, advantages, risks, recommendations, case_study,
@@ -1230,8 +1239,9 @@ class ExecutiveReviewService:
         # Get the best matching few-shot example based on stage and other inputs
         example = self._select_best_example(stage, industry, priority, challenge)
 
-        # Build the prompt
-        system_prompt = self._build_system_prompt()
+        # Build the prompt: static rules + few-shot example form a cached
+        # prefix; only the user turn varies per company
+        system_blocks = self._build_system_blocks(example)
         user_prompt = self._build_user_prompt(
             company_name=company_name,
             industry=industry,
@@ -1244,17 +1254,28 @@ class ExecutiveReviewService:
             enrichment_context=enrichment_context,
         )
 
+        cache = get_llm_cache()
+        cache_key = llm_cache_key(
+            EXECUTIVE_REVIEW_MODEL, system_blocks, user_prompt, tool=EXECUTIVE_REVIEW_TOOL_SCHEMA
+        )
+        if cache is not None and use_cache:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Executive review cache HIT for {company_name}")
+                return cached
+
         try:
             response = await self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=EXECUTIVE_REVIEW_MODEL,
                 max_tokens=2000,
                 messages=[
                     {"role": "user", "content": user_prompt}
                 ],
-                system=system_prompt,
+                system=system_blocks,
                 tools=[EXECUTIVE_REVIEW_TOOL_SCHEMA],
                 tool_choice={"type": "tool", "name": "generate_executive_review"},
             )
+            log_cache_usage("executive_review", getattr(response, "usage", None))
 
             # Extract structured data from tool_use response
             result_data = None
@@ -1296,9 +1317,12 @@ class ExecutiveReviewService:
                 # Attempt targeted retry for failing fields
                 result = await self._retry_failing_fields(
                     result, validation["failures"], company_name, stage,
-                    industry, segment, persona, priority, challenge, system_prompt
+                    industry, segment, persona, priority, challenge, system_blocks
                 )
 
+            # Reviews patched with another company's example content are not cached
+            if cache is not None and result["_source"] == "llm":
+                await cache.put(cache_key, result)
             return result
 
         except Exception as e:
@@ -1373,12 +1397,13 @@ class ExecutiveReviewService:
         persona: str,
         priority: str,
         challenge: str,
-        system_prompt: str,
+        system_blocks: list,
         max_retries: int = 2,
     ) -> dict:
         """
         Retry only the specific fields that failed validation.
         If retry fails, fall back to gold-standard example content for those fields.
+        Retries reuse the original system blocks, so they hit the prompt cache.
         """
         if not self.client or not failures:
             return self._apply_fallback_fields(result, failures, company_name, stage, industry, priority, challenge)
@@ -1406,13 +1431,14 @@ No colons in headlines, no em dashes, no exclamation marks, no banned filler phr
 
             try:
                 response = await self.client.messages.create(
-                    model="claude-sonnet-4-20250514",
+                    model=EXECUTIVE_REVIEW_MODEL,
                     max_tokens=1500,
                     messages=[{"role": "user", "content": retry_prompt}],
-                    system=system_prompt,
+                    system=system_blocks,
                     tools=[EXECUTIVE_REVIEW_TOOL_SCHEMA],
                     tool_choice={"type": "tool", "name": "generate_executive_review"},
                 )
+                log_cache_usage("executive_review_retry", getattr(response, "usage", None))
 
                 retry_data = None
                 for block in response.content:
@@ -1465,10 +1491,35 @@ No colons in headlines, no em dashes, no exclamation marks, no banned filler phr
         for section in failing_sections:
             if section in fb:
                 result[section] = fb[section]
+                result["_source"] = "llm_partial_fallback"
                 logger.info(f"Replaced failing section '{section}' with fallback example content")
 
         return result
 
+    def _build_system_blocks(self, example: dict) -> list:
+        """
+        Build the cacheable system prompt: AMD content rules, then the
+        few-shot example, each ending a prompt-cache breakpoint.
+
+        The tool schema and rules are identical on every request and the
+        example comes from a small fixed pool, so both prefixes are reused
+        across companies; everything company-specific stays in the user turn.
+        """
+        return [
+            cached_text_block(self._build_system_prompt()),
+            cached_text_block(self._build_example_prompt(example)),
+        ]
+
+    def _build_example_prompt(self, example: dict) -> str:
+        """Render one few-shot example (static per example, so cacheable)."""
+        return f"""Here is an example of excellent output for a {example["profile"]["stage"]} stage company:
+
+INPUT:
+{json.dumps(example["profile"], indent=2)}
+
+OUTPUT:
+{json.dumps(example["output"], indent=2)}"""
+
     def _build_system_prompt(self) -> str:
         """Build the system prompt with AMD content rules."""
         return """You are an expert business strategist creating personalized executive reviews for AMD's Data Center Modernization program.
@@ -1529,7 +1580,7 @@ Return valid JSON only, no markdown, no explanation. Match the exact structure s
         example: dict,
         enrichment_context: dict | None = None,
     ) -> str:
-        """Build the user prompt with few-shot example, AMD IP context, and enrichment data."""
+        """Build the per-request user prompt with AMD IP context and enrichment data (the example itself is in the system blocks)."""
         # Get persona-specific language guidance
         persona_guidance = {
             "ITDM": "Focus on infrastructure, systems, technical architecture, and IT operational efficiency.",
@@ -1576,13 +1627,7 @@ PERSONALIZATION CHECKLIST (you must address ALL of these):
 8. Case study relevance MUST explain the connection to {company_name}'s specific {industry} challenges
 9. Content MUST reference specific company intelligence where available (news, headcount, growth, funding, AI readiness signals)
 
-Here is an example of excellent output for a {stage} stage company:
-
-INPUT:
-{json.dumps(example["profile"], indent=2)}
-
-OUTPUT:
-{json.dumps(example["output"], indent=2)}
+Follow the structure and quality of the {example["profile"]["company"]} example in your instructions, but write entirely new content.
 
 Now generate the executive review for {company_name}. The content must be clearly personalized to their specific industry ({industry}), priority ({priority}), and challenge ({challenge}). Where company intelligence is provided above, weave specific facts (employee count, growth rate, recent initiatives, funding stage) into the narrative to make it unmistakably about this company.
 
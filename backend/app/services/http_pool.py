@@ -0,0 +1,123 @@
+"""
+Shared HTTP connection pool for outbound vendor APIs.
+One httpx.AsyncClient per vendor host, created once in app.main.lifespan,
+so enrichment calls reuse warm TCP/TLS connections instead of paying a
+fresh handshake on every request.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.info("h2 not installed, vendor clients will use HTTP/1.1")
+
+# Keep-alive window for idle pooled connections (seconds)
+KEEPALIVE_EXPIRY = 60.0
+
+# Per-vendor connection limits. http2 is only enabled for hosts known to
+# negotiate it; the others stay on HTTP/1.1 keep-alive.
+VENDOR_HTTP_CONFIG = {
+    "apollo": {"max_connections": 20, "max_keepalive": 10, "http2": True},
+    "pdl": {"max_connections": 20, "max_keepalive": 10, "http2": True},
+    "hunter": {"max_connections": 10, "max_keepalive": 5, "http2": True},
+    "zoominfo": {"max_connections": 10, "max_keepalive": 5, "http2": False},
+    "gnews": {"max_connections": 10, "max_keepalive": 5, "http2": False},
+    "google_news_rss": {"max_connections": 10, "max_keepalive": 5, "http2": True},
+}
+
+
+class HTTPClientPool:
+    """
+    App-lifetime set of pooled httpx.AsyncClient instances, keyed by vendor.
+    Each vendor gets its own connection limits so one slow host cannot
+    starve the others of sockets.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Dict]] = None):
+        self.config = config or VENDOR_HTTP_CONFIG
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get(self, vendor: str) -> Optional[httpx.AsyncClient]:
+        """Return the pooled client for a vendor, creating it on first use."""
+        if vendor in self._clients:
+            return self._clients[vendor]
+
+        vendor_config = self.config.get(vendor)
+        if vendor_config is None:
+            return None
+
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE and vendor_config["http2"],
+            limits=httpx.Limits(
+                max_connections=vendor_config["max_connections"],
+                max_keepalive_connections=vendor_config["max_keepalive"],
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        self._clients[vendor] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        for vendor, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client for {vendor}: {e}")
+        self._clients = {}
+
+
+# Global instance (created in app.main.lifespan)
+_http_pool: Optional[HTTPClientPool] = None
+
+
+def init_http_pool() -> HTTPClientPool:
+    """Create the global HTTP pool (idempotent)."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPClientPool()
+        logger.info("HTTP client pool initialized")
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Close and discard the global HTTP pool."""
+    global _http_pool
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        _http_pool = None
+        logger.info("HTTP client pool closed")
+
+
+def get_http_pool() -> Optional[HTTPClientPool]:
+    """Get the global HTTP pool, or None outside the app lifespan."""
+    return _http_pool
+
+
+@asynccontextmanager
+async def pooled_client(vendor: str, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield an HTTP client for a vendor.
+
+    Uses the shared pooled client when the app lifespan has created one;
+    otherwise (scripts, tests) falls back to a short-lived client.
+    Callers should pass `timeout` per request so both paths behave the same.
+    """
+    pool = get_http_pool()
+    client = pool.get(vendor) if pool else None
+    if client is not None:
+        yield client
+        return
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
@@ -0,0 +1,226 @@
+"""
+Background worker for queued enrichment jobs (POST /rad/enrich?async=true).
+
+Jobs live in personalization_jobs. Workers lease rows via
+AsyncSupabaseClient.claim_jobs, run the enrichment pipeline, then write the result
+to personalization_outputs and mark the job completed or failed. While a job
+runs, its worker renews the lease every third of JOB_LEASE_SECONDS. A job
+whose worker dies is picked up again once its lease expires. A worker that
+finds its lease taken abandons the job, and status updates only apply while
+the worker holds the lease.
+
+Runs in-process (started from app.main.lifespan) or standalone:
+    python -m app.services.job_worker
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Dict, List, Optional
+
+from app.config import settings
+from app.models.schemas import EnrichmentRequest
+from app.services.async_supabase_client import (
+    AsyncSupabaseClient,
+    as_async_client,
+    close_async_supabase_client,
+    get_async_supabase_client,
+)
+from app.services.enrichment_pipeline import run_enrichment_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    """Raised when another worker has taken over a job's lease."""
+
+
+class JobWorker:
+    """
+    Pool of asyncio tasks that claim and process queued enrichment jobs.
+    Each slot holds at most one job, so `concurrency` bounds the number of
+    enrichments this process runs at once.
+    """
+
+    def __init__(
+        self,
+        supabase: AsyncSupabaseClient,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        worker_id: Optional[str] = None
+    ):
+        self.supabase = as_async_client(supabase)
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL_SECONDS
+        self.max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    async def process_job(self, job: Dict[str, Any]) -> None:
+        """Run the enrichment pipeline for one claimed job and record the outcome."""
+        job_id = job["id"]
+
+        if job.get("attempts", 1) > self.max_attempts:
+            logger.warning(f"[{job_id}] Giving up after {self.max_attempts} attempts")
+            await self.supabase.update_job_status(
+                job_id, "failed", error_message=f"Exceeded {self.max_attempts} attempts",
+                leased_by=self.worker_id
+            )
+            return
+
+        payload = job.get("request_payload")
+        if not payload:
+            await self.supabase.update_job_status(
+                job_id, "failed", error_message="Job has no request payload", leased_by=self.worker_id
+            )
+            return
+
+        start = time.monotonic()
+        try:
+            request = EnrichmentRequest(**payload)
+            result = await self._run_leased(job_id, run_enrichment_pipeline(request, self.supabase, str(job_id)))
+            # Skip the output write if the lease lapsed between heartbeats
+            if not await self.supabase.extend_job_lease(job_id, self.worker_id, self.lease_seconds):
+                raise LeaseLostError(f"lease on job {job_id} taken by another worker")
+            await self.supabase.store_personalization_output(
+                job_id=job_id,
+                output_json=result,
+                intro_hook=result.get("personalization_intro"),
+                cta=result.get("personalization_cta"),
+                latency_ms=int((time.monotonic() - start) * 1000)
+            )
+            if await self.supabase.update_job_status(job_id, "completed", leased_by=self.worker_id) is None:
+                raise LeaseLostError(f"lease on job {job_id} taken by another worker")
+            logger.info(f"[{job_id}] Job completed by worker {self.worker_id}")
+        except LeaseLostError as e:
+            logger.warning(f"[{job_id}] Abandoning job: {e}")
+        except Exception as e:
+            logger.error(f"[{job_id}] Job failed: {type(e).__name__}: {e}")
+            await self.supabase.update_job_status(
+                job_id, "failed", error_message=f"{type(e).__name__}: {str(e)[:200]}",
+                leased_by=self.worker_id
+            )
+
+    async def _run_leased(self, job_id: Any, coro: Awaitable[Any]) -> Any:
+        """
+        Await `coro` while renewing the job's lease in the background.
+
+        Raises:
+            LeaseLostError: Another worker took the lease; `coro` was cancelled
+        """
+        work = asyncio.ensure_future(coro)
+        heartbeat = asyncio.create_task(self._renew_lease(job_id, work))
+        try:
+            return await work
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled() and heartbeat.result():
+                raise LeaseLostError(f"lease on job {job_id} taken by another worker") from None
+            raise
+        finally:
+            heartbeat.cancel()
+
+    async def _renew_lease(self, job_id: Any, work: asyncio.Future) -> bool:
+        """
+        Renew the lease every third of its length until cancelled.
+
+        Returns:
+            True (after cancelling `work`) once the lease is found taken
+        """
+        interval = self.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self.supabase.extend_job_lease(job_id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                # Transient; the current lease still has two intervals left
+                logger.warning(f"[{job_id}] Lease renewal failed: {e}")
+                continue
+            if not renewed:
+                work.cancel()
+                return True
+
+    async def run_once(self, limit: Optional[int] = None) -> int:
+        """
+        Claim up to `limit` jobs and process them concurrently.
+
+        Returns:
+            Number of jobs claimed
+        """
+        jobs = await self.supabase.claim_jobs(
+            self.worker_id,
+            limit=limit or self.concurrency,
+            lease_seconds=self.lease_seconds
+        )
+        if jobs:
+            await asyncio.gather(*(self.process_job(job) for job in jobs))
+        return len(jobs)
+
+    async def _slot_loop(self) -> None:
+        """One worker slot: claim a job, process it, repeat; sleep when idle."""
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once(limit=1)
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id} loop error: {e}")
+                claimed = 0
+            if not claimed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Start the worker slots as background tasks on the running loop."""
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._slot_loop()) for _ in range(self.concurrency)]
+        logger.info(f"Job worker {self.worker_id} started with {self.concurrency} slot(s)")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop claiming new jobs and wait briefly for in-flight ones.
+        Jobs still running after `timeout` are cancelled; their leases expire
+        and another worker retries them.
+        """
+        self._stopping.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+
+async def _run_standalone() -> None:
+    """Run a worker process until interrupted."""
+    from app.services.http_pool import init_http_pool, close_http_pool
+
+    settings.validate()
+    init_http_pool()
+    worker = JobWorker(get_async_supabase_client())
+    worker.start()
+    try:
+        await asyncio.gather(*worker._tasks)
+    finally:
+        await worker.stop()
+        await close_async_supabase_client()
+        await close_http_pool()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    try:
+        asyncio.run(_run_standalone())
+    except KeyboardInterrupt:
+        pass
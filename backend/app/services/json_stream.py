@@ -0,0 +1,100 @@
+"""
+Incremental JSON parsing for streamed LLM output.
+
+LLM responses arrive token by token. JSONFieldStream consumes the text as
+it streams and reports each top-level string field of the first JSON
+object the moment its closing quote arrives, so callers can act on
+"personalized_hook" long before "personalized_cta" has been generated.
+Leading prose or code fences before the object are skipped.
+"""
+
+import json
+import logging
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JSONFieldStream:
+    """
+    Streaming extractor for the top-level string fields of a JSON object.
+
+    Nested objects/arrays and non-string values are skipped; the full
+    response should still be parsed normally once complete.
+    """
+
+    def __init__(self):
+        self.fields: dict = {}
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._raw: List[str] = []
+        self._expect_key = True
+        self._string_is_key = False
+        self._key: Optional[str] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """
+        Consume the next piece of text.
+
+        Returns:
+            (field, value) pairs completed by this chunk, in order
+        """
+        completed: List[Tuple[str, str]] = []
+        for ch in chunk:
+            if self.done:
+                break
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._end_string(completed)
+                    continue
+                if self._depth == 1:
+                    self._raw.append(ch)
+                continue
+
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_is_key = self._depth == 1 and self._expect_key
+                self._raw = []
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+            elif self._depth == 1:
+                if ch == ":":
+                    self._expect_key = False
+                elif ch == ",":
+                    self._expect_key = True
+                    self._key = None
+        return completed
+
+    def _end_string(self, completed: List[Tuple[str, str]]) -> None:
+        if self._depth != 1:
+            return
+        try:
+            # strict=False: LLMs sometimes emit raw newlines inside strings
+            value = json.loads('"' + "".join(self._raw) + '"', strict=False)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping undecodable streamed string: {e}")
+            return
+        if self._string_is_key:
+            self._key = value
+        elif self._key is not None:
+            self.fields[self._key] = value
+            completed.append((self._key, value))
+            self._key = None
@@ -0,0 +1,178 @@
+"""
+Response cache for LLM generations.
+
+Many requests build byte-identical prompts (same company, persona, stage,
+priority and challenge), so the generated content is reused instead of
+paying 5-20 s for a new completion. Keyed by the SHA-256 of a canonical
+JSON encoding of the model chain, system prompt and user prompt. Two tiers:
+  - in-process LRU with per-entry expiry
+  - on-disk JSON files with the same TTL, so entries survive restarts and
+    are shared by every worker on the host
+
+Only successful generations are stored; mock and fallback content never is.
+Callers bypass the cache per call with use_cache=False.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.enrichment_cache import MemoryLRU
+
+logger = logging.getLogger(__name__)
+
+
+def llm_cache_key(model: Any, system: Any, user: Any, **params: Any) -> str:
+    """
+    Cache key for one generation request.
+
+    Args:
+        model: Model name, or the ordered provider/model chain
+        system: System prompt (string or content blocks)
+        user: User prompt
+        **params: Other inputs that change the output (max_tokens, tools)
+
+    Returns:
+        Hex digest that is equal exactly when every input is equal
+    """
+    canonical = json.dumps(
+        {"model": model, "system": system, "user": user, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of JSON-serializable LLM results.
+    Disk reads/writes run in a thread so lookups never block the loop.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        memory_entries: int,
+        disk_dir: Optional[str] = None,
+        disk_entries: int = 0
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.memory = MemoryLRU(memory_entries)
+        self.disk_entries = disk_entries
+        self.disk_dir = Path(disk_dir) if disk_dir and disk_entries > 0 else None
+        self.hits = 0
+        self.misses = 0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.json"
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            path.unlink(missing_ok=True)
+            return None
+        if entry.get("expires_at", 0) < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _disk_put(self, key: str, payload: Dict[str, Any]) -> None:
+        entry = {"expires_at": time.time() + self.ttl_seconds, "payload": payload}
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._disk_path(key))
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        entries = []
+        for path in self.disk_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        excess = len(entries) - self.disk_entries
+        if excess <= 0:
+            return
+        for _, path in sorted(entries)[:excess]:
+            path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, promoting disk hits into memory."""
+        payload = self.memory.get(key)
+        if payload is None and self.disk_dir is not None:
+            try:
+                entry = await asyncio.to_thread(self._disk_get, key)
+            except OSError as e:
+                logger.warning(f"LLM cache disk read failed: {e}")
+                entry = None
+            if entry is not None:
+                payload = entry["payload"]
+                self.memory.put(key, payload, max(entry["expires_at"] - time.time(), 0))
+
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(payload)
+
+    async def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a result in both tiers."""
+        payload = copy.deepcopy(payload)
+        self.memory.put(key, payload, self.ttl_seconds)
+        if self.disk_dir is not None:
+            try:
+                await asyncio.to_thread(self._disk_put, key, payload)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"LLM cache disk write failed: {e}")
+
+
+# Global instance (lazy-loaded)
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get or create the global LLM response cache, or None when disabled."""
+    global _llm_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            ttl_seconds=settings.LLM_CACHE_TTL_HOURS * 3600,
+            memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+            disk_dir=settings.LLM_CACHE_DIR,
+            disk_entries=settings.LLM_CACHE_DISK_ENTRIES
+        )
+        logger.info(
+            f"LLM response cache initialized (TTL {settings.LLM_CACHE_TTL_HOURS}h, "
+            f"{settings.LLM_CACHE_MEMORY_ENTRIES} in memory, "
+            f"disk at {settings.LLM_CACHE_DIR or 'disabled'})"
+        )
+    return _llm_cache
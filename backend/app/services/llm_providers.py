@@ -0,0 +1,223 @@
+"""
+Async LLM provider integrations for LLMService.
+Native async clients for: Anthropic, OpenAI, Gemini.
+Each provider exposes the same complete() coroutine so the service can
+fall back between them without blocking the event loop, and a stream()
+async iterator yielding text deltas as they are generated.
+
+Prompt-cache helpers for Anthropic callers whose static prefix is long
+enough to be cached (see ExecutiveReviewService._build_system_blocks).
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Optional
+
+import anthropic
+
+logger = logging.getLogger(__name__)
+
+# Try to import optional providers
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    logger.info("OpenAI not installed, skipping as fallback")
+
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    GEMINI_AVAILABLE = False
+    logger.info("Google Generative AI not installed, skipping as fallback")
+
+# Anthropic prompt-cache breakpoint (5 minute TTL, refreshed on every hit).
+# Prefixes below the model's minimum are never cached: 1024 tokens for
+# Sonnet 4, 4096 for Haiku 4.5. The LLMService ebook and legacy system
+# prompts (~800 and ~180 tokens, sent to Haiku) are far below that, so
+# AnthropicProvider sends them unmarked.
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def cached_text_block(text: str) -> Dict[str, Any]:
+    """Anthropic text content block ending a cacheable prompt prefix."""
+    return {"type": "text", "text": text, "cache_control": PROMPT_CACHE_CONTROL}
+
+
+def _token_count(usage: Any, field: str) -> int:
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else 0
+
+
+def log_cache_usage(label: str, usage: Any) -> None:
+    """
+    Log prompt-cache hit/miss token accounting for an Anthropic response.
+
+    Args:
+        label: What the call was for (e.g. "executive_review")
+        usage: response.usage from the Messages API
+    """
+    if usage is None:
+        return
+    cache_read = _token_count(usage, "cache_read_input_tokens")
+    cache_write = _token_count(usage, "cache_creation_input_tokens")
+    uncached = _token_count(usage, "input_tokens")
+    total = cache_read + cache_write + uncached
+    status = "hit" if cache_read else ("miss" if cache_write else "none")
+    logger.info(
+        f"Prompt cache {status} [{label}]: read={cache_read} write={cache_write} "
+        f"uncached={uncached} ({cache_read * 100 // total if total else 0}% of input from cache), "
+        f"output={_token_count(usage, 'output_tokens')}"
+    )
+
+
+class BaseLLMProvider(ABC):
+    """Base class for async LLM provider integrations."""
+
+    name: str = "unknown"
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @abstractmethod
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> Optional[str]:
+        """Return the completion text for the given prompts."""
+        pass
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """
+        Yield the completion text in pieces as it is generated.
+        Providers without a streaming API yield the whole completion once.
+        """
+        text = await self.complete(system_prompt, user_prompt, max_tokens)
+        if text:
+            yield text
+
+
+class AnthropicProvider(BaseLLMProvider):
+    """Anthropic Messages API via AsyncAnthropic."""
+
+    name = "anthropic"
+
+    def __init__(self, api_key: str, model: str):
+        super().__init__(model)
+        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> Optional[str]:
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": user_prompt}],
+            system=system_prompt
+        )
+        return response.content[0].text
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": user_prompt}],
+            system=system_prompt
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+class OpenAIProvider(BaseLLMProvider):
+    """OpenAI Chat Completions API via AsyncOpenAI."""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str):
+        super().__init__(model)
+        self.client = openai.AsyncOpenAI(api_key=api_key)
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> Optional[str]:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+        )
+        return response.choices[0].message.content
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            stream=True
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+class GeminiProvider(BaseLLMProvider):
+    """Google Gemini via GenerativeModel.generate_content_async."""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str):
+        super().__init__(model)
+        genai.configure(api_key=api_key)
+        self.client = genai.GenerativeModel(model)
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> Optional[str]:
+        # Gemini combines system + user in one prompt
+        combined = f"{system_prompt}\n\n{user_prompt}"
+        response = await self.client.generate_content_async(combined)
+        return response.text
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        combined = f"{system_prompt}\n\n{user_prompt}"
+        response = await self.client.generate_content_async(combined, stream=True)
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
@@ -4,38 +4,33 @@ Multi-provider support with fallback: Anthropic → OpenAI → Gemini → mock.
 Implements structured output, validation, and retry logic.
 """
 
+import asyncio
 import logging
 import json
+import math
 import time
 import re
-from typing import Optional, Dict, Any, List, Tuple
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from dataclasses import dataclass
 
-import anthropic
-from anthropic import APIError as AnthropicAPIError, APITimeoutError as AnthropicTimeoutError, RateLimitError as AnthropicRateLimitError
-
 from app.config import settings
+from app.services.llm_providers import (
+    BaseLLMProvider,
+    AnthropicProvider,
+    OpenAIProvider,
+    GeminiProvider,
+    OPENAI_AVAILABLE,
+    GEMINI_AVAILABLE,
+)
+from app.services.json_stream import JSONFieldStream
+from app.services.llm_cache import get_llm_cache, llm_cache_key
 
 logger = logging.getLogger(__name__)
 
-# Try to import optional providers
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    logger.info("OpenAI not installed, skipping as fallback")
-
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-    logger.info("Google Generative AI not installed, skipping as fallback")
-
 # Constants
 MAX_RETRIES = 2
-RETRY_DELAY_SECONDS = 1.0
+RETRY_DELAY_SECONDS = 1.0  # Base delay; doubles on each retry
 
 # Model names per provider
 ANTHROPIC_MODEL = "claude-haiku-4-5-20251001"
@@ -47,6 +42,52 @@ GEMINI_MODEL = "gemini-1.5-flash"
 MAX_INTRO_LENGTH = 200  # characters
 MAX_CTA_LENGTH = 150  # characters
 
+# Ebook personalization fields and their hard character limits
+EBOOK_FIELD_LIMITS = {
+    "personalized_hook": 350,
+    "case_study_framing": 250,
+    "personalized_cta": 200,
+}
+
+# on_field(field_name, value) - called as each streamed field completes
+FieldCallback = Callable[[str, str], None]
+
+
+class ProviderLatencyTracker:
+    """Rolling window of successful call latencies per provider/model."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, key: str, pct: float, min_samples: int = 1) -> Optional[float]:
+        """The pct-th percentile latency, or None with fewer than min_samples calls."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(max(math.ceil(pct / 100 * len(ordered)) - 1, 0), len(ordered) - 1)
+        return ordered[index]
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+
+# Process-wide latency history (LLMService is created per request)
+_latency_tracker = ProviderLatencyTracker(settings.LLM_LATENCY_WINDOW)
+
+
+def get_latency_tracker() -> ProviderLatencyTracker:
+    """Get the process-wide provider latency tracker (tests clear it between cases)."""
+    return _latency_tracker
+
+
 # Role mapping: form values to human-readable titles and seniority
 ROLE_MAPPING = {
     # Executive Leadership
@@ -131,17 +172,12 @@ class LLMService:
         Initialize LLM service with all available providers.
         Providers are tried in order: Anthropic → OpenAI → Gemini.
         """
-        self.providers: List[Dict[str, Any]] = []
+        self.providers: List[BaseLLMProvider] = []
 
         # Initialize Anthropic
         if settings.ANTHROPIC_API_KEY:
             try:
-                client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-                self.providers.append({
-                    "name": "anthropic",
-                    "client": client,
-                    "model": ANTHROPIC_MODEL
-                })
+                self.providers.append(AnthropicProvider(settings.ANTHROPIC_API_KEY, ANTHROPIC_MODEL))
                 logger.info("Anthropic provider initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize Anthropic: {e}")
@@ -149,12 +185,7 @@ class LLMService:
         # Initialize OpenAI
         if OPENAI_AVAILABLE and settings.OPENAI_API_KEY:
             try:
-                client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-                self.providers.append({
-                    "name": "openai",
-                    "client": client,
-                    "model": OPENAI_MODEL
-                })
+                self.providers.append(OpenAIProvider(settings.OPENAI_API_KEY, OPENAI_MODEL))
                 logger.info("OpenAI provider initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize OpenAI: {e}")
@@ -162,12 +193,7 @@ class LLMService:
         # Initialize Gemini
         if GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
             try:
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self.providers.append({
-                    "name": "gemini",
-                    "client": genai,
-                    "model": GEMINI_MODEL
-                })
+                self.providers.append(GeminiProvider(settings.GEMINI_API_KEY, GEMINI_MODEL))
                 logger.info("Gemini provider initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize Gemini: {e}")
@@ -175,11 +201,11 @@ class LLMService:
         if not self.providers:
             logger.warning("No LLM providers available - will use mock responses")
         else:
-            logger.info(f"LLM service initialized with providers: {[p['name'] for p in self.providers]}")
+            logger.info(f"LLM service initialized with providers: {[p.name for p in self.providers]}")
 
-    def _call_provider(
+    async def _call_provider(
         self,
-        provider: Dict[str, Any],
+        provider: BaseLLMProvider,
         system_prompt: str,
         user_prompt: str,
         max_tokens: int = 500
@@ -188,7 +214,7 @@ class LLMService:
         Call a specific LLM provider and return the response text.
 
         Args:
-            provider: Provider config dict with name, client, model
+            provider: Async provider instance
             system_prompt: System prompt
             user_prompt: User prompt
             max_tokens: Max tokens for response
@@ -196,76 +222,260 @@ class LLMService:
         Returns:
             Response text or None if failed
         """
-        name = provider["name"]
-        client = provider["client"]
-        model = provider["model"]
+        start = time.monotonic()
+        try:
+            result = await provider.complete(system_prompt, user_prompt, max_tokens)
+        except Exception as e:
+            logger.warning(f"{provider.name} provider failed: {type(e).__name__}: {e}")
+            return None
+        if result:
+            _latency_tracker.record(f"{provider.name}:{provider.model}", time.monotonic() - start)
+        return result
 
+    async def _call_provider_with_retries(
+        self,
+        provider: BaseLLMProvider,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int
+    ) -> Optional[str]:
+        """
+        Call one provider up to MAX_RETRIES times.
+        Retries back off exponentially with asyncio.sleep so other
+        requests keep running while this one waits.
+        """
+        for attempt in range(MAX_RETRIES):
+            result = await self._call_provider(provider, system_prompt, user_prompt, max_tokens)
+            if result:
+                return result
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(RETRY_DELAY_SECONDS * (2 ** attempt))
+        return None
+
+    @staticmethod
+    def _hedge_delay(provider: BaseLLMProvider) -> float:
+        """
+        How long to wait on a provider before hedging with the next one:
+        its recent LLM_HEDGE_PERCENTILE latency, or LLM_HEDGE_DELAY_SECONDS
+        until it has LLM_HEDGE_MIN_SAMPLES successful calls.
+        """
+        observed = _latency_tracker.percentile(
+            f"{provider.name}:{provider.model}",
+            settings.LLM_HEDGE_PERCENTILE,
+            min_samples=settings.LLM_HEDGE_MIN_SAMPLES
+        )
+        delay = settings.LLM_HEDGE_DELAY_SECONDS if observed is None else observed
+        return max(delay, settings.LLM_HEDGE_MIN_DELAY_SECONDS)
+
+    async def _call_hedged(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> Tuple[Optional[str], str]:
+        """
+        Race providers in fallback order, adding the next one whenever the
+        newest has not answered within its hedge delay (or has failed).
+
+        The first response that passes validate wins and the calls still in
+        flight are cancelled, so a slow-but-healthy primary costs at most
+        its own tail latency before the fastest provider takes over.
+
+        Returns:
+            Tuple of (response_text, provider_name) or (None, "none")
+        """
+        remaining = list(self.providers)
+        in_flight: Dict[asyncio.Task, BaseLLMProvider] = {}
+
+        def launch() -> BaseLLMProvider:
+            provider = remaining.pop(0)
+            task = asyncio.create_task(
+                self._call_provider_with_retries(provider, system_prompt, user_prompt, max_tokens)
+            )
+            in_flight[task] = provider
+            return provider
+
+        newest = launch()
         try:
-            if name == "anthropic":
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": user_prompt}],
-                    system=system_prompt
-                )
-                return response.content[0].text
-
-            elif name == "openai":
-                response = client.chat.completions.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
+            while in_flight:
+                timeout = self._hedge_delay(newest) if remaining else None
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
                 )
-                return response.choices[0].message.content
+                if not done:
+                    logger.info(
+                        f"{newest.name} slower than {timeout:.1f}s, hedging with {remaining[0].name}"
+                    )
+                    newest = launch()
+                    continue
+
+                for task in done:
+                    provider = in_flight.pop(task)
+                    result = task.result()
+                    if result and (validate is None or validate(result)):
+                        return result, provider.name
+                    if result:
+                        logger.warning(f"{provider.name} returned an unusable response")
+
+                if not in_flight and remaining:
+                    newest = launch()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
-            elif name == "gemini":
-                model_instance = client.GenerativeModel(model)
-                # Gemini combines system + user in one prompt
-                combined = f"{system_prompt}\n\n{user_prompt}"
-                response = model_instance.generate_content(combined)
-                return response.text
+        return None, "none"
 
-        except Exception as e:
-            logger.warning(f"{name} provider failed: {type(e).__name__}: {e}")
-            return None
+    def _cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Response cache key: provider/model chain plus the exact prompts."""
+        models = [f"{provider.name}:{provider.model}" for provider in self.providers]
+        return llm_cache_key(models, system_prompt, user_prompt, max_tokens=max_tokens)
 
-        return None
+    async def _cache_get(self, key: str) -> Optional[Dict[str, str]]:
+        """Look up a cached completion ({"content", "provider"}), or None."""
+        cache = get_llm_cache()
+        if cache is None:
+            return None
+        cached = await cache.get(key)
+        if cached is not None:
+            logger.info(f"LLM cache HIT ({cached['provider']}) for {key[:12]}")
+        return cached
 
-    def _call_with_fallback(
+    async def _cache_put(
+        self,
+        key: str,
+        content: str,
+        provider_name: str,
+        validate: Optional[Callable[[str], Any]]
+    ) -> None:
+        """Cache a completion, unless validate() rejects it."""
+        cache = get_llm_cache()
+        if cache is None or (validate is not None and not validate(content)):
+            return
+        await cache.put(key, {"content": content, "provider": provider_name})
+
+    async def _call_with_fallback(
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], Any]] = None
     ) -> Tuple[Optional[str], str]:
         """
         Try each provider in order until one succeeds.
 
+        With LLM_HEDGE_ENABLED the providers are raced instead: the next one
+        starts as soon as the current one is slower than its usual tail
+        latency, and the first valid response wins (see _call_hedged).
+        Identical prompts are answered from the LLM response cache.
+
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
             max_tokens: Max tokens
+            use_cache: False to skip the cache lookup (the fresh result is
+                still cached)
+            validate: Only completions for which this returns truthy are
+                cached (e.g. the response parser)
 
         Returns:
             Tuple of (response_text, provider_name) or (None, "none")
         """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        if use_cache:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                return cached["content"], cached["provider"]
+
+        if settings.LLM_HEDGE_ENABLED and len(self.providers) > 1:
+            result, provider_name = await self._call_hedged(
+                system_prompt, user_prompt, max_tokens, validate
+            )
+            if result:
+                await self._cache_put(key, result, provider_name, validate)
+            return result, provider_name
+
         for provider in self.providers:
-            for attempt in range(MAX_RETRIES):
-                result = self._call_provider(provider, system_prompt, user_prompt, max_tokens)
-                if result:
-                    return result, provider["name"]
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY_SECONDS)
+            result = await self._call_provider_with_retries(provider, system_prompt, user_prompt, max_tokens)
+            if result:
+                await self._cache_put(key, result, provider.name, validate)
+                return result, provider.name
 
         return None, "none"
 
+    async def _stream_with_fallback(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        on_field: FieldCallback,
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> Tuple[Optional[str], str, Dict[str, str]]:
+        """
+        Streaming counterpart of _call_with_fallback.
+
+        Text deltas are fed through an incremental JSON parser and on_field
+        is called as each top-level string field completes. A provider that
+        fails before completing any field falls through to the next one;
+        once a field has been reported the call is committed to that
+        provider (no retries, since reported fields cannot be taken back).
+
+        A cached completion for the same prompts is replayed through the
+        parser instead, so on_field still sees every field. Only streams
+        that finish without error are cached.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            max_tokens: Max tokens
+            on_field: Called with (field, value) as each field completes
+            use_cache: False to skip the cache lookup
+            validate: Only completions for which this returns truthy are cached
+
+        Returns:
+            Tuple of (response_text, provider_name, completed_fields) or
+            (None, "none", {})
+        """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        if use_cache:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                parser = JSONFieldStream()
+                for field, value in parser.feed(cached["content"]):
+                    on_field(field, value)
+                return cached["content"], cached["provider"], parser.fields
+
+        for provider in self.providers:
+            parser = JSONFieldStream()
+            chunks: List[str] = []
+            try:
+                async for text in provider.stream(system_prompt, user_prompt, max_tokens):
+                    chunks.append(text)
+                    for field, value in parser.feed(text):
+                        on_field(field, value)
+            except Exception as e:
+                logger.warning(f"{provider.name} provider stream failed: {type(e).__name__}: {e}")
+                if not parser.fields:
+                    continue
+                if chunks:
+                    return "".join(chunks), provider.name, parser.fields
+            if chunks:
+                content = "".join(chunks)
+                await self._cache_put(key, content, provider.name, validate)
+                return content, provider.name, parser.fields
+
+        return None, "none", {}
+
     async def generate_personalization(
         self,
         normalized_profile: Dict[str, Any],
         use_opus: bool = False,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, str]:
         """
         Generate intro hook and CTA from normalized profile.
@@ -275,6 +485,7 @@ class LLMService:
             normalized_profile: Normalized enrichment data
             use_opus: Whether to use Opus model (Anthropic only)
             user_context: User-provided context (goal, persona, industry)
+            use_cache: False to regenerate even if an identical prompt is cached
 
         Returns:
             Dict with 'intro_hook', 'cta', and metadata
@@ -287,7 +498,9 @@ class LLMService:
         system_prompt = self._get_system_prompt()
 
         # Try with fallback
-        content, provider_name = self._call_with_fallback(system_prompt, prompt, max_tokens=500)
+        content, provider_name = await self._call_with_fallback(
+            system_prompt, prompt, max_tokens=500, use_cache=use_cache, validate=self._parse_response
+        )
 
         if content:
             parsed = self._parse_response(content)
@@ -630,7 +843,9 @@ No other text."""
         self,
         profile: Dict[str, Any],
         user_context: Optional[Dict[str, Any]] = None,
-        company_news: Optional[str] = None
+        company_news: Optional[str] = None,
+        on_field: Optional[FieldCallback] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate personalized content for AMD ebook - 3 sections:
@@ -644,12 +859,16 @@ No other text."""
             profile: Normalized enrichment data
             user_context: User-provided context (goal, persona, industry)
             company_news: Recent company news from Tavily
+            on_field: Optional callback; when given the completion is
+                streamed and called with (field, value) as each of the three
+                fields completes (length limits already applied)
+            use_cache: False to regenerate even if an identical prompt is cached
 
         Returns:
             Dict with personalized_hook, case_study_framing, personalized_cta
         """
         if not self.providers:
-            return self._mock_ebook_response(profile, user_context)
+            return self._report_ebook_fields(self._mock_ebook_response(profile, user_context), on_field)
 
         user_context = user_context or {}
         start_time = time.time()
@@ -657,11 +876,36 @@ No other text."""
         prompt = self._build_ebook_prompt(profile, user_context, company_news)
         system_prompt = self._get_ebook_system_prompt()
 
-        # Try with fallback
-        content, provider_name = self._call_with_fallback(system_prompt, prompt, max_tokens=1000)
+        if on_field is None:
+            # Try with fallback
+            content, provider_name = await self._call_with_fallback(
+                system_prompt, prompt, max_tokens=1000,
+                use_cache=use_cache, validate=self._parse_ebook_response
+            )
+            streamed: Dict[str, str] = {}
+        else:
+            def report(field: str, value: str) -> None:
+                if field in EBOOK_FIELD_LIMITS:
+                    on_field(field, self._truncate_to_sentence(value, EBOOK_FIELD_LIMITS[field]))
+
+            content, provider_name, streamed = await self._stream_with_fallback(
+                system_prompt, prompt, 1000, report,
+                use_cache=use_cache, validate=self._parse_ebook_response
+            )
 
         if content:
             parsed = self._parse_ebook_response(content)
+            if not parsed and streamed:
+                # Stream broke off (or trailing junk) after some fields were
+                # already shown: keep those and fill the rest from the mock
+                mock = self._mock_ebook_response(profile, user_context)
+                parsed = {
+                    f: self._truncate_to_sentence(streamed[f], limit) if streamed.get(f) else mock[f]
+                    for f, limit in EBOOK_FIELD_LIMITS.items()
+                }
+                self._report_ebook_fields(
+                    {f: v for f, v in parsed.items() if not streamed.get(f)}, on_field
+                )
 
             if parsed:
                 latency_ms = int((time.time() - start_time) * 1000)
@@ -673,7 +917,19 @@ No other text."""
 
         # All providers failed
         logger.warning("All LLM providers failed for ebook personalization, using mock")
-        return self._mock_ebook_response(profile, user_context)
+        return self._report_ebook_fields(self._mock_ebook_response(profile, user_context), on_field)
+
+    def _report_ebook_fields(
+        self,
+        result: Dict[str, Any],
+        on_field: Optional[FieldCallback]
+    ) -> Dict[str, Any]:
+        """Report non-streamed ebook fields (mock/fallback content) through on_field."""
+        if on_field is not None:
+            for field in EBOOK_FIELD_LIMITS:
+                if result.get(field):
+                    on_field(field, result[field])
+        return result
 
     def _get_ebook_system_prompt(self) -> str:
         """System prompt for AMD ebook personalization."""
@@ -1286,17 +1542,10 @@ Output ONLY valid JSON:
             )
             if json_match:
                 data = json.loads(json_match.group())
-                if all(k in data for k in ["personalized_hook", "case_study_framing", "personalized_cta"]):
+                if all(k in data for k in EBOOK_FIELD_LIMITS):
                     # Enforce hard character limits with sentence-boundary truncation
-                    data["personalized_hook"] = self._truncate_to_sentence(
-                        data["personalized_hook"], 350
-                    )
-                    data["case_study_framing"] = self._truncate_to_sentence(
-                        data["case_study_framing"], 250
-                    )
-                    data["personalized_cta"] = self._truncate_to_sentence(
-                        data["personalized_cta"], 200
-                    )
+                    for field, limit in EBOOK_FIELD_LIMITS.items():
+                        data[field] = self._truncate_to_sentence(data[field], limit)
                     return data
         except json.JSONDecodeError as e:
             logger.warning(f"JSON parse error for ebook response: {e}")
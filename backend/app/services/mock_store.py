@@ -0,0 +1,132 @@
+"""
+Indexed in-memory tables for SupabaseClient mock mode.
+
+Load tests and soak runs use MOCK_SUPABASE=true, so the mock backend must
+not degrade as it fills up. Each MockTable keeps rows in insertion order
+with hash indexes on the columns the client filters by, which makes
+lookups, upserts and updates O(1) per matching row instead of a scan of
+the whole table. An optional row cap evicts the oldest rows first.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class MockTable:
+    """
+    In-memory table with a unique key and secondary hash indexes.
+
+    Args:
+        name: Table name (for logging/debugging)
+        unique: Columns forming the unique key; inserting a row with an
+            existing key replaces it (upsert semantics)
+        indexes: Column groups to index for find()
+        max_rows: Evict the oldest rows beyond this many (0 = unlimited)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        unique: Optional[Sequence[str]] = None,
+        indexes: Sequence[Sequence[str]] = (),
+        max_rows: int = 0
+    ):
+        self.name = name
+        self.unique = tuple(unique) if unique else None
+        self.max_rows = max_rows
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._seq = 0
+        self._by_unique: Dict[Tuple, int] = {}
+        self._indexes: Dict[Tuple[str, ...], Dict[Tuple, Dict[int, None]]] = {
+            tuple(sorted(fields)): {} for fields in indexes
+        }
+
+    @staticmethod
+    def _key(fields: Tuple[str, ...], row: Dict[str, Any]) -> Tuple:
+        return tuple(row.get(f) for f in fields)
+
+    def _index(self, seq: int, row: Dict[str, Any]) -> None:
+        if self.unique:
+            self._by_unique[self._key(self.unique, row)] = seq
+        for fields, index in self._indexes.items():
+            index.setdefault(self._key(fields, row), {})[seq] = None
+
+    def _unindex(self, seq: int, row: Dict[str, Any]) -> None:
+        if self.unique:
+            self._by_unique.pop(self._key(self.unique, row), None)
+        for fields, index in self._indexes.items():
+            key = self._key(fields, row)
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(seq, None)
+                if not bucket:
+                    del index[key]
+
+    def _remove(self, seq: int) -> Dict[str, Any]:
+        row = self._rows.pop(seq)
+        self._unindex(seq, row)
+        return row
+
+    def insert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a row (replacing any row with the same unique key)."""
+        if self.unique:
+            existing = self._by_unique.get(self._key(self.unique, row))
+            if existing is not None:
+                self._remove(existing)
+
+        self._seq += 1
+        self._rows[self._seq] = row
+        self._index(self._seq, row)
+
+        while self.max_rows and len(self._rows) > self.max_rows:
+            self._remove(next(iter(self._rows)))
+        return row
+
+    def get(self, *key: Any) -> Optional[Dict[str, Any]]:
+        """Look up a row by its unique key."""
+        seq = self._by_unique.get(key)
+        return self._rows[seq] if seq is not None else None
+
+    def find(self, **criteria: Any) -> List[Dict[str, Any]]:
+        """Rows matching all criteria, oldest first (indexed when possible)."""
+        fields = tuple(sorted(criteria))
+        index = self._indexes.get(fields)
+        if index is not None:
+            bucket = index.get(tuple(criteria[f] for f in fields), {})
+            return [self._rows[seq] for seq in bucket]
+        return [r for r in self._rows.values() if all(r.get(f) == v for f, v in criteria.items())]
+
+    def find_latest(self, **criteria: Any) -> Optional[Dict[str, Any]]:
+        """Most recently inserted row matching the criteria."""
+        matches = self.find(**criteria)
+        return matches[-1] if matches else None
+
+    def update(self, key: Tuple, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply changes to the row with the given unique key, keeping indexes current."""
+        seq = self._by_unique.get(key)
+        if seq is None:
+            return None
+        row = self._rows[seq]
+        self._unindex(seq, row)
+        row.update(changes)
+        self._index(seq, row)
+        return row
+
+    def delete(self, *key: Any) -> Optional[Dict[str, Any]]:
+        """Delete the row with the given unique key."""
+        seq = self._by_unique.get(key)
+        return self._remove(seq) if seq is not None else None
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._by_unique.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def values(self) -> List[Dict[str, Any]]:
+        return list(self._rows.values())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._rows.values()))
+
+    def __len__(self) -> int:
+        return len(self._rows)
@@ -0,0 +1,176 @@
+"""
+Content-addressed cache for rendered PDFs.
+
+Keyed by the SHA-256 of the HTML handed to the renderer, so a PDF is reused
+exactly when its rendered template (profile, personalization, date) is
+unchanged. Two tiers:
+  - in-memory LRU bounded by total bytes
+  - on-disk directory bounded by total bytes, oldest-used files evicted first
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def pdf_cache_key(html_content: str) -> str:
+    """Cache key for a rendered HTML document."""
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+
+class PDFCache:
+    """
+    Two-tier PDF byte cache.
+    Disk reads/writes run in a thread so cache lookups never block the loop.
+    """
+
+    def __init__(
+        self,
+        memory_max_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0
+    ):
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir and disk_max_bytes > 0 else None
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        return data
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        if len(data) > self.memory_max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.pdf"
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Touch so size-based eviction drops least recently used files first
+        os.utime(path)
+        return data
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if len(data) > self.disk_max_bytes:
+            return
+        path = self._disk_path(key)
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.disk_dir.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.disk_max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.disk_max_bytes:
+                break
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached PDF bytes, promoting disk hits into memory."""
+        data = self._memory_get(key)
+        if data is None and self.disk_dir is not None:
+            try:
+                data = await asyncio.to_thread(self._disk_get, key)
+            except OSError as e:
+                logger.warning(f"PDF cache disk read failed: {e}")
+                data = None
+            if data is not None:
+                self._memory_put(key, data)
+
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store PDF bytes in both tiers."""
+        self._memory_put(key, data)
+        if self.disk_dir is not None:
+            try:
+                await asyncio.to_thread(self._disk_put, key, data)
+            except OSError as e:
+                logger.warning(f"PDF cache disk write failed: {e}")
+
+
+# Global instance (lazy-loaded)
+_pdf_cache: Optional[PDFCache] = None
+
+
+def get_pdf_cache() -> Optional[PDFCache]:
+    """Get or create the global PDF cache, or None when disabled."""
+    global _pdf_cache
+    if not settings.PDF_CACHE_ENABLED:
+        return None
+    if _pdf_cache is None:
+        _pdf_cache = PDFCache(
+            memory_max_bytes=settings.PDF_CACHE_MEMORY_MB * 1024 * 1024,
+            disk_dir=settings.PDF_CACHE_DIR,
+            disk_max_bytes=settings.PDF_CACHE_DISK_MB * 1024 * 1024
+        )
+        logger.info(
+            f"PDF cache initialized (memory {settings.PDF_CACHE_MEMORY_MB}MB, "
+            f"disk {settings.PDF_CACHE_DISK_MB}MB at {settings.PDF_CACHE_DIR or 'disabled'})"
+        )
+    return _pdf_cache
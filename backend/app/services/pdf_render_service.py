@@ -0,0 +1,216 @@
+"""
+Out-of-process HTML -> PDF rendering for PDFService.
+
+WeasyPrint rendering is CPU-bound and holds the GIL, so running it inside
+the event loop stalls every other request for the length of the render.
+PDFRenderService hands renders to a ProcessPoolExecutor whose workers
+import weasyprint (and load fonts) once at startup, bounds how many renders
+may be queued, and enforces a per-render timeout.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tiny document rendered once per worker so fontconfig caches are warm
+# before the first real request arrives.
+WARMUP_HTML = "<html><body><p>warmup</p></body></html>"
+
+
+class PDFRenderError(Exception):
+    """Render failed in the worker pool (timeout or crashed worker)."""
+    pass
+
+
+class PDFRenderBusyError(PDFRenderError):
+    """Render queue is full; caller should retry later."""
+    pass
+
+
+def render_html_to_pdf(html_content: str) -> bytes:
+    """Render HTML to PDF bytes with weasyprint (runs in a worker process)."""
+    from weasyprint import HTML
+    return HTML(string=html_content).write_pdf()
+
+
+def _warm_worker() -> None:
+    """Worker initializer: pre-import weasyprint and load fonts."""
+    try:
+        render_html_to_pdf(WARMUP_HTML)
+    except Exception:
+        # weasyprint missing or broken; each render will raise and
+        # PDFService falls back to reportlab.
+        pass
+
+
+def _ping() -> bool:
+    """No-op task used to force worker processes to spawn."""
+    return True
+
+
+class PDFRenderService:
+    """
+    Process-pool render service.
+
+    At most `max_workers` renders run at once and at most `max_queue` more
+    wait for a worker; beyond that, render() raises PDFRenderBusyError
+    instead of piling up work the pool cannot finish in time.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout: Optional[float] = None,
+        render_fn: Callable[[str], bytes] = render_html_to_pdf
+    ):
+        self.max_workers = max_workers or settings.PDF_RENDER_WORKERS
+        self.max_queue = settings.PDF_RENDER_MAX_QUEUE if max_queue is None else max_queue
+        self.timeout = timeout or settings.PDF_RENDER_TIMEOUT_SECONDS
+        self.render_fn = render_fn
+        self._slots = asyncio.Semaphore(self.max_workers + self.max_queue)
+        self._in_flight = 0
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that already runs an event loop and
+        # HTTP client threads is not safe.
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker
+        )
+
+    def _recycle_executor(self) -> None:
+        """Replace the pool, killing workers stuck on a timed-out render."""
+        old = self._executor
+        self._executor = self._create_executor()
+        # ProcessPoolExecutor cannot cancel a running task, so terminate
+        # the old workers directly.
+        for process in list((getattr(old, "_processes", None) or {}).values()):
+            process.terminate()
+        old.shutdown(wait=False, cancel_futures=True)
+
+    async def warm_up(self) -> None:
+        """Spawn every worker now instead of on the first renders."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _ping)
+            for _ in range(self.max_workers)
+        ))
+        logger.info(f"PDF render pool warmed ({self.max_workers} workers)")
+
+    @property
+    def queue_depth(self) -> int:
+        """Renders currently running or waiting for a worker."""
+        return self._in_flight
+
+    async def render(self, html_content: str) -> bytes:
+        """
+        Render HTML to PDF in a worker process.
+
+        Args:
+            html_content: HTML string to convert
+
+        Returns:
+            PDF bytes
+
+        Raises:
+            PDFRenderBusyError: Queue is full
+            PDFRenderError: Render timed out or the worker crashed
+            Exception: Whatever render_fn raised in the worker (e.g. ImportError)
+        """
+        if self._slots.locked():
+            raise PDFRenderBusyError(
+                f"PDF render queue full ({self._in_flight} renders in flight)"
+            )
+
+        async with self._slots:
+            self._in_flight += 1
+            try:
+                # One resubmit: a render lost because another render's timeout
+                # retired its pool did nothing wrong and gets a fresh worker.
+                for _ in range(2):
+                    executor = self._executor
+                    result = await self._render_on(executor, html_content)
+                    if result is not None:
+                        return result
+                    logger.warning("PDF render lost to a recycled pool, resubmitting")
+                raise PDFRenderError("PDF render pool was recycled twice during this render")
+            finally:
+                self._in_flight -= 1
+
+    async def _render_on(self, executor: ProcessPoolExecutor, html_content: str) -> Optional[bytes]:
+        """
+        Run one render on `executor`.
+
+        Only the render that observes a fault on the current pool recycles
+        it; renders on a pool that was already retired (terminated workers
+        raise BrokenProcessPool, queued ones are cancelled) return None so
+        the caller can resubmit instead of recycling the fresh pool again.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, self.render_fn, html_content)
+        try:
+            # asyncio.wait (unlike wait_for) leaves the future alone on
+            # timeout, so our own cancellation is the only CancelledError here
+            done, _ = await asyncio.wait({future}, timeout=self.timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        retired = self._executor is not executor
+        if not done:
+            future.cancel()
+            if not retired:
+                logger.error(f"PDF render timed out after {self.timeout}s, recycling pool")
+                self._recycle_executor()
+            raise PDFRenderError(f"PDF render timed out after {self.timeout}s")
+
+        if future.cancelled() or isinstance(future.exception(), BrokenProcessPool):
+            if retired:
+                return None
+            error = "cancelled" if future.cancelled() else future.exception()
+            logger.error(f"PDF render worker crashed: {error}, recycling pool")
+            self._recycle_executor()
+            raise PDFRenderError(f"PDF render worker crashed: {error}")
+
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global instance (created in app.main.lifespan)
+_pdf_renderer: Optional[PDFRenderService] = None
+
+
+async def init_pdf_renderer() -> Optional[PDFRenderService]:
+    """Create and warm the global render pool (no-op when PDF_RENDER_WORKERS=0)."""
+    global _pdf_renderer
+    if _pdf_renderer is None and settings.PDF_RENDER_WORKERS > 0:
+        _pdf_renderer = PDFRenderService()
+        await _pdf_renderer.warm_up()
+    return _pdf_renderer
+
+
+def close_pdf_renderer() -> None:
+    """Shut down and discard the global render pool."""
+    global _pdf_renderer
+    if _pdf_renderer is not None:
+        _pdf_renderer.shutdown()
+        _pdf_renderer = None
+        logger.info("PDF render pool closed")
+
+
+def get_pdf_renderer() -> Optional[PDFRenderService]:
+    """Get the global render pool, or None outside the app lifespan."""
+    return _pdf_renderer
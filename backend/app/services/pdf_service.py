@@ -4,15 +4,23 @@ Uses HTML templates with personalization slots.
 Stores PDFs in Supabase Storage, returns signed URLs.
 """
 
+import asyncio
 import logging
 import io
 import json
 import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from string import Template
 
 from app.config import settings
+from app.services.async_supabase_client import as_async_client
+from app.services.template_engine import CompiledTemplate
+from app.services.pdf_cache import get_pdf_cache, pdf_cache_key
+from app.services.pdf_render_service import (
+    PDFRenderBusyError,
+    get_pdf_renderer,
+    render_html_to_pdf,
+)
 from app.services.ebook_content import (
     EBOOK_SECTIONS,
     CASE_STUDIES,
@@ -31,6 +39,27 @@ MAX_HOOK_LENGTH = 500
 MAX_CASE_STUDY_FRAMING_LENGTH = 400
 MAX_CTA_LENGTH = 350
 
+# Executive review repeated blocks (advantages/risks share the item layout)
+EXECUTIVE_REVIEW_ITEM_HTML = """
+                <div class="review-item">
+                    <div class="item-number">$number</div>
+                    <div class="item-content">
+                        <div class="item-headline">$headline</div>
+                        <div class="item-description">$description</div>
+                    </div>
+                </div>
+            """
+
+EXECUTIVE_REVIEW_RECOMMENDATION_HTML = """
+                <div class="recommendation-item">
+                    <div class="rec-number">$number</div>
+                    <div class="rec-content">
+                        <div class="rec-title">$title</div>
+                        <div class="rec-description">$description</div>
+                    </div>
+                </div>
+            """
+
 
 def truncate_text(text: str, max_length: int) -> str:
     """
@@ -73,6 +102,9 @@ class PDFService:
     - Returns signed URLs for download
     """
 
+    # HTML templates parsed once at import (see compile_templates below)
+    _templates: Dict[str, CompiledTemplate] = {}
+
     def __init__(self, supabase_client=None):
         """
         Initialize PDF service.
@@ -80,7 +112,7 @@ class PDFService:
         Args:
             supabase_client: Optional Supabase client for storage
         """
-        self.supabase = supabase_client
+        self.supabase = as_async_client(supabase_client) if supabase_client else None
         self.storage_bucket = "personalized-pdfs"
         logger.info("PDF service initialized")
 
@@ -104,39 +136,10 @@ class PDFService:
             Dict with pdf_url, storage_path, file_size
         """
         try:
-            # Generate HTML content
-            html_content = self._render_template(profile, intro_hook, cta)
-
-            # Convert to PDF
-            pdf_bytes = await self._html_to_pdf(html_content)
+            rendered = await self.render_ebook(profile, intro_hook=intro_hook, cta=cta)
+            result = await self.store_rendered_pdf(rendered["pdf_bytes"], job_id, profile)
 
-            if not pdf_bytes:
-                raise ValueError("PDF generation returned empty content")
-
-            # Generate unique filename
-            email = profile.get("email", "unknown")
-            filename = self._generate_filename(email, job_id)
-
-            # Store in Supabase Storage (if available)
-            if self.supabase:
-                storage_path, pdf_url = await self._store_pdf(
-                    pdf_bytes, filename
-                )
-            else:
-                # Return base64 for testing
-                import base64
-                storage_path = f"local/{filename}"
-                pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
-
-            result = {
-                "pdf_url": pdf_url,
-                "storage_path": storage_path,
-                "file_size_bytes": len(pdf_bytes),
-                "generated_at": datetime.utcnow().isoformat(),
-                "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat()
-            }
-
-            logger.info(f"Generated PDF for job {job_id}: {len(pdf_bytes)} bytes")
+            logger.info(f"Generated PDF for job {job_id}: {result['file_size_bytes']} bytes")
             return result
 
         except Exception as e:
@@ -163,13 +166,50 @@ class PDFService:
             Dict with pdf_url, storage_path, file_size
         """
         try:
-            user_context = user_context or {}
+            rendered = await self.render_ebook(profile, personalization, user_context)
+            result = await self.store_rendered_pdf(rendered["pdf_bytes"], job_id, profile)
+            result["case_study_used"] = rendered["case_study_used"]
+
+            logger.info(
+                f"Generated AMD ebook for job {job_id}: {result['file_size_bytes']} bytes, "
+                f"case study: {rendered['case_study_used']}"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"AMD ebook generation failed for job {job_id}: {e}")
+            raise
 
-            # Get the appropriate case study based on industry
-            industry = user_context.get("industry_input") or profile.get("industry", "technology")
-            case_study = get_case_study_for_industry(industry)
+    async def render_ebook(
+        self,
+        profile: Dict[str, Any],
+        personalization: Optional[Dict[str, Any]] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        intro_hook: str = "",
+        cta: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Render the ebook PDF once, without storing it.
 
-            # Generate HTML content with AMD ebook template
+        Uses the AMD ebook template when ebook personalization is present,
+        otherwise the legacy intro/CTA template. Callers that both email and
+        store the PDF should pass the same bytes to both.
+
+        Args:
+            profile: Normalized profile data
+            personalization: Dict with personalized_hook, case_study_framing, personalized_cta
+            user_context: User-provided context (goal, persona, industry)
+            intro_hook: Legacy intro hook (used when personalization is empty)
+            cta: Legacy CTA (used when personalization is empty)
+
+        Returns:
+            Dict with pdf_bytes and case_study_used (None for the legacy template)
+        """
+        user_context = user_context or {}
+        case_study = None
+
+        if personalization:
+            case_study = self._get_case_study_for_profile(profile, user_context)
             html_content = self._render_amd_ebook_template(
                 profile=profile,
                 personalized_hook=personalization.get("personalized_hook", ""),
@@ -178,40 +218,66 @@ class PDFService:
                 personalized_cta=personalization.get("personalized_cta", ""),
                 user_context=user_context
             )
+        else:
+            html_content = self._render_template(profile, intro_hook, cta)
 
-            # Convert to PDF
-            pdf_bytes = await self._html_to_pdf(html_content)
+        pdf_bytes = await self._html_to_pdf(html_content)
 
-            if not pdf_bytes:
-                raise ValueError("PDF generation returned empty content")
+        if not pdf_bytes:
+            raise ValueError("PDF generation returned empty content")
 
-            # Generate unique filename
-            email = profile.get("email", "unknown")
-            filename = self._generate_filename(email, job_id)
+        return {
+            "pdf_bytes": pdf_bytes,
+            "case_study_used": case_study["title"] if case_study else None
+        }
 
-            # Store in Supabase Storage (if available)
-            if self.supabase:
-                storage_path, pdf_url = await self._store_pdf(pdf_bytes, filename)
-            else:
-                import base64
-                storage_path = f"local/{filename}"
-                pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
-
-            result = {
-                "pdf_url": pdf_url,
-                "storage_path": storage_path,
-                "file_size_bytes": len(pdf_bytes),
-                "generated_at": datetime.utcnow().isoformat(),
-                "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat(),
-                "case_study_used": case_study["title"]
-            }
+    async def store_rendered_pdf(
+        self,
+        pdf_bytes: bytes,
+        job_id: int,
+        profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Upload an already-rendered PDF and return its storage metadata.
 
-            logger.info(f"Generated AMD ebook for job {job_id}: {len(pdf_bytes)} bytes, case study: {case_study['title']}")
-            return result
+        Args:
+            pdf_bytes: PDF content from render_ebook
+            job_id: Job ID for tracking
+            profile: Normalized profile data (email used in the filename)
 
-        except Exception as e:
-            logger.error(f"AMD ebook generation failed for job {job_id}: {e}")
-            raise
+        Returns:
+            Dict with pdf_url, storage_path, file_size_bytes, generated_at, expires_at
+        """
+        email = profile.get("email", "unknown")
+        filename = self._generate_filename(email, job_id)
+
+        # Store in Supabase Storage (if available)
+        if self.supabase:
+            storage_path, pdf_url = await self._store_pdf(pdf_bytes, filename)
+        else:
+            # Return base64 for testing
+            import base64
+            storage_path = f"local/{filename}"
+            pdf_url = f"data:application/pdf;base64,{base64.b64encode(pdf_bytes).decode()}"
+
+        return {
+            "pdf_url": pdf_url,
+            "storage_path": storage_path,
+            "file_size_bytes": len(pdf_bytes),
+            "generated_at": datetime.utcnow().isoformat(),
+            "expires_at": (datetime.utcnow() + timedelta(hours=PDF_EXPIRY_HOURS)).isoformat()
+        }
+
+    @classmethod
+    def compile_templates(cls) -> None:
+        """Parse every HTML template once, baking in the static EBOOK_SECTIONS copy."""
+        cls._templates = {
+            "amd_ebook": CompiledTemplate(cls._get_amd_ebook_template(), static=EBOOK_SECTIONS),
+            "legacy_ebook": CompiledTemplate(cls._get_ebook_template()),
+            "executive_review": CompiledTemplate(cls._get_executive_review_template()),
+            "executive_review_item": CompiledTemplate(EXECUTIVE_REVIEW_ITEM_HTML),
+            "executive_review_recommendation": CompiledTemplate(EXECUTIVE_REVIEW_RECOMMENDATION_HTML),
+        }
 
     def _render_amd_ebook_template(
         self,
@@ -223,7 +289,6 @@ class PDFService:
         user_context: Dict[str, Any]
     ) -> str:
         """Render AMD ebook HTML template with personalization."""
-        template = Template(self._get_amd_ebook_template())
 
         # Truncate personalized content to fit PDF text boxes
         hook_truncated = truncate_text(personalized_hook, MAX_HOOK_LENGTH)
@@ -250,21 +315,13 @@ class PDFService:
             "case_study_quote": case_study["quote"],
             "case_study_quote_author": case_study["quote_author"],
             "case_study_result": case_study["result"],
-            # Static content
-            "intro_section": EBOOK_SECTIONS["intro_section"],
-            "three_stages_intro": EBOOK_SECTIONS["three_stages_intro"],
-            "leaders_section": EBOOK_SECTIONS["leaders_section"],
-            "challengers_section": EBOOK_SECTIONS["challengers_section"],
-            "observers_section": EBOOK_SECTIONS["observers_section"],
-            "path_to_leadership": EBOOK_SECTIONS["path_to_leadership"],
-            "modernization_models": EBOOK_SECTIONS["modernization_models"],
-            "why_amd": EBOOK_SECTIONS["why_amd"],
-            "assessment_questions": EBOOK_SECTIONS["assessment_questions"],
+            # Static EBOOK_SECTIONS content is baked in at compile time
         }
 
-        return template.safe_substitute(variables)
+        return self._templates["amd_ebook"].render(variables)
 
-    def _get_amd_ebook_template(self) -> str:
+    @staticmethod
+    def _get_amd_ebook_template() -> str:
         """Get the AMD ebook HTML template - matching official AMD design."""
         return '''<!DOCTYPE html>
 <html lang="en">
@@ -1381,8 +1438,6 @@ class PDFService:
         Returns:
             Rendered HTML string
         """
-        template = Template(self._get_ebook_template())
-
         # Prepare template variables
         variables = {
             "first_name": profile.get("first_name", "Reader"),
@@ -1394,9 +1449,10 @@ class PDFService:
             "generated_date": datetime.utcnow().strftime("%B %d, %Y"),
         }
 
-        return template.safe_substitute(variables)
+        return self._templates["legacy_ebook"].render(variables)
 
-    def _get_ebook_template(self) -> str:
+    @staticmethod
+    def _get_ebook_template() -> str:
         """Get the HTML ebook template."""
         return """
 <!DOCTYPE html>
@@ -1592,19 +1648,42 @@ class PDFService:
         Convert HTML to PDF.
 
         Uses weasyprint if available, otherwise uses reportlab with extracted content.
+        Rendering runs off the event loop: in the shared render process pool when
+        the app lifespan has started one, otherwise in a worker thread.
+        Successful weasyprint renders are cached by HTML hash, so an unchanged
+        document is served without re-rendering.
 
         Args:
             html_content: HTML string to convert
 
         Returns:
             PDF bytes
+
+        Raises:
+            PDFRenderBusyError: Render queue is full (caller should return 503)
         """
+        cache = get_pdf_cache()
+        cache_key = pdf_cache_key(html_content) if cache else None
+        if cache:
+            cached = await cache.get(cache_key)
+            if cached:
+                logger.info(f"Serving PDF from render cache ({cache_key[:12]})")
+                return cached
+
         try:
             # Try weasyprint first (preferred for production)
-            from weasyprint import HTML
-            pdf_bytes = HTML(string=html_content).write_pdf()
+            renderer = get_pdf_renderer()
+            if renderer is not None:
+                pdf_bytes = await renderer.render(html_content)
+            else:
+                pdf_bytes = await asyncio.to_thread(render_html_to_pdf, html_content)
             logger.info("Generated PDF using weasyprint")
+            # Only weasyprint output is cached; fallbacks are retried next time
+            if cache:
+                await cache.put(cache_key, pdf_bytes)
             return pdf_bytes
+        except PDFRenderBusyError:
+            raise
         except ImportError:
             logger.warning("weasyprint not available, using reportlab fallback")
         except Exception as e:
@@ -1612,7 +1691,7 @@ class PDFService:
 
         # Fallback: Generate PDF using reportlab with actual content
         try:
-            return self._generate_reportlab_pdf(html_content)
+            return await asyncio.to_thread(self._generate_reportlab_pdf, html_content)
         except Exception as e:
             logger.error(f"reportlab PDF generation failed: {e}")
 
@@ -1884,28 +1963,23 @@ startxref
         storage_path = f"{self.storage_bucket}/{filename}"
 
         # Handle mock mode - return mock URL without actual storage
-        if getattr(self.supabase, 'mock_mode', False) or self.supabase.client is None:
+        if getattr(self.supabase, 'mock_mode', False):
             logger.info(f"[MOCK] Would store PDF at {storage_path}")
             mock_url = f"https://mock-storage.example.com/{storage_path}?token=mock-signed-url"
             return storage_path, mock_url
 
         try:
             # Upload to Supabase Storage
-            self.supabase.client.storage.from_(self.storage_bucket).upload(
-                filename,
-                pdf_bytes,
-                {"content-type": "application/pdf"}
-            )
+            await self.supabase.upload_file(self.storage_bucket, filename, pdf_bytes)
 
             # Generate signed URL
-            signed_url = self.supabase.client.storage.from_(
-                self.storage_bucket
-            ).create_signed_url(
+            signed_url = await self.supabase.create_signed_url(
+                self.storage_bucket,
                 filename,
                 PDF_EXPIRY_HOURS * 3600  # Convert to seconds
             )
 
-            return storage_path, signed_url.get("signedURL", "")
+            return storage_path, signed_url or ""
 
         except Exception as e:
             logger.error(f"Failed to store PDF: {e}")
@@ -1925,18 +1999,16 @@ startxref
             return None
 
         # Handle mock mode
-        if getattr(self.supabase, 'mock_mode', False) or self.supabase.client is None:
+        if getattr(self.supabase, 'mock_mode', False):
             return f"https://mock-storage.example.com/{storage_path}?token=mock-signed-url"
 
         try:
             filename = storage_path.split("/")[-1]
-            signed_url = self.supabase.client.storage.from_(
-                self.storage_bucket
-            ).create_signed_url(
+            return await self.supabase.create_signed_url(
+                self.storage_bucket,
                 filename,
                 PDF_EXPIRY_HOURS * 3600
             )
-            return signed_url.get("signedURL")
         except Exception as e:
             logger.error(f"Failed to get PDF URL: {e}")
             return None
@@ -2103,46 +2175,36 @@ startxref
         case_study = review.get("case_study", "")
         case_study_desc = review.get("case_study_description", "")
 
-        # Build advantages HTML
-        advantages_html = ""
-        for idx, adv in enumerate(advantages, 1):
-            advantages_html += f"""
-                <div class="review-item">
-                    <div class="item-number">{idx:02d}</div>
-                    <div class="item-content">
-                        <div class="item-headline">{adv.get('headline', '')}</div>
-                        <div class="item-description">{adv.get('description', '')}</div>
-                    </div>
-                </div>
-            """
-
-        # Build risks HTML
-        risks_html = ""
-        for idx, risk in enumerate(risks, 1):
-            risks_html += f"""
-                <div class="review-item">
-                    <div class="item-number">{idx:02d}</div>
-                    <div class="item-content">
-                        <div class="item-headline">{risk.get('headline', '')}</div>
-                        <div class="item-description">{risk.get('description', '')}</div>
-                    </div>
-                </div>
-            """
-
-        # Build recommendations HTML
-        recommendations_html = ""
-        for idx, rec in enumerate(recommendations, 1):
-            recommendations_html += f"""
-                <div class="recommendation-item">
-                    <div class="rec-number">{idx}</div>
-                    <div class="rec-content">
-                        <div class="rec-title">{rec.get('title', '')}</div>
-                        <div class="rec-description">{rec.get('description', '')}</div>
-                    </div>
-                </div>
-            """
+        item_template = self._templates["executive_review_item"]
+        rec_template = self._templates["executive_review_recommendation"]
+
+        # Build advantages / risks / recommendations HTML
+        advantages_html = "".join(
+            item_template.render({
+                "number": f"{idx:02d}",
+                "headline": adv.get("headline", ""),
+                "description": adv.get("description", ""),
+            })
+            for idx, adv in enumerate(advantages, 1)
+        )
+        risks_html = "".join(
+            item_template.render({
+                "number": f"{idx:02d}",
+                "headline": risk.get("headline", ""),
+                "description": risk.get("description", ""),
+            })
+            for idx, risk in enumerate(risks, 1)
+        )
+        recommendations_html = "".join(
+            rec_template.render({
+                "number": idx,
+                "title": rec.get("title", ""),
+                "description": rec.get("description", ""),
+            })
+            for idx, rec in enumerate(recommendations, 1)
+        )
 
-        # Build conditional HTML separately to avoid nested f-string issues
+        # Build conditional HTML
         stage_sidebar_html = f'<div class="stage-sidebar">{stage_sidebar}</div>' if stage_sidebar else ''
         case_study_html = ""
         if case_study:
@@ -2154,82 +2216,95 @@ startxref
                 '</div>'
             )
 
-        # Return full HTML template
-        return f'''<!DOCTYPE html>
+        return self._templates["executive_review"].render({
+            "company_name": company_name,
+            "stage": stage,
+            "stage_sidebar_html": stage_sidebar_html,
+            "advantages_html": advantages_html,
+            "risks_html": risks_html,
+            "recommendations_html": recommendations_html,
+            "case_study_html": case_study_html,
+            "generated_date": datetime.utcnow().strftime("%B %d, %Y"),
+        })
+
+    @staticmethod
+    def _get_executive_review_template() -> str:
+        """Get the executive review HTML template (AMD 2-page assessment)."""
+        return '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AMD Executive Review - {company_name}</title>
+    <title>AMD Executive Review - $company_name</title>
     <link href="https://fonts.googleapis.com/css2?family=Roboto+Condensed:wght@400;500;600;700;800&family=Source+Sans+3:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <style>
-        @page {{
+        @page {
             size: letter;
             margin: 0.75in;
-        }}
+        }
 
-        * {{
+        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Source Sans 3', 'Helvetica Neue', Arial, sans-serif;
             line-height: 1.6;
             color: #2d3748;
             background: white;
             font-size: 10pt;
-        }}
+        }
 
-        h1, h2, h3 {{
+        h1, h2, h3 {
             font-family: 'Roboto Condensed', Arial, sans-serif;
             color: #1a202c;
-        }}
+        }
 
         /* Header */
-        .header {{
+        .header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 30px;
             padding-bottom: 15px;
             border-bottom: 2px solid #00c8aa;
-        }}
+        }
 
-        .amd-logo {{
+        .amd-logo {
             font-family: 'Gill Sans', 'Helvetica Neue', Arial, sans-serif;
             font-size: 28px;
             font-weight: 700;
             color: #ed1c24;
-        }}
+        }
 
-        .doc-title {{
+        .doc-title {
             font-size: 12px;
             color: #718096;
             text-align: right;
-        }}
+        }
 
         /* Cover Section */
-        .cover {{
+        .cover {
             margin-bottom: 40px;
-        }}
+        }
 
-        .cover-title {{
+        .cover-title {
             font-size: 28px;
             font-weight: 800;
             margin-bottom: 10px;
             color: #1a202c;
-        }}
+        }
 
-        .cover-subtitle {{
+        .cover-subtitle {
             font-size: 14px;
             color: #00c8aa;
             font-weight: 600;
             margin-bottom: 20px;
-        }}
+        }
 
-        .company-badge {{
+        .company-badge {
             display: inline-block;
             padding: 8px 16px;
             background: rgba(0, 200, 170, 0.1);
@@ -2237,10 +2312,10 @@ startxref
             border-radius: 6px;
             font-weight: 600;
             color: #00c8aa;
-        }}
+        }
 
         /* Stage Badge */
-        .stage-badge {{
+        .stage-badge {
             display: inline-block;
             padding: 6px 14px;
             background: #00c8aa;
@@ -2251,9 +2326,9 @@ startxref
             text-transform: uppercase;
             letter-spacing: 1px;
             margin: 15px 0;
-        }}
+        }
 
-        .stage-sidebar {{
+        .stage-sidebar {
             background: #f7fafc;
             border-left: 4px solid #00c8aa;
             padding: 15px 20px;
@@ -2261,53 +2336,53 @@ startxref
             font-size: 11px;
             color: #4a5568;
             font-style: italic;
-        }}
+        }
 
         /* Section Headings */
-        .section-heading {{
+        .section-heading {
             font-size: 18px;
             font-weight: 800;
             color: #1a202c;
             margin: 30px 0 20px 0;
             padding-bottom: 8px;
             border-bottom: 2px solid #e2e8f0;
-        }}
+        }
 
         /* Review Items (Advantages & Risks) */
-        .review-item {{
+        .review-item {
             display: flex;
             gap: 15px;
             margin-bottom: 20px;
             page-break-inside: avoid;
-        }}
+        }
 
-        .item-number {{
+        .item-number {
             font-size: 28px;
             font-weight: 300;
             color: #00c8aa;
             min-width: 40px;
             line-height: 1;
-        }}
+        }
 
-        .item-content {{
+        .item-content {
             flex: 1;
-        }}
+        }
 
-        .item-headline {{
+        .item-headline {
             font-size: 12px;
             font-weight: 700;
             color: #1a202c;
             margin-bottom: 6px;
-        }}
+        }
 
-        .item-description {{
+        .item-description {
             font-size: 10px;
             color: #4a5568;
             line-height: 1.6;
-        }}
+        }
 
         /* Recommendations */
-        .recommendation-item {{
+        .recommendation-item {
             display: flex;
             gap: 12px;
             margin-bottom: 18px;
@@ -2315,9 +2390,9 @@ startxref
             background: #f7fafc;
             border-radius: 8px;
             page-break-inside: avoid;
-        }}
+        }
 
-        .rec-number {{
+        .rec-number {
             width: 30px;
             height: 30px;
             background: #00c8aa;
@@ -2329,71 +2404,71 @@ startxref
             font-weight: 700;
             font-size: 14px;
             flex-shrink: 0;
-        }}
+        }
 
-        .rec-content {{
+        .rec-content {
             flex: 1;
-        }}
+        }
 
-        .rec-title {{
+        .rec-title {
             font-size: 11px;
             font-weight: 700;
             color: #1a202c;
             margin-bottom: 6px;
-        }}
+        }
 
-        .rec-description {{
+        .rec-description {
             font-size: 10px;
             color: #4a5568;
             line-height: 1.6;
-        }}
+        }
 
         /* Case Study Box */
-        .case-study-box {{
+        .case-study-box {
             background: linear-gradient(135deg, rgba(0, 200, 170, 0.1) 0%, rgba(0, 200, 170, 0.05) 100%);
             border: 1px solid #00c8aa;
             border-radius: 10px;
             padding: 20px;
             margin: 25px 0;
             page-break-inside: avoid;
-        }}
+        }
 
-        .case-study-label {{
+        .case-study-label {
             font-size: 9px;
             color: #00c8aa;
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 1.5px;
             margin-bottom: 8px;
-        }}
+        }
 
-        .case-study-title {{
+        .case-study-title {
             font-size: 13px;
             font-weight: 700;
             color: #1a202c;
             margin-bottom: 8px;
-        }}
+        }
 
-        .case-study-description {{
+        .case-study-description {
             font-size: 10px;
             color: #4a5568;
             line-height: 1.6;
-        }}
+        }
 
         /* Footer */
-        .footer {{
+        .footer {
             margin-top: 40px;
             padding-top: 15px;
             border-top: 1px solid #e2e8f0;
             font-size: 9px;
             color: #a0aec0;
             text-align: center;
-        }}
+        }
 
         /* Page Break Control */
-        .page-break {{
+        .page-break {
             page-break-after: always;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -2405,27 +2480,30 @@ startxref
     <div class="cover">
         <div class="cover-title">Data Center Modernization Assessment</div>
         <div class="cover-subtitle">Executive Review</div>
-        <div class="company-badge">{company_name}</div>
-        <div class="stage-badge">{stage}</div>
-        {stage_sidebar_html}
+        <div class="company-badge">$company_name</div>
+        <div class="stage-badge">$stage</div>
+        $stage_sidebar_html
     </div>
 
     <h2 class="section-heading">Strategic Advantages</h2>
-    {advantages_html}
+    $advantages_html
 
     <h2 class="section-heading">Risks to Manage</h2>
-    {risks_html}
+    $risks_html
 
     <div class="page-break"></div>
 
     <h2 class="section-heading">Recommended Next Steps</h2>
-    {recommendations_html}
+    $recommendations_html
 
-    {case_study_html}
+    $case_study_html
 
     <div class="footer">
-        <p>Generated by AMD Data Center Modernization Engine | {datetime.utcnow().strftime("%B %d, %Y")}</p>
+        <p>Generated by AMD Data Center Modernization Engine | $generated_date</p>
         <p>&copy; 2026 Advanced Micro Devices, Inc. All rights reserved.</p>
     </div>
 </body>
 </html>'''
+
+
+PDFService.compile_templates()
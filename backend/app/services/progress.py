@@ -0,0 +1,80 @@
+"""
+Progress events for streaming endpoints.
+
+Long-running work (enrichment, executive review) reports milestones through
+a ProgressCallback. The /stream route variants run the work as a task and
+relay each event to the client as Server-Sent Events, ending with a
+"result" (or "error") event carrying the same payload the plain endpoint
+would return.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# progress(event_name, data) - must not block; called from inside the work
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+_DONE = object()
+
+
+def emit(progress: Optional[ProgressCallback], event: str, data: Dict[str, Any]) -> None:
+    """Report a progress event if anyone is listening (errors never break the work)."""
+    if progress is None:
+        return
+    try:
+        progress(event, data)
+    except Exception as e:
+        logger.warning(f"Progress callback failed for '{event}': {e}")
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_progress(
+    run: Callable[[ProgressCallback], Awaitable[Dict[str, Any]]],
+    error_message: Callable[[Exception], str] = str
+) -> AsyncIterator[str]:
+    """
+    Run `run(progress)` and yield its progress events as SSE.
+
+    Args:
+        run: Coroutine function doing the work; receives the progress callback
+            and returns the final payload
+        error_message: Turns a failure into the "error" event's detail
+
+    Yields:
+        SSE-encoded events, then a final "result" or "error" event
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def progress(event: str, data: Dict[str, Any]) -> None:
+        queue.put_nowait((event, data))
+
+    task = asyncio.ensure_future(run(progress))
+    task.add_done_callback(lambda _: queue.put_nowait(_DONE))
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            yield format_sse(*item)
+
+        if task.cancelled():
+            yield format_sse("error", {"detail": "cancelled"})
+        elif task.exception() is not None:
+            exc = task.exception()
+            logger.error(f"Streamed request failed: {type(exc).__name__}: {exc}")
+            yield format_sse("error", {"detail": error_message(exc)})
+        else:
+            yield format_sse("result", task.result())
+    finally:
+        # Client went away mid-stream: stop the work it was waiting for
+        if not task.done():
+            task.cancel()
@@ -8,10 +8,17 @@ RAD Orchestrator: Coordinates enrichment workflow.
 import logging
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Awaitable, Callable, Optional, List, Tuple, Union
 
 from app.config import settings
+from app.services.async_supabase_client import AsyncSupabaseClient, as_async_client
+from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.services.progress import ProgressCallback, emit
 from app.services.supabase_client import SupabaseClient
+from app.services.enrichment_cache import EnrichmentCache
+from app.services.raw_data_writer import get_raw_data_writer
+from app.services.rate_limiter import get_rate_limiter
+from app.services.single_flight import SingleFlight
 from app.services.enrichment_apis import (
     get_enrichment_apis,
     EnrichmentAPIError,
@@ -103,6 +110,38 @@ INDUSTRY_NORMALIZATION = {
     "accounting": "professional_services",
 }
 
+# Concurrent enrichments of the same email/domain share vendor calls
+_inflight_fetches = SingleFlight("rad_orchestrator")
+
+
+def _is_outage(error: Exception) -> Optional[bool]:
+    """
+    Whether a failed vendor call points at the vendor being down.
+
+    Returns:
+        True for timeouts, connection errors and 5xx responses; False for
+        other 4xx (the vendor answered); None for 429s, which are usually
+        our own rate limiter refusing the call before it was made
+    """
+    if not isinstance(error, EnrichmentAPIError) or error.status_code is None:
+        return True
+    if error.status_code == 429:
+        return None
+    return error.status_code >= 500
+
+
+def _gnews_outage(result: Dict[str, Any]) -> Optional[bool]:
+    """
+    GNews reports per-query failures in _query_stats instead of raising.
+    Calls refused by our own rate limiter or quota ledger never reached the
+    vendor, so they say nothing about its health.
+    """
+    if result.get("_quota_exhausted") or result.get("_rate_limited"):
+        return None
+    stats = result.get("_query_stats") or {}
+    return stats.get("failed", 0) > 0 and stats.get("succeeded", 0) == 0
+
+
 # Field importance tiers for completeness report
 CRITICAL_FIELDS = ["company_name", "industry", "title", "employee_count"]
 IMPORTANT_FIELDS = ["company_summary", "founded_year", "seniority", "recent_news"]
@@ -111,6 +150,12 @@ NICE_TO_HAVE_FIELDS = [
     "latest_funding_stage", "company_tags", "news_themes",
 ]
 
+# Profile fields included in streamed per-source progress events
+PREVIEW_FIELDS = [
+    "first_name", "last_name", "title", "seniority", "company_name",
+    "industry", "employee_count", "company_summary", "recent_news",
+]
+
 
 class RADOrchestrator:
     """
@@ -118,24 +163,41 @@ class RADOrchestrator:
     Fetches from multiple APIs in parallel, merges data with conflict resolution.
     """
 
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(
+        self,
+        supabase_client: Union[AsyncSupabaseClient, SupabaseClient],
+        progress: Optional[ProgressCallback] = None
+    ):
         """
         Initialize orchestrator.
 
         Args:
-            supabase_client: Supabase data access layer
+            supabase_client: Supabase data access layer (a sync client is
+                adapted to the async one)
+            progress: Optional callback receiving a "source" event as each
+                source resolves (used by the streaming endpoints)
         """
-        self.supabase = supabase_client
+        self.supabase = as_async_client(supabase_client)
+        self.progress = progress
+        self._resolved_so_far: Dict[str, Dict[str, Any]] = {}
         self.data_sources: List[str] = []
+        self.cached_sources: List[str] = []
+        self.timed_out_sources: List[str] = []
         self.apis = get_enrichment_apis()
         self.rss_fetcher = GoogleNewsRSSFetcher()
+        self.cache = EnrichmentCache(self.supabase)
+        self.use_cache = True
+        # (domain, news cache record) already read by _start_speculative_news
+        self._news_cache_lookup: Optional[Tuple[str, Optional[Dict[str, Any]]]] = None
 
     async def enrich(
         self,
         email: str,
         domain: Optional[str] = None,
         job_id: Optional[int] = None,
-        user_company: Optional[str] = None
+        user_company: Optional[str] = None,
+        budget_seconds: Optional[float] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Execute full enrichment pipeline for an email.
@@ -151,6 +213,11 @@ class RADOrchestrator:
             domain: Company domain (optional, extracted from email if not provided)
             job_id: Optional job ID for tracking
             user_company: User-provided company name (highest priority for resolution)
+            budget_seconds: Latency budget for fetching; sources still pending
+                when it runs out are dropped and listed in
+                completeness_report["timed_out_sources"] (None = wait for all)
+            use_cache: False to skip cached vendor and news responses and
+                call every source again (fresh results are still cached)
 
         Returns:
             Normalized profile dict with metadata
@@ -158,22 +225,33 @@ class RADOrchestrator:
         try:
             logger.info(f"Starting enrichment for {email}")
             self.data_sources = []
+            self.cached_sources = []
+            self.timed_out_sources = []
+            self._resolved_so_far = {}
+            self.use_cache = use_cache
+            self._news_cache_lookup = None
+            deadline = (
+                asyncio.get_running_loop().time() + budget_seconds if budget_seconds else None
+            )
 
             # Extract domain from email if not provided
             if not domain:
                 domain = email.split("@")[1]
 
             # Step 1: Fetch raw data from all APIs in parallel
-            raw_data = await self._fetch_all_sources(email, domain, user_company=user_company)
+            raw_data = await self._fetch_all_sources(
+                email, domain, user_company=user_company, deadline=deadline
+            )
 
             # Step 2: Store raw data in Supabase (non-fatal - continue even if storage fails)
+            # Cache hits are already persisted; re-storing would reset their TTL
+            rows = []
             for source, data in raw_data.items():
                 if data and not data.get("_error"):
-                    try:
-                        self.supabase.store_raw_data(email, source, data)
-                    except Exception as storage_err:
-                        logger.warning(f"Failed to store raw data for {source}: {storage_err} - continuing anyway")
+                    if source not in self.cached_sources:
+                        rows.append({"email": email, "source": source, "payload": data})
                     self.data_sources.append(source)
+            await self._store_raw_rows(rows)
 
             # Step 3: Apply resolution logic
             normalized = self._resolve_profile(email, domain, raw_data)
@@ -183,8 +261,17 @@ class RADOrchestrator:
             normalized["domain"] = domain
             normalized["resolved_at"] = datetime.utcnow().isoformat()
             normalized["data_sources"] = self.data_sources
+            normalized["cached_sources"] = self.cached_sources
             normalized["data_quality_score"] = self._calculate_quality_score(raw_data)
             normalized["completeness_report"] = self._build_completeness_report(normalized)
+            normalized["completeness_report"]["timed_out_sources"] = list(self.timed_out_sources)
+            emit(self.progress, "enrichment", {
+                "data_sources": self.data_sources,
+                "cached_sources": self.cached_sources,
+                "data_quality_score": normalized["data_quality_score"],
+                "completeness_report": normalized["completeness_report"],
+                "profile": {f: normalized[f] for f in PREVIEW_FIELDS if normalized.get(f) is not None},
+            })
 
             logger.info(f"Enrichment complete for {email}: {len(self.data_sources)} sources")
             return normalized
@@ -197,7 +284,8 @@ class RADOrchestrator:
         self,
         email: str,
         domain: str,
-        user_company: Optional[str] = None
+        user_company: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Fetch data from all sources in two phases.
@@ -211,46 +299,288 @@ class RADOrchestrator:
             email: Email address
             domain: Company domain
             user_company: User-provided company name (highest priority)
+            deadline: Event-loop time by which fetching must finish
+                (see _fetch_within_deadline); None waits for every source
 
         Returns:
             Dict mapping source name to response data
         """
         # Phase 1: Person data + company data in parallel
-        phase1_tasks = [
-            self._fetch_with_fallback("apollo", email, domain),
-            self._fetch_with_fallback("pdl", email, domain),
-            self._fetch_with_fallback("hunter", email, domain),
-            self._fetch_with_fallback("zoominfo", email, domain),
-            self._fetch_pdl_company(domain),
-        ]
-
-        results = await asyncio.gather(*phase1_tasks, return_exceptions=True)
-
-        raw_data = {}
-        source_names = ["apollo", "pdl", "hunter", "zoominfo", "pdl_company"]
-
-        for source_name, result in zip(source_names, results):
-            if isinstance(result, Exception):
-                logger.warning(f"{source_name} failed: {result}")
-                raw_data[source_name] = {"_error": str(result)}
-            else:
-                raw_data[source_name] = result
+        phase1 = {
+            "apollo": self._fetch_with_fallback("apollo", email, domain),
+            "pdl": self._fetch_with_fallback("pdl", email, domain),
+            "hunter": self._fetch_with_fallback("hunter", email, domain),
+            "zoominfo": self._fetch_with_fallback("zoominfo", email, domain),
+            "pdl_company": self._fetch_pdl_company(domain),
+        }
+        phase1 = {
+            source: self._settle(source, coro, email, domain) for source, coro in phase1.items()
+        }
+
+        if deadline is not None:
+            return await self._fetch_within_deadline(email, domain, user_company, phase1, deadline)
+
+        phase1_tasks = [asyncio.ensure_future(coro) for coro in phase1.values()]
+        speculative = await self._start_speculative_news(email, domain, user_company)
+        results = await asyncio.gather(*phase1_tasks)
+
+        raw_data = dict(zip(phase1, results))
 
         # Phase 2: GNews with resolved company name from Phase 1
         # User-provided company name takes highest priority
         resolved_name = self._resolve_company_name(raw_data, domain, user_company=user_company)
         logger.info(f"Resolved company name for GNews: '{resolved_name}' (domain: {domain}, user_company: '{user_company}')")
-        raw_data["gnews"] = await self._fetch_gnews_with_name(email, domain, resolved_name)
+        if speculative and speculative[0].lower() == resolved_name.lower():
+            news = speculative[1]
+        else:
+            if speculative:
+                logger.info(f"Discarding news prefetched for '{speculative[0]}'")
+                speculative[1].cancel()
+            news = self._fetch_gnews_with_name(email, domain, resolved_name)
+        raw_data["gnews"] = await self._settle("gnews", news, email, domain)
+
+        return raw_data
+
+    async def _start_speculative_news(
+        self,
+        email: str,
+        domain: str,
+        user_company: Optional[str]
+    ) -> Optional[Tuple[str, asyncio.Future]]:
+        """
+        Start the news fetch alongside Phase 1 when the company name is known up front.
+
+        The name is known when the user typed it (it always wins resolution)
+        or when the domain's news cache is fresh (the fetch is then a cache
+        read whatever name Phase 1 resolves). That cache lookup is kept for
+        _fetch_news_layers, so the news cache is read once per enrichment.
+
+        Returns:
+            (company name, news task), or None when no confident name exists
+        """
+        name = user_company.strip() if user_company and user_company.strip() else None
+        if name is None and self.use_cache:
+            try:
+                cached = await self.supabase.get_cached_news(domain)
+            except Exception as e:
+                logger.warning(f"News cache lookup failed for {domain}: {e}")
+                cached = None
+            else:
+                self._news_cache_lookup = (domain, cached)
+            name = ((cached or {}).get("payload") or {}).get("company_name")
+        if not name:
+            return None
+
+        logger.info(f"Prefetching news for '{name}' alongside Phase 1 (domain: {domain})")
+        return name, asyncio.ensure_future(self._fetch_gnews_with_name(email, domain, name))
+
+    async def _fetch_within_deadline(
+        self,
+        email: str,
+        domain: str,
+        user_company: Optional[str],
+        phase1: Dict[str, Awaitable[Dict[str, Any]]],
+        deadline: float
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Deadline-driven variant of _fetch_all_sources.
+
+        Phase 2 (GNews) starts as soon as a trusted company name is known
+        (prefetched up front, or PDL Company / Apollo) instead of after the
+        slowest Phase 1 vendor. Sources still pending at the deadline are cancelled,
+        recorded in self.timed_out_sources and returned as errors. Their
+        shared single-flight fetch keeps running, so the result still lands
+        in the enrichment cache for the next request.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = {asyncio.ensure_future(coro): source for source, coro in phase1.items()}
+        pending = set(tasks)
+        raw_data: Dict[str, Dict[str, Any]] = {}
+        news_task: Optional[asyncio.Future] = None
+
+        def start_news() -> asyncio.Future:
+            name = self._resolve_company_name(raw_data, domain, user_company=user_company)
+            logger.info(f"Resolved company name for GNews: '{name}' (domain: {domain}, user_company: '{user_company}')")
+            return asyncio.ensure_future(
+                self._settle("gnews", self._fetch_gnews_with_name(email, domain, name), email, domain)
+            )
+
+        try:
+            speculative = await self._start_speculative_news(email, domain, user_company)
+            if speculative:
+                news_task = asyncio.ensure_future(self._settle("gnews", speculative[1], email, domain))
+
+            while pending and loop.time() < deadline:
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    raw_data[tasks[task]] = task.result()
+                if news_task is None and self._has_trusted_company_name(raw_data):
+                    news_task = start_news()
+
+            if news_task is None and loop.time() < deadline:
+                news_task = start_news()
+
+            if news_task is not None:
+                await asyncio.wait({news_task}, timeout=max(0.0, deadline - loop.time()))
+                if news_task.done():
+                    raw_data["gnews"] = news_task.result()
+        finally:
+            leftover = [t for t in list(tasks) + [news_task] if t is not None and not t.done()]
+            for task in leftover:
+                task.cancel()
+            if leftover:
+                await asyncio.gather(*leftover, return_exceptions=True)
+
+        for source in list(phase1) + ["gnews"]:
+            if source not in raw_data:
+                logger.warning(f"{source} did not finish within the enrichment budget for {email}")
+                self.timed_out_sources.append(source)
+                raw_data[source] = {"_error": "Enrichment deadline exceeded", "_timed_out": True}
+                self._report_source(source, raw_data[source], email, domain)
 
         return raw_data
 
+    async def _settle(
+        self,
+        source: str,
+        fetch: Awaitable[Dict[str, Any]],
+        email: str,
+        domain: str
+    ) -> Dict[str, Any]:
+        """Await one source's fetch, turning a failure into an _error entry and reporting it."""
+        try:
+            result = await fetch
+        except Exception as e:
+            logger.warning(f"{source} failed: {e}")
+            result = {"_error": str(e)}
+        self._report_source(source, result, email, domain)
+        return result
+
+    def _report_source(self, source: str, result: Dict[str, Any], email: str, domain: str) -> None:
+        """Send a "source" progress event with the profile resolved so far."""
+        if self.progress is None:
+            return
+        self._resolved_so_far[source] = result
+        if result.get("_timed_out"):
+            status = "timed_out"
+        elif result.get("_error"):
+            status = "error"
+        elif source in self.cached_sources:
+            status = "cached"
+        else:
+            status = "ok"
+
+        profile = self._resolve_profile(email, domain, self._resolved_so_far)
+        emit(self.progress, "source", {
+            "source": source,
+            "status": status,
+            "error": result.get("_error"),
+            "profile": {f: profile[f] for f in PREVIEW_FIELDS if profile.get(f) is not None},
+        })
+
+    def _has_trusted_company_name(self, raw_data: Dict[str, Dict[str, Any]]) -> bool:
+        """Whether PDL Company or Apollo has already returned a real company name."""
+        pdl_company = raw_data.get("pdl_company") or {}
+        if not pdl_company.get("_error") and not pdl_company.get("_mock"):
+            if pdl_company.get("display_name") or pdl_company.get("name"):
+                return True
+
+        apollo = raw_data.get("apollo") or {}
+        if not apollo.get("_error") and not apollo.get("_mock"):
+            return bool(apollo.get("company_name"))
+        return False
+
+    async def _store_raw_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Persist raw vendor responses in one multi-row insert.
+
+        Inside the app the background writer takes the rows and the response
+        does not wait on Supabase; elsewhere (scripts, tests) they are written inline.
+        """
+        if not rows:
+            return
+
+        writer = get_raw_data_writer()
+        if writer is not None:
+            writer.submit(rows)
+            return
+
+        try:
+            await self.supabase.store_raw_data_many(rows)
+        except Exception as storage_err:
+            logger.warning(f"Failed to store raw data: {storage_err} - continuing anyway")
+
+    async def _call_source(
+        self,
+        source: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        result_outage: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call a vendor through its circuit breaker.
+
+        Args:
+            source: Breaker name (one per enrichment source)
+            call: Zero-argument coroutine function performing the vendor call
+            result_outage: Optional check for vendors that report failure in
+                the response instead of raising (True = outage, None = neutral)
+
+        Returns:
+            The vendor response
+
+        Raises:
+            CircuitOpenError: The source's circuit is open
+        """
+        breaker = get_circuit_breaker(source)
+        breaker.before_call()
+        try:
+            result = await call()
+        except Exception as e:
+            outage = _is_outage(e)
+            if outage:
+                breaker.record_failure(e)
+            elif outage is None:
+                breaker.release()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+
+        outage = result_outage(result) if result_outage else False
+        if outage:
+            breaker.record_failure("all requests failed")
+        elif outage is None:
+            breaker.release()
+        else:
+            breaker.record_success()
+        return result
+
     async def _fetch_pdl_company(self, domain: str) -> Dict[str, Any]:
         """Fetch PDL Company data in Phase 1 (parallel with person APIs)."""
+        cached = await self.cache.get("pdl_company", "", domain) if self.use_cache else None
+        if cached is not None:
+            self.cached_sources.append("pdl_company")
+            return cached
+
         try:
             pdl_api = self.apis.get("pdl")
             if pdl_api and hasattr(pdl_api, 'enrich_company'):
-                return await pdl_api.enrich_company(domain)
+                async def fetch():
+                    result = await self._call_source(
+                        "pdl_company", lambda: pdl_api.enrich_company(domain)
+                    )
+                    await self.cache.put("pdl_company", "", domain, result)
+                    return result
+
+                return await _inflight_fetches.do(f"pdl_company:{domain}", fetch)
             return {"_error": "PDL company enrichment not available"}
+        except CircuitOpenError as e:
+            logger.info(f"Skipping PDL company enrichment: {e}")
+            return {"_error": str(e), "_circuit_open": True}
         except Exception as e:
             logger.warning(f"PDL company enrichment failed: {e}")
             return {"_error": str(e)}
@@ -322,19 +652,51 @@ class RADOrchestrator:
         2. Try GNews API
         3. Fall back to Google News RSS (free, no API key) if GNews fails
         Cache results from any source.
+
+        Concurrent requests for the same domain and company name share a
+        single fetch, so a campaign burst spends one GNews call per company.
         """
-        # Layer 1: Check cache
-        cached = self.supabase.get_cached_news(domain)
+        flight_key = f"news:{domain}:{company_name.lower()}"
+        if not self.use_cache:
+            # Don't join a lookup that may be answered from the cache
+            flight_key += ":refresh"
+        return await _inflight_fetches.do(
+            flight_key,
+            lambda: self._fetch_news_layers(email, domain, company_name)
+        )
+
+    async def _fetch_news_layers(
+        self,
+        email: str,
+        domain: str,
+        company_name: str
+    ) -> Dict[str, Any]:
+        """Run the cache -> GNews -> RSS news lookup (see _fetch_gnews_with_name)."""
+        # Layer 1: Check cache (reusing the lookup _start_speculative_news made, if any)
+        if self._news_cache_lookup is not None and self._news_cache_lookup[0] == domain:
+            cached = self._news_cache_lookup[1]
+        else:
+            cached = await self.supabase.get_cached_news(domain) if self.use_cache else None
         if cached and cached.get("payload"):
             logger.info(f"News cache HIT for {domain} — skipping API calls")
             return cached["payload"]
 
-        # Layer 2: Try GNews API
+        # Layer 2: Try GNews API (skipped outright once today's quota is known spent)
         result = None
         gnews_api = self.apis.get("gnews")
-        if gnews_api:
+        if gnews_api and get_rate_limiter().quota_exhausted("gnews"):
+            logger.info(f"GNews daily quota exhausted — skipping straight to RSS for {company_name}")
+            result = {"result_count": 0, "_quota_exhausted": True}
+        elif gnews_api:
             try:
-                result = await gnews_api.enrich_with_name(email, domain, company_name)
+                result = await self._call_source(
+                    "gnews",
+                    lambda: gnews_api.enrich_with_name(email, domain, company_name),
+                    result_outage=_gnews_outage
+                )
+            except CircuitOpenError as e:
+                logger.info(f"Skipping GNews: {e}")
+                result = {"_error": str(e), "_circuit_open": True}
             except EnrichmentAPIError as e:
                 logger.warning(f"GNews API error: {e}")
                 result = {"_error": str(e)}
@@ -374,7 +736,7 @@ class RADOrchestrator:
         # Cache the result (even empty results avoid re-querying)
         if result and not result.get("_error"):
             try:
-                self.supabase.store_news_cache(domain, result)
+                await self.supabase.store_news_cache(domain, result)
                 logger.info(f"News result cached for {domain}")
             except Exception as cache_err:
                 logger.warning(f"Failed to cache news result for {domain}: {cache_err}")
@@ -389,6 +751,7 @@ class RADOrchestrator:
     ) -> Dict[str, Any]:
         """
         Fetch from a single source with error handling.
+        Serves a fresh cached response instead of calling the API when available.
 
         Args:
             source: Source name
@@ -402,8 +765,23 @@ class RADOrchestrator:
         if not api:
             return {"_error": f"Unknown source: {source}"}
 
+        # Person sources are cached by email, company sources by domain
+        cached = await self.cache.get(source, email, domain) if self.use_cache else None
+        if cached is not None:
+            self.cached_sources.append(source)
+            return cached
+
+        async def fetch():
+            result = await self._call_source(source, lambda: api.enrich(email, domain))
+            await self.cache.put(source, email, domain, result)
+            return result
+
         try:
-            return await api.enrich(email, domain)
+            flight_key = self.cache.cache_key(source, email, domain) or email
+            return await _inflight_fetches.do(f"{source}:{flight_key}", fetch)
+        except CircuitOpenError as e:
+            logger.info(f"Skipping {source}: {e}")
+            return {"_error": str(e), "_circuit_open": True}
         except EnrichmentAPIError as e:
             logger.warning(f"{source} API error: {e}")
             return {"_error": str(e)}
@@ -0,0 +1,220 @@
+"""
+Per-vendor rate limiting for enrichment APIs.
+
+Two layers:
+  - a token bucket per vendor (in-process), smoothing bursts to the
+    vendor's requests-per-second limit
+  - a daily quota ledger persisted in Supabase (api_quota_usage), shared by
+    every worker, so a vendor with a hard daily cap (GNews free tier:
+    100 requests/day) is skipped up front once the day's quota is spent
+    instead of paying a round-trip for a guaranteed 403
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.config import settings
+from app.services.async_supabase_client import AsyncSupabaseClient, get_async_supabase_client
+
+logger = logging.getLogger(__name__)
+
+# Requests per second, burst size and daily quota (None = no daily cap) per vendor.
+# GNews is charged per query and every news fetch sends two, so its bucket
+# holds several fetches and refills one fetch per second.
+VENDOR_RATE_LIMITS = {
+    "apollo": {"rate_per_second": 5.0, "burst": 10, "daily_quota": None},
+    "pdl": {"rate_per_second": 10.0, "burst": 10, "daily_quota": None},
+    "hunter": {"rate_per_second": 10.0, "burst": 10, "daily_quota": None},
+    "zoominfo": {"rate_per_second": 5.0, "burst": 5, "daily_quota": None},
+    "gnews": {"rate_per_second": 2.0, "burst": 10, "daily_quota": settings.GNEWS_DAILY_QUOTA},
+}
+
+
+class VendorLimitError(Exception):
+    """Raised when a vendor call is refused by the rate limiter or quota ledger."""
+
+    def __init__(self, vendor: str, message: str, quota_exhausted: bool = False):
+        self.vendor = vendor
+        self.quota_exhausted = quota_exhausted
+        super().__init__(f"{vendor}: {message}")
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second, holding at most `capacity`.
+
+    Args:
+        rate: Refill rate in tokens per second
+        capacity: Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self, tokens: float = 1) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            0 if taken, otherwise seconds until enough tokens will be available
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1, max_wait: float = 0.0) -> bool:
+        """
+        Wait (up to `max_wait` seconds) for tokens.
+
+        Returns:
+            True if the tokens were taken, False if that would take too long
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self.try_take(tokens)
+            if wait == 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+
+class QuotaLedger:
+    """
+    Daily per-vendor request counts, persisted in Supabase so every worker
+    sees the same remaining quota. Once a vendor is exhausted this process
+    remembers it until the UTC day rolls over, skipping the ledger query.
+
+    Args:
+        supabase: Async Supabase client (defaults to the process-wide one)
+    """
+
+    def __init__(self, supabase: Optional[AsyncSupabaseClient] = None):
+        self._supabase = supabase
+        self._exhausted: Dict[str, str] = {}
+
+    @property
+    def supabase(self) -> AsyncSupabaseClient:
+        if self._supabase is None:
+            self._supabase = get_async_supabase_client()
+        return self._supabase
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.utcnow().date().isoformat()
+
+    def is_exhausted(self, vendor: str) -> bool:
+        """Whether this process already knows the vendor's quota is spent today."""
+        return self._exhausted.get(vendor) == self._today()
+
+    async def consume(self, vendor: str, amount: int, daily_limit: int) -> bool:
+        """
+        Charge requests against today's quota.
+
+        Fails open when the ledger itself is unreachable: the vendor's own
+        403/429 still protects us, and enrichment should not stop because
+        the bookkeeping is down.
+
+        Returns:
+            True if the requests fit within today's quota
+        """
+        if self.is_exhausted(vendor):
+            return False
+        try:
+            allowed = await self.supabase.consume_api_quota(vendor, self._today(), amount, daily_limit)
+        except Exception as e:
+            logger.warning(f"Quota ledger unavailable for {vendor}, allowing call: {e}")
+            return True
+        if not allowed:
+            logger.warning(f"{vendor} daily quota ({daily_limit}) exhausted")
+            self._exhausted[vendor] = self._today()
+        return allowed
+
+    async def mark_exhausted(self, vendor: str, daily_limit: int) -> None:
+        """Record a vendor-reported quota exhaustion (e.g. HTTP 403) for all workers."""
+        self._exhausted[vendor] = self._today()
+        try:
+            await self.supabase.exhaust_api_quota(vendor, self._today(), daily_limit)
+        except Exception as e:
+            logger.warning(f"Failed to record {vendor} quota exhaustion: {e}")
+
+
+class VendorRateLimiter:
+    """
+    Token buckets plus the shared quota ledger for every enrichment vendor.
+
+    Args:
+        ledger: Daily quota ledger
+        limits: Per-vendor limits (defaults to VENDOR_RATE_LIMITS)
+        max_wait: Longest a call waits for a token before giving up
+    """
+
+    def __init__(
+        self,
+        ledger: Optional[QuotaLedger] = None,
+        limits: Optional[Dict[str, Dict]] = None,
+        max_wait: Optional[float] = None
+    ):
+        self.ledger = ledger or QuotaLedger()
+        self.limits = limits or VENDOR_RATE_LIMITS
+        self.max_wait = max_wait if max_wait is not None else settings.RATE_LIMIT_MAX_WAIT_SECONDS
+        self._buckets: Dict[str, TokenBucket] = {
+            vendor: TokenBucket(config["rate_per_second"], config["burst"])
+            for vendor, config in self.limits.items()
+        }
+
+    def quota_exhausted(self, vendor: str) -> bool:
+        """Cheap local check, usable before deciding whether to call a vendor."""
+        return self.ledger.is_exhausted(vendor)
+
+    async def acquire(self, vendor: str, cost: int = 1) -> None:
+        """
+        Reserve `cost` requests for a vendor.
+
+        Raises:
+            VendorLimitError: Daily quota spent, or no token within max_wait
+        """
+        config = self.limits.get(vendor)
+        if config is None:
+            return
+
+        daily_quota = config.get("daily_quota")
+        if daily_quota and self.ledger.is_exhausted(vendor):
+            raise VendorLimitError(vendor, "daily quota exhausted", quota_exhausted=True)
+
+        # Wait for a token before charging the ledger, so a refused call costs no quota
+        if not await self._buckets[vendor].acquire(cost, self.max_wait):
+            raise VendorLimitError(vendor, "rate limited")
+
+        if daily_quota and not await self.ledger.consume(vendor, cost, daily_quota):
+            raise VendorLimitError(vendor, "daily quota exhausted", quota_exhausted=True)
+
+    async def mark_exhausted(self, vendor: str) -> None:
+        """Vendor reported its quota is spent; stop calling it for the rest of the day."""
+        config = self.limits.get(vendor) or {}
+        await self.ledger.mark_exhausted(vendor, config.get("daily_quota") or 0)
+
+
+# Global instance (token buckets must be shared by every request in the process)
+_rate_limiter: Optional[VendorRateLimiter] = None
+
+
+def get_rate_limiter() -> VendorRateLimiter:
+    """Get or create the process-wide vendor rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = VendorRateLimiter()
+    return _rate_limiter
@@ -0,0 +1,167 @@
+"""
+Background writer for raw_data rows.
+
+RADOrchestrator.enrich hands its vendor responses to the writer instead of
+awaiting the inserts, so the enrichment response is not gated on
+persistence. The writer drains a bounded buffer and flushes rows with one
+multi-row insert per batch (store_raw_data_many).
+
+The buffer is bounded: when Supabase falls behind, new rows are dropped
+with a warning rather than growing memory without limit. raw_data is an
+audit/cache table, so a dropped row only costs a future cache miss.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.async_supabase_client import AsyncSupabaseClient
+
+logger = logging.getLogger(__name__)
+
+# Queue marker that tells the writer loop to flush and exit
+_STOP = object()
+
+
+class RawDataWriter:
+    """
+    Buffers raw_data rows and writes them in batches from a background task.
+
+    Args:
+        supabase: Async Supabase client used for the inserts
+        max_buffer: Maximum number of rows waiting to be written
+        batch_size: Maximum rows per insert
+        flush_interval: Longest time (seconds) a row waits for its batch to fill
+    """
+
+    def __init__(
+        self,
+        supabase: AsyncSupabaseClient,
+        max_buffer: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        self.supabase = supabase
+        self.batch_size = batch_size or settings.RAW_DATA_WRITE_BATCH_SIZE
+        self.flush_interval = flush_interval if flush_interval is not None else settings.RAW_DATA_FLUSH_INTERVAL_SECONDS
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer or settings.RAW_DATA_WRITE_BUFFER)
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def submit(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Queue rows for writing without waiting.
+
+        Returns:
+            Number of rows accepted (the rest were dropped because the buffer is full)
+        """
+        accepted = 0
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+                accepted += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+        if accepted < len(rows):
+            logger.warning(
+                f"raw_data write buffer full, dropped {len(rows) - accepted} row(s) "
+                f"({self.dropped} total)"
+            )
+        return accepted
+
+    def pending(self) -> int:
+        """Number of rows waiting to be written."""
+        return self._queue.qsize()
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            await self.supabase.store_raw_data_many(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} raw_data row(s): {e}")
+
+    async def _run(self) -> None:
+        """Collect rows into batches and flush each one with a single insert."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                try:
+                    item = self._queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(self._queue.get(), timeout)
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    def start(self) -> None:
+        """Start the writer task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("raw_data writer started")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Flush buffered rows and stop; rows still unwritten after `timeout` are lost.
+
+        The stop marker is queued without blocking: a full buffer (a backlogged
+        writer, the usual state at shutdown) is retried until the writer frees
+        a slot or the deadline passes, and the task is cancelled after that.
+        """
+        if self._task is None:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not self._task.done():
+            try:
+                self._queue.put_nowait(_STOP)
+                break
+            except asyncio.QueueFull:
+                if loop.time() >= deadline:
+                    break
+                await asyncio.sleep(0.05)
+        try:
+            # wait_for cancels the task if it is still running at the deadline
+            await asyncio.wait_for(self._task, timeout=max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            logger.warning(f"raw_data writer stopped with {self.pending()} row(s) unwritten")
+        self._task = None
+        logger.info("raw_data writer stopped")
+
+
+# Global instance (started in app.main.lifespan)
+_raw_data_writer: Optional[RawDataWriter] = None
+
+
+def init_raw_data_writer(supabase: AsyncSupabaseClient) -> RawDataWriter:
+    """Create and start the global raw_data writer (idempotent)."""
+    global _raw_data_writer
+    if _raw_data_writer is None:
+        _raw_data_writer = RawDataWriter(supabase)
+        _raw_data_writer.start()
+    return _raw_data_writer
+
+
+async def close_raw_data_writer() -> None:
+    """Flush and discard the global raw_data writer."""
+    global _raw_data_writer
+    if _raw_data_writer is not None:
+        await _raw_data_writer.stop()
+        _raw_data_writer = None
+
+
+def get_raw_data_writer() -> Optional[RawDataWriter]:
+    """Get the global raw_data writer, or None outside the app lifespan."""
+    return _raw_data_writer
@@ -0,0 +1,62 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight coroutine
+instead of each calling the vendor. Once it finishes the key is released,
+so later calls start a fresh fetch (or hit the enrichment cache).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Group of keyed in-flight fetches.
+
+    The shared fetch runs as its own task, so a caller that is cancelled
+    (client disconnect, deadline) does not cancel it for the others.
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` for `key`, or join the call already in flight.
+
+        Args:
+            key: Identity of the fetch (e.g. "pdl_company:acme.com")
+            fn: Zero-argument coroutine function performing the fetch
+
+        Returns:
+            Result of the shared call (exceptions propagate to every waiter)
+        """
+        task = self._inflight.get(key)
+        # A task left over from a closed event loop cannot be awaited here
+        if task is not None and task.get_loop() is not asyncio.get_running_loop():
+            task = None
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release(key, t))
+        else:
+            logger.info(f"[{self.name}] Joining in-flight fetch for {key}")
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct fetches currently running."""
+        return len(self._inflight)
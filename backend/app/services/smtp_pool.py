@@ -0,0 +1,214 @@
+"""
+Pooled SMTP transport for EmailService.
+
+Opening an SMTP session costs a TCP connect, STARTTLS and AUTH round trips
+before the first byte of mail. SMTPConnectionPool keeps a few
+authenticated sessions open and reuses them, so consecutive deliveries
+(and batches via send_many) share one TLS session. smtplib is blocking,
+so every network operation runs in a worker thread via asyncio.to_thread
+and the event loop never waits on the SMTP server.
+"""
+
+import asyncio
+import logging
+import os
+import smtplib
+import time
+from email.message import Message
+from typing import Callable, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """One authenticated SMTP session plus its reuse bookkeeping."""
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.last_used = time.monotonic()
+        self.sends = 0
+
+
+class SMTPConnectionPool:
+    """
+    At most `size` concurrent SMTP sessions, kept open between sends.
+
+    Sessions idle for longer than `idle_seconds` are closed and replaced
+    on next use (servers drop idle clients, usually after a minute or so).
+    A send on a session the server has already dropped is retried once on
+    a fresh connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        user: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        size: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        timeout: Optional[float] = None,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size or settings.SMTP_POOL_SIZE
+        self.idle_seconds = settings.SMTP_IDLE_SECONDS if idle_seconds is None else idle_seconds
+        self.timeout = timeout or settings.SMTP_TIMEOUT_SECONDS
+        self.smtp_factory = smtp_factory
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: List[_PooledConnection] = []
+        self._closed = False
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a session (runs in a worker thread)."""
+        server = self.smtp_factory(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.user and self.password:
+                server.login(self.user, self.password)
+        except Exception:
+            self._quit(server)
+            raise
+        return server
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        """Close a session, ignoring errors from already-dead sockets."""
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    async def _acquire(self) -> _PooledConnection:
+        """Take a live idle session, or open a new one."""
+        now = time.monotonic()
+        while self._idle:
+            conn = self._idle.pop()
+            if now - conn.last_used <= self.idle_seconds:
+                return conn
+            await asyncio.to_thread(self._quit, conn.server)
+        server = await asyncio.to_thread(self._connect)
+        return _PooledConnection(server)
+
+    async def _release(self, conn: _PooledConnection, healthy: bool) -> None:
+        """Return a session to the pool, or close it if broken or the pool is closed."""
+        if healthy and not self._closed:
+            conn.last_used = time.monotonic()
+            conn.sends += 1
+            self._idle.append(conn)
+        else:
+            await asyncio.to_thread(self._quit, conn.server)
+
+    @staticmethod
+    def _send_all(server: smtplib.SMTP, messages: List[Message], sent: List[Message]) -> None:
+        """Send messages back to back on one session (runs in a worker thread)."""
+        for message in messages:
+            server.send_message(message)
+            sent.append(message)
+
+    async def send(self, message: Message) -> None:
+        """
+        Send one message over a pooled session.
+
+        Raises:
+            smtplib.SMTPException or OSError if delivery fails
+        """
+        await self.send_many([message])
+
+    async def send_many(self, messages: List[Message]) -> None:
+        """
+        Send several messages over a single pooled session.
+
+        The whole batch is handed to one worker thread, so it costs one
+        handshake (if any) and no per-message thread hops. If a reused
+        session turns out to have been dropped by the server, the messages
+        not yet sent are retried once on a fresh connection.
+
+        Args:
+            messages: Fully built MIME messages
+
+        Raises:
+            smtplib.SMTPException or OSError if delivery fails
+        """
+        if not messages:
+            return
+        if self._closed:
+            raise RuntimeError("SMTP pool is closed")
+
+        async with self._slots:
+            conn = await self._acquire()
+            reused = conn.sends > 0
+            sent: List[Message] = []
+            try:
+                await asyncio.to_thread(self._send_all, conn.server, messages, sent)
+            except smtplib.SMTPServerDisconnected:
+                await self._release(conn, healthy=False)
+                if not reused:
+                    raise
+                logger.info(f"SMTP session to {self.host} was dropped, reconnecting")
+                remaining = messages[len(sent):]
+                conn = await self._acquire()
+                try:
+                    await asyncio.to_thread(self._send_all, conn.server, remaining, [])
+                except Exception:
+                    await self._release(conn, healthy=False)
+                    raise
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError, smtplib.SMTPSenderRefused):
+                # The server rejected a message, but the session is still usable
+                await self._release(conn, healthy=True)
+                raise
+            except Exception:
+                await self._release(conn, healthy=False)
+                raise
+            await self._release(conn, healthy=True)
+
+    async def aclose(self) -> None:
+        """Close every idle session; in-flight sessions close when released."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await asyncio.to_thread(self._quit, conn.server)
+
+
+# Global instance (created in app.main.lifespan when SMTP is configured)
+_smtp_pool: Optional[SMTPConnectionPool] = None
+
+
+def init_smtp_pool() -> Optional[SMTPConnectionPool]:
+    """Create the global SMTP pool from SMTP_* env vars (None if SMTP is not configured)."""
+    global _smtp_pool
+    if _smtp_pool is None and os.getenv("SMTP_HOST"):
+        _smtp_pool = SMTPConnectionPool(
+            host=os.getenv("SMTP_HOST"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            user=os.getenv("SMTP_USER", ""),
+            password=os.getenv("SMTP_PASS", ""),
+            use_tls=os.getenv("SMTP_TLS", "true").lower() == "true",
+        )
+        logger.info(f"SMTP connection pool initialized (size={_smtp_pool.size})")
+    return _smtp_pool
+
+
+async def close_smtp_pool() -> None:
+    """Close and discard the global SMTP pool."""
+    global _smtp_pool
+    if _smtp_pool is not None:
+        await _smtp_pool.aclose()
+        _smtp_pool = None
+        logger.info("SMTP connection pool closed")
+
+
+def get_smtp_pool() -> Optional[SMTPConnectionPool]:
+    """Get the global SMTP pool, or None outside the app lifespan."""
+    return _smtp_pool
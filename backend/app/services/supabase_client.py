@@ -2,6 +2,7 @@
 Supabase client wrapper for RAD enrichment data persistence.
 Abstracts database operations for:
   - raw_data, staging_normalized, finalize_data (enrichment pipeline)
+  - domain_cache (company-level vendor responses, e.g. GNews)
   - personalization_jobs, personalization_outputs (job tracking)
   - pdf_deliveries (PDF generation tracking)
 """
@@ -9,11 +10,12 @@ Abstracts database operations for:
 import json
 import os
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import logging
 
 from app.config import settings
+from app.services.mock_store import MockTable
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,25 @@ MOCK_MODE = os.environ.get("MOCK_SUPABASE", "false").lower() == "true" or \
             "mock" in settings.SUPABASE_KEY.lower()
 
 
+def is_fresh(record: Optional[Dict[str, Any]], max_age_hours: float) -> bool:
+    """
+    Check a raw_data record's fetched_at against a maximum age.
+    Records with a missing or unparseable timestamp count as fresh.
+    """
+    if not record:
+        return False
+    fetched_at = record.get("fetched_at", "")
+    if fetched_at:
+        try:
+            fetched_time = datetime.fromisoformat(fetched_at)
+            age = datetime.utcnow() - fetched_time
+            if age.total_seconds() > max_age_hours * 3600:
+                return False
+        except (ValueError, TypeError):
+            pass
+    return True
+
+
 class SupabaseClient:
     """
     Wrapper around Supabase client to handle RAD enrichment data.
@@ -30,6 +51,9 @@ class SupabaseClient:
       - raw_data (email, source, payload, fetched_at)
       - staging_normalized (email, normalized_fields, status, created_at)
       - finalize_data (email, normalized_data, intro, cta, resolved_at)
+      - domain_cache (domain, source, payload, fetched_at, expires_at)
+      - api_quota_usage (vendor, usage_date, used)
+      - email_outbox (to_email, subject, bodies, attachment, status, attempts, next_attempt_at)
 
     Supports mock mode for local testing without real Supabase credentials.
     """
@@ -40,13 +64,21 @@ class SupabaseClient:
 
         if self.mock_mode:
             logger.info("Supabase client initialized in MOCK MODE (local testing)")
-            # In-memory storage for mock mode
-            self._mock_raw_data: List[Dict[str, Any]] = []
-            self._mock_staging: List[Dict[str, Any]] = []
-            self._mock_finalize: List[Dict[str, Any]] = []
-            self._mock_jobs: List[Dict[str, Any]] = []
-            self._mock_outputs: List[Dict[str, Any]] = []
-            self._mock_pdfs: List[Dict[str, Any]] = []
+            # In-memory storage for mock mode (indexed; optional row cap per table)
+            max_rows = settings.MOCK_STORE_MAX_ROWS
+            self._mock_raw_data = MockTable(
+                "raw_data", unique=["id"], indexes=[["email"], ["email", "source"]], max_rows=max_rows
+            )
+            self._mock_staging = MockTable("staging_normalized", unique=["email"], max_rows=max_rows)
+            self._mock_finalize = MockTable("finalize_data", unique=["email"], max_rows=max_rows)
+            self._mock_jobs = MockTable(
+                "personalization_jobs", unique=["id"], indexes=[["status"]], max_rows=max_rows
+            )
+            self._mock_outputs = MockTable("personalization_outputs", indexes=[["job_id"]], max_rows=max_rows)
+            self._mock_pdfs = MockTable("pdf_deliveries", unique=["id"], max_rows=max_rows)
+            self._mock_domain_cache = MockTable("domain_cache", unique=["domain", "source"], max_rows=max_rows)
+            self._mock_quota = MockTable("api_quota_usage", unique=["vendor", "usage_date"])
+            self._mock_outbox = MockTable("email_outbox", unique=["id"], indexes=[["status"]], max_rows=max_rows)
             self.client = None
         else:
             from supabase import create_client, Client
@@ -86,7 +118,7 @@ class SupabaseClient:
 
         if self.mock_mode:
             data["id"] = str(uuid.uuid4())
-            self._mock_raw_data.append(data)
+            self._mock_raw_data.insert(data)
             logger.info(f"[MOCK] Stored raw_data for {email} from {source}")
             return data
 
@@ -98,6 +130,37 @@ class SupabaseClient:
             logger.error(f"Error storing raw_data for {email}: {e}")
             raise
 
+    def store_raw_data_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store several raw API responses in one multi-row insert.
+
+        Args:
+            rows: Records with email, source, payload (fetched_at defaults to now)
+
+        Returns:
+            Inserted records
+        """
+        if not rows:
+            return []
+
+        now = datetime.utcnow().isoformat()
+        data = [{**row, "fetched_at": row.get("fetched_at") or now} for row in rows]
+
+        if self.mock_mode:
+            for record in data:
+                record["id"] = str(uuid.uuid4())
+                self._mock_raw_data.insert(record)
+            logger.info(f"[MOCK] Stored {len(data)} raw_data rows")
+            return data
+
+        try:
+            result = self.client.table("raw_data").insert(data).execute()
+            logger.info(f"Stored {len(data)} raw_data rows")
+            return result.data if result.data else data
+        except Exception as e:
+            logger.error(f"Error storing {len(data)} raw_data rows: {e}")
+            raise
+
     def get_raw_data_for_email(self, email: str) -> List[Dict[str, Any]]:
         """
         Retrieve all raw data records for a given email.
@@ -109,7 +172,7 @@ class SupabaseClient:
             List of raw_data records
         """
         if self.mock_mode:
-            return [r for r in self._mock_raw_data if r["email"] == email]
+            return self._mock_raw_data.find(email=email)
 
         try:
             result = self.client.table("raw_data").select("*").eq("email", email).execute()
@@ -118,116 +181,189 @@ class SupabaseClient:
             logger.error(f"Error fetching raw_data for {email}: {e}")
             return []
 
+    def get_latest_raw_data(
+        self,
+        key: str,
+        source: str,
+        max_age_hours: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the newest raw_data record for a key/source if fresh enough.
+
+        Used as the persistent cache tier for person-level sources, which are
+        keyed by email (rows written by store_raw_data).
+
+        Args:
+            key: Value of the email column (email or domain)
+            source: raw_data source name
+            max_age_hours: Maximum record age in hours
+
+        Returns:
+            Record with 'payload' key, or None if stale/missing
+        """
+        if self.mock_mode:
+            record = self._mock_raw_data.find_latest(email=key, source=source)
+        else:
+            try:
+                result = self.client.table("raw_data").select("*").eq(
+                    "email", key
+                ).eq("source", source).order(
+                    "fetched_at", desc=True
+                ).limit(1).execute()
+                record = result.data[0] if result.data else None
+            except Exception as e:
+                logger.error(f"Error fetching {source} raw_data for {key}: {e}")
+                return None
+
+        return record if is_fresh(record, max_age_hours) else None
+
     # ========================================================================
-    # NEWS CACHE (Company-level, reuses raw_data table with source='gnews_cache')
+    # DOMAIN_CACHE TABLE (Company-level responses shared across employees)
     # ========================================================================
 
-    def store_news_cache(
+    def store_domain_cache(
         self,
         domain: str,
-        payload: Dict[str, Any]
+        source: str,
+        payload: Dict[str, Any],
+        ttl_hours: float = 24
     ) -> Dict[str, Any]:
         """
-        Cache news results for a company domain.
-        Upserts into raw_data with source='gnews_cache' and email=domain.
-        10 employees from the same company reuse 1 GNews call.
+        Cache a company-level response for a domain.
+        Single upsert on the (domain, source) primary key, so concurrent
+        writers cannot leave duplicate or missing rows.
 
         Args:
-            domain: Company domain (used as key)
-            payload: News response to cache
+            domain: Company domain
+            source: Cached source (gnews, pdl_company, zoominfo)
+            payload: Response to cache
+            ttl_hours: Hours until the entry expires
 
         Returns:
             Stored record
         """
+        now = datetime.utcnow()
         data = {
-            "email": domain,  # Use email column to store domain as key
-            "source": "gnews_cache",
+            "domain": domain,
+            "source": source,
             "payload": payload,
-            "fetched_at": datetime.utcnow().isoformat()
+            "fetched_at": now.isoformat(),
+            "expires_at": (now + timedelta(hours=ttl_hours)).isoformat()
         }
 
         if self.mock_mode:
-            # Remove existing cache for this domain
-            self._mock_raw_data = [
-                r for r in self._mock_raw_data
-                if not (r.get("email") == domain and r.get("source") == "gnews_cache")
-            ]
-            data["id"] = str(uuid.uuid4())
-            self._mock_raw_data.append(data)
-            logger.info(f"[MOCK] Cached news for domain {domain}")
+            self._mock_domain_cache.insert(data)
+            logger.info(f"[MOCK] Cached {source} for domain {domain}")
             return data
 
         try:
-            # Delete existing cache for this domain, then insert fresh
-            self.client.table("raw_data").delete().eq(
-                "email", domain
-            ).eq("source", "gnews_cache").execute()
-            result = self.client.table("raw_data").insert(data).execute()
-            logger.info(f"Cached news for domain {domain}")
+            result = self.client.table("domain_cache").upsert(
+                data,
+                on_conflict="domain,source"
+            ).execute()
+            logger.info(f"Cached {source} for domain {domain}")
             return result.data[0] if result.data else data
         except Exception as e:
-            logger.error(f"Error caching news for {domain}: {e}")
+            logger.error(f"Error caching {source} for {domain}: {e}")
             raise
 
-    def get_cached_news(
+    def get_domain_cache(
         self,
         domain: str,
-        max_age_hours: int = 24
+        source: str,
+        max_age_hours: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Retrieve cached news for a domain if fresh enough.
+        Retrieve an unexpired company-level cache entry (primary key lookup).
 
         Args:
             domain: Company domain
-            max_age_hours: Maximum cache age in hours (default 24)
+            source: Cached source (gnews, pdl_company, zoominfo)
+            max_age_hours: Optional tighter freshness bound than the stored TTL
 
         Returns:
-            Cached record with 'payload' key, or None if stale/missing
+            Record with 'payload' key, or None if expired/missing
         """
+        now = datetime.utcnow().isoformat()
+
         if self.mock_mode:
-            records = [
-                r for r in self._mock_raw_data
-                if r.get("email") == domain and r.get("source") == "gnews_cache"
-            ]
-            if not records:
+            record = self._mock_domain_cache.get(domain, source)
+            if record and record["expires_at"] <= now:
+                # Lazy expiry, like purge_expired_domain_cache in production
+                self._mock_domain_cache.delete(domain, source)
+                record = None
+        else:
+            try:
+                result = self.client.table("domain_cache").select("*").eq(
+                    "domain", domain
+                ).eq("source", source).gt("expires_at", now).limit(1).execute()
+                record = result.data[0] if result.data else None
+            except Exception as e:
+                logger.error(f"Error fetching {source} cache for {domain}: {e}")
                 return None
-            record = records[-1]
-            # Check freshness
-            fetched_at = record.get("fetched_at", "")
-            if fetched_at:
-                try:
-                    fetched_time = datetime.fromisoformat(fetched_at)
-                    age = datetime.utcnow() - fetched_time
-                    if age.total_seconds() > max_age_hours * 3600:
-                        return None
-                except (ValueError, TypeError):
-                    pass
-            return record
 
-        try:
-            result = self.client.table("raw_data").select("*").eq(
-                "email", domain
-            ).eq("source", "gnews_cache").order(
-                "fetched_at", desc=True
-            ).limit(1).execute()
+        if max_age_hours is not None and not is_fresh(record, max_age_hours):
+            return None
+        return record
 
-            if not result.data:
-                return None
+    def purge_expired_domain_cache(self) -> int:
+        """
+        Delete expired domain_cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = datetime.utcnow().isoformat()
+
+        if self.mock_mode:
+            expired = [r for r in self._mock_domain_cache if r["expires_at"] <= now]
+            for record in expired:
+                self._mock_domain_cache.delete(record["domain"], record["source"])
+            return len(expired)
 
-            record = result.data[0]
-            fetched_at = record.get("fetched_at", "")
-            if fetched_at:
-                try:
-                    fetched_time = datetime.fromisoformat(fetched_at)
-                    age = datetime.utcnow() - fetched_time
-                    if age.total_seconds() > max_age_hours * 3600:
-                        return None
-                except (ValueError, TypeError):
-                    pass
-            return record
+        try:
+            result = self.client.rpc("purge_expired_domain_cache", {}).execute()
+            return result.data or 0
         except Exception as e:
-            logger.error(f"Error fetching cached news for {domain}: {e}")
-            return None
+            logger.error(f"Error purging expired domain cache: {e}")
+            return 0
+
+    def store_news_cache(
+        self,
+        domain: str,
+        payload: Dict[str, Any],
+        ttl_hours: float = 24
+    ) -> Dict[str, Any]:
+        """
+        Cache news results for a company domain.
+        10 employees from the same company reuse 1 GNews call.
+
+        Args:
+            domain: Company domain (used as key)
+            payload: News response to cache
+            ttl_hours: Hours until the entry expires
+
+        Returns:
+            Stored record
+        """
+        return self.store_domain_cache(domain, "gnews", payload, ttl_hours)
+
+    def get_cached_news(
+        self,
+        domain: str,
+        max_age_hours: int = 24
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached news for a domain if fresh enough.
+
+        Args:
+            domain: Company domain
+            max_age_hours: Maximum cache age in hours (default 24)
+
+        Returns:
+            Cached record with 'payload' key, or None if stale/missing
+        """
+        return self.get_domain_cache(domain, "gnews", max_age_hours)
 
     # ========================================================================
     # STAGING_NORMALIZED TABLE (Resolution in progress)
@@ -259,7 +395,7 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            self._mock_staging.append(data)
+            self._mock_staging.insert(data)
             logger.info(f"[MOCK] Created staging record for {email}")
             return data
 
@@ -295,11 +431,10 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            for record in self._mock_staging:
-                if record["email"] == email:
-                    record.update(data)
-                    logger.info(f"[MOCK] Updated staging record for {email}")
-                    return record
+            record = self._mock_staging.update((email,), data)
+            if record:
+                logger.info(f"[MOCK] Updated staging record for {email}")
+                return record
             return data
 
         try:
@@ -346,9 +481,8 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            # Remove any existing record for this email
-            self._mock_finalize = [r for r in self._mock_finalize if r["email"] != email]
-            self._mock_finalize.append(data)
+            # Replaces any existing record for this email
+            self._mock_finalize.insert(data)
             logger.info(f"[MOCK] Wrote finalize_data for {email}")
             return data
 
@@ -371,8 +505,7 @@ class SupabaseClient:
             finalize_data record, or None if not found
         """
         if self.mock_mode:
-            records = [r for r in self._mock_finalize if r["email"] == email]
-            return records[-1] if records else None
+            return self._mock_finalize.get(email)
 
         try:
             result = self.client.table("finalize_data").select("*").eq("email", email).order("resolved_at", desc=True).limit(1).execute()
@@ -412,9 +545,8 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            # Remove existing and add new
-            self._mock_finalize = [r for r in self._mock_finalize if r["email"] != email]
-            self._mock_finalize.append(data)
+            # Replaces any existing record for this email
+            self._mock_finalize.insert(data)
             logger.info(f"[MOCK] Upserted finalize_data for {email}")
             return data
 
@@ -442,7 +574,8 @@ class SupabaseClient:
         buyer_stage: Optional[str] = None,
         company_name: Optional[str] = None,
         industry: Optional[str] = None,
-        company_size: Optional[str] = None
+        company_size: Optional[str] = None,
+        request_payload: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Create a new personalization job.
@@ -456,6 +589,7 @@ class SupabaseClient:
             company_name: Company name
             industry: Industry sector
             company_size: Company size range
+            request_payload: Original /rad/enrich request body (queued jobs only)
 
         Returns:
             Created job record with id
@@ -472,10 +606,13 @@ class SupabaseClient:
             "status": "pending",
             "created_at": datetime.utcnow().isoformat()
         }
+        if request_payload is not None:
+            data["request_payload"] = request_payload
 
         if self.mock_mode:
             data["id"] = str(uuid.uuid4())
-            self._mock_jobs.append(data)
+            data["attempts"] = 0
+            self._mock_jobs.insert(data)
             logger.info(f"[MOCK] Created job {data['id']} for {email}")
             return data
 
@@ -491,8 +628,9 @@ class SupabaseClient:
         self,
         job_id: str,
         status: str,
-        error_message: Optional[str] = None
-    ) -> Dict[str, Any]:
+        error_message: Optional[str] = None,
+        leased_by: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Update job status.
 
@@ -500,9 +638,10 @@ class SupabaseClient:
             job_id: Job ID
             status: New status (pending, processing, completed, failed)
             error_message: Error message if failed
+            leased_by: Only update while this worker holds the job's lease
 
         Returns:
-            Updated job record
+            Updated job record, or None if leased_by no longer holds the lease
         """
         data = {"status": status}
 
@@ -515,15 +654,22 @@ class SupabaseClient:
             data["error_message"] = error_message
 
         if self.mock_mode:
-            for job in self._mock_jobs:
-                if job["id"] == job_id:
-                    job.update(data)
-                    logger.info(f"[MOCK] Updated job {job_id} status to {status}")
-                    return job
+            if leased_by is not None and not self._mock_holds_lease(job_id, leased_by):
+                return None
+            job = self._mock_jobs.update((job_id,), data)
+            if job:
+                logger.info(f"[MOCK] Updated job {job_id} status to {status}")
+                return job
             return data
 
         try:
-            result = self.client.table("personalization_jobs").update(data).eq("id", job_id).execute()
+            query = self.client.table("personalization_jobs").update(data).eq("id", job_id)
+            if leased_by is not None:
+                query = query.eq("leased_by", leased_by).eq("status", "processing")
+            result = query.execute()
+            if leased_by is not None and not result.data:
+                logger.warning(f"Job {job_id} no longer leased by {leased_by}; status {status} not recorded")
+                return None
             logger.info(f"Updated job {job_id} status to {status}")
             return result.data[0] if result.data else data
         except Exception as e:
@@ -541,10 +687,7 @@ class SupabaseClient:
             Job record or None
         """
         if self.mock_mode:
-            for job in self._mock_jobs:
-                if job["id"] == job_id:
-                    return job
-            return None
+            return self._mock_jobs.get(job_id)
 
         try:
             result = self.client.table("personalization_jobs").select("*").eq("id", job_id).execute()
@@ -564,8 +707,7 @@ class SupabaseClient:
             List of pending job records
         """
         if self.mock_mode:
-            pending = [j for j in self._mock_jobs if j["status"] == "pending"]
-            return pending[:limit]
+            return self._mock_jobs.find(status="pending")[:limit]
 
         try:
             result = self.client.table("personalization_jobs").select("*").eq(
@@ -576,6 +718,97 @@ class SupabaseClient:
             logger.error(f"Error fetching pending jobs: {e}")
             return []
 
+    def claim_jobs(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically lease queued jobs for a worker.
+
+        Claims pending jobs, plus processing jobs whose lease has expired
+        (worker crashed mid-job). In production this runs the
+        claim_personalization_jobs function, which uses FOR UPDATE SKIP LOCKED
+        so concurrent workers never claim the same row.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of jobs to claim
+            lease_seconds: How long the lease is held before others may reclaim
+
+        Returns:
+            List of claimed job records (status=processing, attempts incremented)
+        """
+        if self.mock_mode:
+            now = datetime.utcnow()
+            lease_expires_at = (now + timedelta(seconds=lease_seconds)).isoformat()
+            expired = [
+                j for j in self._mock_jobs.find(status="processing")
+                if j.get("lease_expires_at") and j["lease_expires_at"] < now.isoformat()
+            ]
+            claimable = self._mock_jobs.find(status="pending") + expired
+            claimable.sort(key=lambda j: j["created_at"])
+            claimed = []
+            for job in claimable[:limit]:
+                claimed.append(self._mock_jobs.update((job["id"],), {
+                    "status": "processing",
+                    "leased_by": worker_id,
+                    "lease_expires_at": lease_expires_at,
+                    "attempts": job.get("attempts", 0) + 1,
+                    "started_at": now.isoformat(),
+                }))
+            if claimed:
+                logger.info(f"[MOCK] Worker {worker_id} claimed {len(claimed)} job(s)")
+            return claimed
+
+        try:
+            result = self.client.rpc("claim_personalization_jobs", {
+                "p_worker_id": worker_id,
+                "p_batch_size": limit,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error claiming jobs for worker {worker_id}: {e}")
+            return []
+
+    def _mock_holds_lease(self, job_id: str, worker_id: str) -> bool:
+        job = self._mock_jobs.get(job_id)
+        return bool(job) and job.get("status") == "processing" and job.get("leased_by") == worker_id
+
+    def extend_job_lease(self, job_id: str, worker_id: str, lease_seconds: int = 300) -> bool:
+        """
+        Push back a job's lease expiry while its worker is still running it
+        (renew_personalization_job_lease in production).
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker that claimed the job
+            lease_seconds: New lease length from now
+
+        Returns:
+            True if renewed, False if the worker no longer holds the lease
+        """
+        if self.mock_mode:
+            if not self._mock_holds_lease(job_id, worker_id):
+                return False
+            self._mock_jobs.update((job_id,), {
+                "lease_expires_at": (datetime.utcnow() + timedelta(seconds=lease_seconds)).isoformat()
+            })
+            return True
+
+        try:
+            result = self.client.rpc("renew_personalization_job_lease", {
+                "p_job_id": job_id,
+                "p_worker_id": worker_id,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return bool(result.data)
+        except Exception as e:
+            logger.error(f"Error renewing lease on job {job_id}: {e}")
+            raise
+
     # ========================================================================
     # PERSONALIZATION_OUTPUTS TABLE (LLM outputs)
     # ========================================================================
@@ -623,7 +856,7 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            self._mock_outputs.append(data)
+            self._mock_outputs.insert(data)
             logger.info(f"[MOCK] Stored personalization output for job {job_id}")
             return data
 
@@ -646,8 +879,7 @@ class SupabaseClient:
             Output record or None
         """
         if self.mock_mode:
-            outputs = [o for o in self._mock_outputs if o["job_id"] == job_id]
-            return outputs[-1] if outputs else None
+            return self._mock_outputs.find_latest(job_id=job_id)
 
         try:
             result = self.client.table("personalization_outputs").select("*").eq(
@@ -691,7 +923,8 @@ class SupabaseClient:
         }
 
         if self.mock_mode:
-            self._mock_pdfs.append(data)
+            data["id"] = str(uuid.uuid4())
+            self._mock_pdfs.insert(data)
             logger.info(f"[MOCK] Created PDF delivery for job {job_id}")
             return data
 
@@ -734,11 +967,10 @@ class SupabaseClient:
             data["error_message"] = error_message
 
         if self.mock_mode:
-            for pdf in self._mock_pdfs:
-                if pdf["id"] == delivery_id:
-                    pdf.update(data)
-                    logger.info(f"[MOCK] Updated PDF delivery {delivery_id} to {status}")
-                    return pdf
+            pdf = self._mock_pdfs.update((delivery_id,), data)
+            if pdf:
+                logger.info(f"[MOCK] Updated PDF delivery {delivery_id} to {status}")
+                return pdf
             return data
 
         try:
@@ -749,6 +981,216 @@ class SupabaseClient:
             logger.error(f"Error updating PDF delivery {delivery_id}: {e}")
             raise
 
+    # ========================================================================
+    # EMAIL_OUTBOX TABLE (Durable outbound email queue)
+    # ========================================================================
+
+    def enqueue_email(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a fully built email to the outbox.
+
+        Args:
+            data: to_email, subject, html_body, text_body and optional
+                attachment_base64, attachment_filename, delivery_id
+
+        Returns:
+            Created outbox record (status=pending, due immediately)
+        """
+        now = datetime.utcnow().isoformat()
+        data = {
+            **data,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now
+        }
+
+        if self.mock_mode:
+            data["id"] = str(uuid.uuid4())
+            self._mock_outbox.insert(data)
+            logger.info(f"[MOCK] Queued email {data['id']} to {data.get('to_email')}")
+            return data
+
+        try:
+            result = self.client.table("email_outbox").insert(data).execute()
+            logger.info(f"Queued email to {data.get('to_email')}")
+            return result.data[0] if result.data else data
+        except Exception as e:
+            logger.error(f"Error queueing email to {data.get('to_email')}: {e}")
+            raise
+
+    def claim_outbox_emails(
+        self,
+        worker_id: str,
+        limit: int = 50,
+        lease_seconds: int = 120
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically lease due outbox emails for a sender.
+
+        Claims pending emails whose next_attempt_at has passed, plus sending
+        emails whose lease expired (sender died mid-batch). In production
+        this runs the claim_email_outbox function (FOR UPDATE SKIP LOCKED).
+
+        Args:
+            worker_id: Identifier of the claiming sender
+            limit: Maximum number of emails to claim
+            lease_seconds: How long the lease is held before others may reclaim
+
+        Returns:
+            List of claimed outbox records (status=sending, attempts incremented)
+        """
+        if self.mock_mode:
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            lease_expires_at = (now + timedelta(seconds=lease_seconds)).isoformat()
+            due = [e for e in self._mock_outbox.find(status="pending") if e["next_attempt_at"] <= now_iso]
+            expired = [
+                e for e in self._mock_outbox.find(status="sending")
+                if e.get("lease_expires_at") and e["lease_expires_at"] < now_iso
+            ]
+            claimable = sorted(due + expired, key=lambda e: e["next_attempt_at"])
+            return [
+                self._mock_outbox.update((e["id"],), {
+                    "status": "sending",
+                    "leased_by": worker_id,
+                    "lease_expires_at": lease_expires_at,
+                    "attempts": e.get("attempts", 0) + 1,
+                })
+                for e in claimable[:limit]
+            ]
+
+        try:
+            result = self.client.rpc("claim_email_outbox", {
+                "p_worker_id": worker_id,
+                "p_batch_size": limit,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return result.data if result.data else []
+        except Exception as e:
+            logger.error(f"Error claiming outbox emails for {worker_id}: {e}")
+            return []
+
+    def update_outbox_email(self, email_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update an outbox record (status, schedule, provider result).
+
+        Args:
+            email_id: Outbox record ID
+            changes: Columns to set
+
+        Returns:
+            Updated record, or None if not found
+        """
+        if self.mock_mode:
+            return self._mock_outbox.update((email_id,), changes)
+
+        try:
+            result = self.client.table("email_outbox").update(changes).eq("id", email_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error updating outbox email {email_id}: {e}")
+            raise
+
+    def get_outbox_email(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an outbox record by ID.
+
+        Args:
+            email_id: Outbox record ID
+
+        Returns:
+            Outbox record or None
+        """
+        if self.mock_mode:
+            return self._mock_outbox.get(email_id)
+
+        try:
+            result = self.client.table("email_outbox").select("*").eq("id", email_id).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Error fetching outbox email {email_id}: {e}")
+            return None
+
+    # ========================================================================
+    # API_QUOTA_USAGE TABLE (Daily vendor quota ledger)
+    # ========================================================================
+
+    def consume_api_quota(
+        self,
+        vendor: str,
+        usage_date: str,
+        amount: int,
+        daily_limit: int
+    ) -> bool:
+        """
+        Atomically charge `amount` requests against a vendor's daily quota.
+        Nothing is charged when the charge would exceed the limit.
+
+        Args:
+            vendor: Vendor name (e.g. 'gnews')
+            usage_date: UTC date (YYYY-MM-DD)
+            amount: Requests to charge
+            daily_limit: Vendor's daily request limit
+
+        Returns:
+            True if the requests fit within today's quota
+        """
+        if self.mock_mode:
+            record = self._mock_quota.get(vendor, usage_date)
+            used = record["used"] if record else 0
+            if used + amount > daily_limit:
+                return False
+            self._mock_quota.insert({
+                "vendor": vendor,
+                "usage_date": usage_date,
+                "used": used + amount,
+                "updated_at": datetime.utcnow().isoformat()
+            })
+            return True
+
+        try:
+            result = self.client.rpc("consume_api_quota", {
+                "p_vendor": vendor,
+                "p_usage_date": usage_date,
+                "p_amount": amount,
+                "p_limit": daily_limit
+            }).execute()
+            return bool(result.data)
+        except Exception as e:
+            logger.error(f"Error charging {vendor} quota: {e}")
+            raise
+
+    def exhaust_api_quota(self, vendor: str, usage_date: str, daily_limit: int) -> None:
+        """
+        Record that a vendor's quota is used up for the day (e.g. after a 403),
+        so other workers stop calling it too.
+
+        Args:
+            vendor: Vendor name
+            usage_date: UTC date (YYYY-MM-DD)
+            daily_limit: Vendor's daily request limit
+        """
+        data = {
+            "vendor": vendor,
+            "usage_date": usage_date,
+            "used": daily_limit,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+
+        if self.mock_mode:
+            self._mock_quota.insert(data)
+            return
+
+        try:
+            self.client.table("api_quota_usage").upsert(
+                data,
+                on_conflict="vendor,usage_date"
+            ).execute()
+        except Exception as e:
+            logger.error(f"Error marking {vendor} quota exhausted: {e}")
+            raise
+
     # ========================================================================
     # HEALTH CHECK
     # ========================================================================
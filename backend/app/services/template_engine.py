@@ -0,0 +1,61 @@
+"""
+Precompiled string.Template renderer for the PDF HTML templates.
+
+string.Template re-scans the whole source with a regex on every
+safe_substitute() call; for the ~1000-line AMD ebook that scan dominates
+render time. CompiledTemplate scans once, bakes static values into the
+literal text, and renders by joining literal segments with the per-request
+values. Output is identical to Template(source).safe_substitute(...).
+"""
+
+from string import Template
+from typing import Any, List, Mapping, Optional, Tuple
+
+
+class CompiledTemplate:
+    """
+    A $-placeholder template split into literal segments and slots.
+
+    Args:
+        source: Template text using string.Template syntax ($name, ${name}, $$)
+        static: Values substituted once at compile time (e.g. fixed ebook copy)
+    """
+
+    def __init__(self, source: str, static: Optional[Mapping[str, Any]] = None):
+        static = static or {}
+        literals: List[str] = []
+        slots: List[Tuple[str, str]] = []
+        current: List[str] = []
+        pos = 0
+
+        for match in Template.pattern.finditer(source):
+            current.append(source[pos:match.start()])
+            pos = match.end()
+
+            name = match.group("named") or match.group("braced")
+            if match.group("escaped") is not None:
+                current.append(Template.delimiter)
+            elif name is None:
+                # Invalid placeholder: safe_substitute leaves it untouched
+                current.append(match.group())
+            elif name in static:
+                current.append(str(static[name]))
+            else:
+                literals.append("".join(current))
+                current = []
+                slots.append((name, match.group()))
+
+        current.append(source[pos:])
+        literals.append("".join(current))
+
+        self._literals = literals
+        self._slots = slots
+        self.placeholders = frozenset(name for name, _ in slots)
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """Fill the slots; names missing from `variables` are left as-is."""
+        parts = [self._literals[0]]
+        for (name, raw), literal in zip(self._slots, self._literals[1:]):
+            parts.append(str(variables[name]) if name in variables else raw)
+            parts.append(literal)
+        return "".join(parts)
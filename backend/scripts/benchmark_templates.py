@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-render cost of the PDF HTML templates.
+Compares string.Template built and substituted on every call (the old path)
+against the CompiledTemplate instances PDFService builds once at import.
+Run: python scripts/benchmark_templates.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from string import Template
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.pdf_service import PDFService
+from app.services.ebook_content import EBOOK_SECTIONS, get_case_study_for_industry
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    case_study = get_case_study_for_industry("healthcare")
+
+    ebook_vars = {
+        "first_name": "John",
+        "last_name": "Smith",
+        "company_name": "Acme Healthcare Systems",
+        "title": "VP of Infrastructure",
+        "industry": "healthcare",
+        "generated_date": "January 01, 2026",
+        "personalized_hook": "As Acme scales its clinical platforms, infrastructure choices matter.",
+        "case_study_framing": "Like Acme, this provider faced growing data volumes.",
+        "personalized_cta": "Book a modernization assessment with AMD.",
+        "case_study_title": case_study["title"],
+        "case_study_company": case_study["company"],
+        "case_study_industry": case_study["industry"],
+        "case_study_challenge": case_study["challenge"],
+        "case_study_solution": case_study["solution"],
+        "case_study_quote": case_study["quote"],
+        "case_study_quote_author": case_study["quote_author"],
+        "case_study_result": case_study["result"],
+    }
+    review_vars = {
+        "company_name": "Acme",
+        "stage": "Challenger",
+        "stage_sidebar_html": "",
+        "advantages_html": "",
+        "risks_html": "",
+        "recommendations_html": "",
+        "case_study_html": "",
+        "generated_date": "January 01, 2026",
+    }
+
+    cases = [
+        (
+            "AMD ebook",
+            lambda: Template(PDFService._get_amd_ebook_template()).safe_substitute({**ebook_vars, **EBOOK_SECTIONS}),
+            lambda: PDFService._templates["amd_ebook"].render(ebook_vars),
+        ),
+        (
+            "Executive review",
+            lambda: Template(PDFService._get_executive_review_template()).safe_substitute(review_vars),
+            lambda: PDFService._templates["executive_review"].render(review_vars),
+        ),
+    ]
+
+    print(f"{'template':<20}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for name, before, after in cases:
+        assert before() == after(), f"{name}: compiled output differs"
+        before_us = timeit.timeit(before, number=iterations) / iterations * 1e6
+        after_us = timeit.timeit(after, number=iterations) / iterations * 1e6
+        print(f"{name:<20}{before_us:>14.1f}{after_us:>14.1f}{before_us / after_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,54 @@ os.environ["SUPABASE_KEY"] = "mock-test-key"
 
 # Import app and services
 from app.main import app
-from app.services.supabase_client import SupabaseClient, get_supabase_client
+from app.services.supabase_client import SupabaseClient
+from app.services.async_supabase_client import AsyncSupabaseClient, get_async_supabase_client
 from app.services.rad_orchestrator import RADOrchestrator
-from app.services.llm_service import LLMService
+from app.services.llm_service import LLMService, get_latency_tracker
+from app.services.enrichment_cache import get_memory_tier
+from app.services import llm_cache, rate_limiter
+from app.services.circuit_breaker import reset_circuit_breakers
+
+
+@pytest.fixture(autouse=True)
+def clear_enrichment_cache():
+    """Keep the process-wide enrichment cache from leaking between tests."""
+    get_memory_tier().clear()
+    yield
+    get_memory_tier().clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm_cache():
+    """Give each test an empty, memory-only LLM response cache."""
+    llm_cache._llm_cache = llm_cache.LLMResponseCache(ttl_seconds=3600, memory_entries=100)
+    yield
+    llm_cache._llm_cache = None
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_latency_history():
+    """Keep hedge deadlines learned in one test from applying to the next."""
+    get_latency_tracker().clear()
+    yield
+    get_latency_tracker().clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter():
+    """Give each test its own token buckets and an empty quota ledger."""
+    ledger = rate_limiter.QuotaLedger(AsyncSupabaseClient(mock_store=SupabaseClient()))
+    rate_limiter._rate_limiter = rate_limiter.VendorRateLimiter(ledger)
+    yield
+    rate_limiter._rate_limiter = None
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breakers():
+    """Start each test with every source's circuit closed."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
 
 
 @pytest.fixture
@@ -26,18 +71,8 @@ def mock_supabase():
     Fixture: Supabase client in mock mode.
     Uses in-memory storage; no real Supabase connection.
     """
-    # Create a fresh client instance (will use mock mode due to env vars)
-    client = SupabaseClient()
-
-    # Clear any existing mock data
-    client._mock_raw_data = []
-    client._mock_staging = []
-    client._mock_finalize = []
-    client._mock_jobs = []
-    client._mock_outputs = []
-    client._mock_pdfs = []
-
-    return client
+    # A fresh client instance starts with empty mock tables (mock mode via env vars)
+    return SupabaseClient()
 
 
 @pytest.fixture
@@ -45,11 +80,11 @@ def test_client(mock_supabase):
     """
     Fixture: FastAPI TestClient with mocked Supabase.
     """
-    # Patch the get_supabase_client dependency
+    # Patch the Supabase dependency; the async client shares mock_supabase's store
     def mock_get_supabase():
-        return mock_supabase
+        return AsyncSupabaseClient(mock_store=mock_supabase)
 
-    app.dependency_overrides[get_supabase_client] = mock_get_supabase
+    app.dependency_overrides[get_async_supabase_client] = mock_get_supabase
 
     client = TestClient(app)
 
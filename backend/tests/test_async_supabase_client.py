@@ -0,0 +1,60 @@
+"""
+Tests for the async Supabase data access layer (mock mode).
+The async client must see the same in-memory data as the sync client it wraps.
+"""
+
+import pytest
+
+from app.services.async_supabase_client import AsyncSupabaseClient, as_async_client
+
+
+class TestAsyncSupabaseClient:
+
+    @pytest.fixture
+    def async_client(self, mock_supabase):
+        return AsyncSupabaseClient(mock_store=mock_supabase)
+
+    async def test_shares_store_with_sync_client(self, async_client, mock_supabase):
+        await async_client.upsert_finalize_data(
+            email="john@acme.com",
+            normalized_data={"company_name": "Acme"},
+            intro="Hook"
+        )
+
+        record = mock_supabase.get_finalize_data("john@acme.com")
+        assert record["normalized_data"]["company_name"] == "Acme"
+        assert (await async_client.get_finalize_data("john@acme.com"))["personalization_intro"] == "Hook"
+
+    async def test_job_lifecycle(self, async_client):
+        job = await async_client.create_job(email="john@acme.com", request_payload={"email": "john@acme.com"})
+
+        claimed = await async_client.claim_jobs("w1")
+        assert [j["id"] for j in claimed] == [job["id"]]
+
+        await async_client.store_personalization_output(job["id"], {"ok": True})
+        await async_client.update_job_status(job["id"], "completed")
+
+        assert (await async_client.get_job(job["id"]))["status"] == "completed"
+        assert (await async_client.get_output_for_job(job["id"]))["output_json"] == {"ok": True}
+
+    async def test_news_cache_round_trip(self, async_client):
+        await async_client.store_news_cache("acme.com", {"result_count": 3})
+
+        cached = await async_client.get_cached_news("acme.com")
+        assert cached["payload"]["result_count"] == 3
+
+    async def test_health_check_in_mock_mode(self, async_client):
+        assert await async_client.health_check() is True
+        assert set((await async_client.check_tables()).values()) == {"ok"}
+
+
+class TestAsAsyncClient:
+
+    def test_wraps_mock_sync_client(self, mock_supabase):
+        adapted = as_async_client(mock_supabase)
+        assert isinstance(adapted, AsyncSupabaseClient)
+        assert adapted.store is mock_supabase
+
+    def test_async_client_passes_through(self, mock_supabase):
+        client = AsyncSupabaseClient(mock_store=mock_supabase)
+        assert as_async_client(client) is client
@@ -0,0 +1,187 @@
+"""
+Tests for per-source circuit breakers around enrichment vendors.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+from app.services.async_supabase_client import AsyncSupabaseClient
+from app.services.enrichment_apis import EnrichmentAPIError, GNewsAPI
+from app.services.rad_orchestrator import RADOrchestrator
+from app.services.rate_limiter import QuotaLedger, VendorRateLimiter
+
+
+def _timeout(source="apollo"):
+    return EnrichmentAPIError(source, "Request timeout")
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("apollo", failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure("timeout")
+        assert breaker.state == CLOSED
+        breaker.record_failure("timeout")
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("apollo", failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_admits_one_probe(self):
+        breaker = CircuitBreaker("apollo", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_probe_success_closes(self):
+        breaker = CircuitBreaker("apollo", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()
+
+        breaker.record_success()
+
+        assert breaker.state == CLOSED
+        assert breaker.consecutive_failures == 0
+
+    def test_probe_failure_reopens(self):
+        breaker = CircuitBreaker("apollo", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        breaker.opened_at -= 30
+        breaker.before_call()
+
+        breaker.record_failure("still down")
+
+        assert breaker.state == OPEN
+        assert breaker.snapshot()["last_error"] == "still down"
+
+
+class TestOrchestratorBreakers:
+
+    @pytest.fixture
+    def orchestrator(self, mock_supabase):
+        orchestrator = RADOrchestrator(mock_supabase)
+        orchestrator.cache.enabled = False
+        return orchestrator
+
+    async def test_open_circuit_skips_vendor(self, orchestrator):
+        apollo = AsyncMock()
+        apollo.enrich = AsyncMock(side_effect=_timeout())
+        orchestrator.apis["apollo"] = apollo
+        threshold = get_circuit_breaker("apollo").failure_threshold
+
+        for _ in range(threshold):
+            result = await orchestrator._fetch_with_fallback("apollo", "john@acme.com", "acme.com")
+            assert "timeout" in result["_error"]
+
+        result = await orchestrator._fetch_with_fallback("apollo", "john@acme.com", "acme.com")
+
+        assert result["_circuit_open"] is True
+        assert apollo.enrich.await_count == threshold
+
+    async def test_client_errors_do_not_trip(self, orchestrator):
+        hunter = AsyncMock()
+        hunter.enrich = AsyncMock(side_effect=EnrichmentAPIError("hunter", "not found", status_code=404))
+        orchestrator.apis["hunter"] = hunter
+
+        for _ in range(5):
+            await orchestrator._fetch_with_fallback("hunter", "john@acme.com", "acme.com")
+
+        assert get_circuit_breaker("hunter").state == CLOSED
+
+    async def test_gnews_all_queries_failed_counts_as_failure(self, orchestrator):
+        gnews = AsyncMock()
+        gnews.enrich_with_name = AsyncMock(return_value={
+            "result_count": 0,
+            "_query_stats": {"total": 2, "succeeded": 0, "failed": 2},
+            "_quota_exhausted": False,
+        })
+        orchestrator.apis["gnews"] = gnews
+        orchestrator.rss_fetcher.fetch_news = AsyncMock(return_value={"result_count": 0})
+
+        await orchestrator._fetch_news_layers("john@acme.com", "acme.com", "Acme")
+
+        assert get_circuit_breaker("gnews").consecutive_failures == 1
+
+    async def test_local_rate_limit_refusals_do_not_trip_gnews(self, orchestrator, mock_supabase):
+        limits = {"gnews": {"rate_per_second": 0.01, "burst": 2, "daily_quota": None}}
+        limiter = VendorRateLimiter(QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase)), limits, max_wait=0)
+        await limiter.acquire("gnews", cost=2)
+        orchestrator.apis["gnews"] = GNewsAPI(api_key="test-key")
+        orchestrator.rss_fetcher.fetch_news = AsyncMock(return_value={"result_count": 0})
+        breaker = get_circuit_breaker("gnews")
+
+        with patch("app.services.enrichment_apis.get_rate_limiter", return_value=limiter), \
+                patch("httpx.AsyncClient") as http:
+            for _ in range(breaker.failure_threshold + 1):
+                await orchestrator._fetch_news_layers("john@acme.com", "acme.com", "Acme")
+
+        http.assert_not_called()
+        assert breaker.state == CLOSED
+        assert breaker.consecutive_failures == 0
+
+    async def test_open_gnews_circuit_falls_back_to_rss(self, orchestrator):
+        breaker = get_circuit_breaker("gnews")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        orchestrator.apis["gnews"] = AsyncMock()
+        orchestrator.rss_fetcher.fetch_news = AsyncMock(
+            return_value={"result_count": 1, "results": [{"title": "a"}]}
+        )
+
+        result = await orchestrator._fetch_news_layers("john@acme.com", "acme.com", "Acme")
+
+        orchestrator.apis["gnews"].enrich_with_name.assert_not_called()
+        assert result["result_count"] == 1
+
+    async def test_cancelled_probe_releases_half_open_slot(self, orchestrator):
+        breaker = get_circuit_breaker("pdl")
+        breaker.failure_threshold = 1
+        breaker.reset_timeout = 0
+        breaker.record_failure()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(orchestrator._call_source("pdl", hang))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        breaker.before_call()  # a new probe is admitted
+
+
+class TestStatusEndpoint:
+
+    def test_status_reports_breaker_state(self, test_client):
+        breaker = get_circuit_breaker("zoominfo")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure("503")
+
+        body = test_client.get("/rad/status").json()
+
+        assert body["circuit_breakers"]["zoominfo"]["state"] == OPEN
+        assert body["circuit_breakers"]["apollo"]["state"] == CLOSED
@@ -0,0 +1,202 @@
+"""
+Tests for the durable email outbox.
+enqueue_ebook_email, EmailSender batching/backoff, and EmailService.send_batch.
+"""
+
+import base64
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+from app.services import email_outbox
+from app.services.email_outbox import EmailSender, backoff_seconds, enqueue_ebook_email
+from app.services.email_service import EmailService
+
+
+class FakeEmailService(EmailService):
+    """EmailService whose batch sends are recorded and fail for chosen recipients."""
+
+    def __init__(self, fail_for=()):
+        super().__init__()
+        self.fail_for = set(fail_for)
+        self.batches = []
+
+    async def send_batch(self, messages):
+        self.batches.append(messages)
+        return [
+            {"success": False, "provider": "mock", "error": "mailbox unavailable"}
+            if m["to_email"] in self.fail_for else
+            {"success": True, "provider": "mock", "message_id": f"id-{m['to_email']}"}
+            for m in messages
+        ]
+
+
+async def _queue(supabase, to_email, delivery_id=None):
+    return await enqueue_ebook_email(
+        supabase, EmailService(), to_email, b"%PDF-1", {"first_name": "Ann"}, "Hook", "CTA",
+        delivery_id=delivery_id
+    )
+
+
+def _make_due(mock_supabase, email_id):
+    mock_supabase.update_outbox_email(email_id, {"next_attempt_at": datetime.utcnow().isoformat()})
+
+
+class TestEnqueue:
+
+    async def test_enqueue_persists_built_message_with_attachment(self, mock_supabase):
+        row = await _queue(mock_supabase, "ann@acme.com")
+
+        stored = mock_supabase.get_outbox_email(row["id"])
+        assert stored["status"] == "pending"
+        assert stored["subject"] == "Ann, your personalized ebook is ready!"
+        assert "Hook" in stored["html_body"] and "CTA" in stored["text_body"]
+        assert base64.b64decode(stored["attachment_base64"]) == b"%PDF-1"
+
+
+class TestEmailSender:
+
+    async def test_sends_due_emails_in_one_batch(self, mock_supabase):
+        rows = [await _queue(mock_supabase, f"user{i}@acme.com") for i in range(3)]
+        service = FakeEmailService()
+
+        claimed = await EmailSender(mock_supabase, service, worker_id="s1").run_once()
+
+        assert claimed == 3
+        assert len(service.batches) == 1
+        assert [m["to_email"] for m in service.batches[0]] == [f"user{i}@acme.com" for i in range(3)]
+        assert service.batches[0][0]["pdf_bytes"] == b"%PDF-1"
+        for row in rows:
+            stored = mock_supabase.get_outbox_email(row["id"])
+            assert stored["status"] == "sent"
+            assert stored["message_id"] == f"id-{row['to_email']}"
+            assert stored["attachment_base64"] is None
+
+    async def test_batch_size_limits_claim(self, mock_supabase):
+        for i in range(3):
+            await _queue(mock_supabase, f"user{i}@acme.com")
+
+        claimed = await EmailSender(mock_supabase, FakeEmailService(), batch_size=2, worker_id="s1").run_once()
+
+        assert claimed == 2
+
+    async def test_lease_covers_worst_case_smtp_batch(self, mock_supabase, monkeypatch):
+        monkeypatch.setenv("SMTP_HOST", "smtp.example.com")
+        monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+        monkeypatch.delenv("RESEND_API_KEY", raising=False)
+        sender = EmailSender(mock_supabase, EmailService(), batch_size=50, lease_seconds=120)
+
+        with patch.object(email_outbox.settings, "SMTP_POOL_SIZE", 2), \
+                patch.object(email_outbox.settings, "SMTP_TIMEOUT_SECONDS", 30):
+            # 25 rounds of 2 concurrent sends, each up to 2 x 30s, plus margin
+            assert sender.batch_lease_seconds() == 25 * 60 + 120
+            with patch.object(sender.supabase, "claim_outbox_emails", return_value=[]) as claim:
+                await sender.run_once()
+
+        assert claim.call_args.kwargs["lease_seconds"] == 25 * 60 + 120
+
+    async def test_mock_provider_keeps_configured_lease(self, mock_supabase):
+        sender = EmailSender(mock_supabase, FakeEmailService(), lease_seconds=120)
+
+        assert sender.batch_lease_seconds() == 120
+
+    async def test_failure_is_rescheduled_with_backoff(self, mock_supabase):
+        ok = await _queue(mock_supabase, "ok@acme.com")
+        bad = await _queue(mock_supabase, "bad@acme.com")
+        sender = EmailSender(mock_supabase, FakeEmailService(fail_for={"bad@acme.com"}), worker_id="s1")
+
+        await sender.run_once()
+
+        assert mock_supabase.get_outbox_email(ok["id"])["status"] == "sent"
+        retry = mock_supabase.get_outbox_email(bad["id"])
+        assert retry["status"] == "pending"
+        assert retry["attempts"] == 1
+        assert retry["last_error"] == "mailbox unavailable"
+        assert retry["next_attempt_at"] > datetime.utcnow().isoformat()
+        # Not due yet, so the next poll leaves it alone
+        assert await sender.run_once() == 0
+
+    async def test_gives_up_after_max_attempts(self, mock_supabase):
+        delivery = mock_supabase.create_pdf_delivery(job_id="j1", pdf_url="https://x")
+        row = await _queue(mock_supabase, "bad@acme.com", delivery_id=delivery["id"])
+        sender = EmailSender(
+            mock_supabase, FakeEmailService(fail_for={"bad@acme.com"}), max_attempts=2, worker_id="s1"
+        )
+
+        await sender.run_once()
+        _make_due(mock_supabase, row["id"])
+        await sender.run_once()
+
+        stored = mock_supabase.get_outbox_email(row["id"])
+        assert stored["status"] == "failed"
+        assert stored["attempts"] == 2
+        assert mock_supabase._mock_pdfs.get(delivery["id"])["delivery_status"] == "failed"
+
+    async def test_success_marks_pdf_delivery_delivered(self, mock_supabase):
+        delivery = mock_supabase.create_pdf_delivery(job_id="j1", pdf_url="https://x")
+        await _queue(mock_supabase, "ok@acme.com", delivery_id=delivery["id"])
+
+        await EmailSender(mock_supabase, FakeEmailService(), worker_id="s1").run_once()
+
+        record = mock_supabase._mock_pdfs.get(delivery["id"])
+        assert record["delivery_status"] == "delivered"
+        assert record["delivery_channel"] == "email"
+
+    async def test_expired_lease_is_reclaimed(self, mock_supabase):
+        row = await _queue(mock_supabase, "ok@acme.com")
+        mock_supabase.claim_outbox_emails("dead-sender", lease_seconds=-1)
+
+        await EmailSender(mock_supabase, FakeEmailService(), worker_id="s2").run_once()
+
+        stored = mock_supabase.get_outbox_email(row["id"])
+        assert stored["status"] == "sent"
+        assert stored["attempts"] == 2
+
+    async def test_start_and_stop(self, mock_supabase):
+        await _queue(mock_supabase, "ok@acme.com")
+        sender = EmailSender(mock_supabase, FakeEmailService(), poll_interval=0.01, worker_id="s1")
+
+        sender.start()
+        while not sender.email_service.batches:
+            await __import__("asyncio").sleep(0.01)
+        await sender.stop()
+
+        assert sender._task is None
+
+
+class TestBackoff:
+
+    def test_doubles_up_to_cap(self):
+        with patch.object(email_outbox.settings, "EMAIL_OUTBOX_BACKOFF_SECONDS", 10), \
+                patch.object(email_outbox.settings, "EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", 100), \
+                patch("app.services.email_outbox.random.uniform", return_value=1.0):
+            assert [backoff_seconds(n) for n in (1, 2, 3, 4, 5)] == [10, 20, 40, 80, 100]
+
+
+class TestSendBatch:
+
+    @pytest.fixture
+    def sendgrid_env(self, monkeypatch):
+        monkeypatch.setenv("SENDGRID_API_KEY", "SG.test")
+
+    async def test_http_provider_shares_one_client(self, sendgrid_env):
+        service = EmailService()
+        clients = []
+
+        async def fake_sendgrid(to_email, subject, html_body, text_body, pdf_bytes, client=None):
+            clients.append(client)
+            if to_email == "bad@acme.com":
+                raise Exception("SendGrid API error: 400")
+            return {"success": True, "provider": "sendgrid", "message_id": to_email}
+
+        messages = [
+            {**service.build_ebook_email(to, {}, "Hook", "CTA"), "pdf_bytes": b"%PDF"}
+            for to in ("a@acme.com", "bad@acme.com", "b@acme.com")
+        ]
+        with patch.object(service, "_send_via_sendgrid", side_effect=fake_sendgrid):
+            results = await service.send_batch(messages)
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[2]["message_id"] == "b@acme.com"
+        assert len({id(c) for c in clients}) == 1 and clients[0] is not None
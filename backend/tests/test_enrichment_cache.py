@@ -0,0 +1,155 @@
+"""
+Tests for the two-tier per-source enrichment cache.
+Person sources are keyed by email, company sources by domain.
+"""
+
+import time
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from app.services.enrichment_apis import PDLAPI
+from app.services.enrichment_cache import (
+    SOURCE_CACHE_CONFIG,
+    EnrichmentCache,
+    MemoryLRU,
+    get_memory_tier,
+    remaining_ttl_seconds,
+)
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+PDL_COMPANY = {"name": "acme", "display_name": "Acme", "employee_count": 500}
+APOLLO_PERSON = {"first_name": "John", "company_name": "Acme", "title": "CTO"}
+
+
+class TestEnrichmentCache:
+
+    async def test_company_source_shared_across_emails(self, mock_supabase):
+        cache = EnrichmentCache(mock_supabase)
+        await cache.put("pdl_company", "john@acme.com", "acme.com", PDL_COMPANY)
+
+        assert await cache.get("pdl_company", "jane@acme.com", "acme.com") == PDL_COMPANY
+        assert await cache.get("pdl_company", "bob@other.com", "other.com") is None
+
+    async def test_person_source_keyed_by_email(self, mock_supabase):
+        cache = EnrichmentCache(mock_supabase)
+        await cache.put("apollo", "john@acme.com", "acme.com", APOLLO_PERSON)
+
+        assert await cache.get("apollo", "john@acme.com", "acme.com") == APOLLO_PERSON
+        assert await cache.get("apollo", "jane@acme.com", "acme.com") is None
+
+    async def test_errors_and_mock_data_not_cached(self, mock_supabase):
+        cache = EnrichmentCache(mock_supabase)
+        await cache.put("pdl_company", "", "acme.com", {"_error": "timeout"})
+        await cache.put("zoominfo", "", "acme.com", {"company_name": "Acme", "_mock": True})
+
+        assert await cache.get("pdl_company", "", "acme.com") is None
+        assert await cache.get("zoominfo", "", "acme.com") is None
+
+    async def test_supabase_tier_survives_memory_loss(self, mock_supabase):
+        await EnrichmentCache(mock_supabase).put("pdl_company", "", "acme.com", PDL_COMPANY)
+        get_memory_tier().clear()
+
+        assert await EnrichmentCache(mock_supabase).get("pdl_company", "", "acme.com") == PDL_COMPANY
+
+    async def test_person_source_reads_stored_raw_data(self, mock_supabase):
+        mock_supabase.store_raw_data("john@acme.com", "apollo", APOLLO_PERSON)
+
+        assert await EnrichmentCache(mock_supabase).get("apollo", "john@acme.com", "acme.com") == APOLLO_PERSON
+
+    async def test_stale_supabase_entry_ignored(self, mock_supabase):
+        record = mock_supabase.store_domain_cache("acme.com", "pdl_company", PDL_COMPANY)
+        record["fetched_at"] = (datetime.utcnow() - timedelta(days=365)).isoformat()
+
+        assert await EnrichmentCache(mock_supabase).get("pdl_company", "", "acme.com") is None
+
+    async def test_nearly_expired_row_is_promoted_for_its_remaining_ttl(self, mock_supabase):
+        ttl_hours = SOURCE_CACHE_CONFIG["pdl_company"]["ttl_hours"]
+        record = mock_supabase.store_domain_cache("acme.com", "pdl_company", PDL_COMPANY, ttl_hours)
+        record["fetched_at"] = (datetime.utcnow() - timedelta(hours=ttl_hours, seconds=-60)).isoformat()
+        record["expires_at"] = (datetime.utcnow() + timedelta(seconds=60)).isoformat()
+        memory = MemoryLRU(max_entries=10)
+
+        assert await EnrichmentCache(mock_supabase, memory).get("pdl_company", "", "acme.com") == PDL_COMPANY
+
+        expires_at, _ = memory._entries["pdl_company:acme.com"]
+        assert expires_at - time.monotonic() <= 60
+
+    def test_remaining_ttl_is_clamped_at_zero(self):
+        stale = {"fetched_at": (datetime.utcnow() - timedelta(hours=2)).isoformat()}
+        fresh = {"fetched_at": datetime.utcnow().isoformat() + "+00:00"}
+
+        assert remaining_ttl_seconds(stale, 1) == 0
+        assert 3500 < remaining_ttl_seconds(fresh, 1) <= 3600
+        assert remaining_ttl_seconds({}, 1) == 3600
+
+    def test_memory_lru_evicts_oldest(self):
+        lru = MemoryLRU(max_entries=2)
+        lru.put("a", {"v": 1}, 60)
+        lru.put("b", {"v": 2}, 60)
+        lru.get("a")
+        lru.put("c", {"v": 3}, 60)
+
+        assert lru.get("a") == {"v": 1}
+        assert lru.get("b") is None
+
+    def test_memory_lru_expires(self):
+        lru = MemoryLRU(max_entries=2)
+        lru.put("a", {"v": 1}, -1)
+        assert lru.get("a") is None
+
+
+class TestOrchestratorCaching:
+
+    @pytest.fixture
+    def orchestrator_factory(self, mock_supabase):
+        pdl_company_mock = AsyncMock(return_value=dict(PDL_COMPANY))
+
+        def _make():
+            orchestrator = RADOrchestrator(mock_supabase)
+            orchestrator.apis["pdl"].enrich_company = pdl_company_mock
+            return orchestrator
+
+        _make.pdl_company_mock = pdl_company_mock
+        return _make
+
+    async def test_second_employee_skips_company_api(self, orchestrator_factory):
+        first = orchestrator_factory()
+        await first.enrich("john@acme.com", "acme.com")
+
+        second = orchestrator_factory()
+        result = await second.enrich("jane@acme.com", "acme.com")
+
+        assert orchestrator_factory.pdl_company_mock.await_count == 1
+        assert "pdl_company" in second.cached_sources
+        assert "pdl_company" in result["data_sources"]
+        assert result["company_name"] == "Acme"
+
+    async def test_bypass_calls_vendor_again_and_refreshes_cache(self, orchestrator_factory):
+        await orchestrator_factory().enrich("john@acme.com", "acme.com")
+        orchestrator_factory.pdl_company_mock.return_value = {**PDL_COMPANY, "employee_count": 900}
+
+        refreshed = orchestrator_factory()
+        await refreshed.enrich("john@acme.com", "acme.com", use_cache=False)
+
+        assert orchestrator_factory.pdl_company_mock.await_count == 2
+        assert refreshed.cached_sources == []
+        cached = await EnrichmentCache(refreshed.supabase).get("pdl_company", "", "acme.com")
+        assert cached["employee_count"] == 900
+
+    def test_force_refresh_reaches_vendor(self, test_client, mock_supabase):
+        pdl_company_mock = AsyncMock(return_value=dict(PDL_COMPANY))
+
+        with patch.object(PDLAPI, "enrich_company", pdl_company_mock):
+            test_client.post("/rad/enrich", json={"email": "john@acme.com"})
+            test_client.post("/rad/enrich", json={"email": "jane@acme.com"})
+            assert pdl_company_mock.await_count == 1
+
+            response = test_client.post(
+                "/rad/enrich", json={"email": "jane@acme.com", "force_refresh": True}
+            )
+
+        assert response.status_code == 200
+        assert pdl_company_mock.await_count == 2
@@ -0,0 +1,116 @@
+"""
+Tests for deadline-driven enrichment (latency budgets).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.routes.enrichment import _quick_enrich_flights
+from app.services.rad_orchestrator import RADOrchestrator, _inflight_fetches
+
+
+def _slow(result, delay):
+    async def call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return result
+    return call
+
+
+@pytest.fixture(autouse=True)
+async def cancel_background_fetches():
+    """Dropped sources keep fetching in the background; stop them before the loop closes."""
+    yield
+    for flights in (_inflight_fetches, _quick_enrich_flights):
+        tasks = list(flights._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.fixture
+def orchestrator(mock_supabase):
+    orchestrator = RADOrchestrator(mock_supabase)
+    orchestrator.cache.enabled = False
+    return orchestrator
+
+
+class TestDeadlineOrchestration:
+
+    async def test_slow_source_dropped_at_deadline(self, orchestrator):
+        orchestrator.apis["zoominfo"] = AsyncMock()
+        orchestrator.apis["zoominfo"].enrich = _slow({"company_name": "Acme"}, 5)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        profile = await orchestrator.enrich("john@acme.com", "acme.com", budget_seconds=0.3)
+
+        assert loop.time() - started < 2
+        assert profile["completeness_report"]["timed_out_sources"] == ["zoominfo", "gnews"]
+        assert "zoominfo" not in profile["data_sources"]
+        assert "apollo" in profile["data_sources"]
+
+    async def test_news_starts_once_trusted_name_arrives(self, orchestrator):
+        orchestrator.apis["apollo"] = AsyncMock()
+        orchestrator.apis["apollo"].enrich = AsyncMock(return_value={"company_name": "Acme Corp"})
+        orchestrator.apis["hunter"] = AsyncMock()
+        orchestrator.apis["hunter"].enrich = _slow({}, 5)
+        gnews = AsyncMock()
+        gnews.enrich_with_name = AsyncMock(return_value={"result_count": 1, "results": [{"title": "a"}]})
+        orchestrator.apis["gnews"] = gnews
+
+        raw_data = await orchestrator._fetch_all_sources(
+            "john@acme.com", "acme.com", deadline=asyncio.get_running_loop().time() + 0.3
+        )
+
+        gnews.enrich_with_name.assert_awaited_once_with("john@acme.com", "acme.com", "Acme Corp")
+        assert raw_data["gnews"]["result_count"] == 1
+        assert raw_data["hunter"]["_timed_out"] is True
+        assert orchestrator.timed_out_sources == ["hunter"]
+
+    async def test_news_waits_for_phase1_without_trusted_name(self, orchestrator):
+        gnews = AsyncMock()
+        gnews.enrich_with_name = AsyncMock(return_value={"result_count": 0})
+        orchestrator.apis["gnews"] = gnews
+        orchestrator.rss_fetcher.fetch_news = AsyncMock(return_value={"result_count": 0})
+
+        raw_data = await orchestrator._fetch_all_sources(
+            "john@acme.com", "acme.com", deadline=asyncio.get_running_loop().time() + 5
+        )
+
+        # Mock vendor data is not trusted, so the domain fallback name is used after Phase 1
+        gnews.enrich_with_name.assert_awaited_once_with("john@acme.com", "acme.com", "Acme")
+        assert orchestrator.timed_out_sources == []
+        assert set(raw_data) == {"apollo", "pdl", "hunter", "zoominfo", "pdl_company", "gnews"}
+
+    async def test_no_budget_waits_for_every_source(self, orchestrator):
+        orchestrator.apis["zoominfo"] = AsyncMock()
+        orchestrator.apis["zoominfo"].enrich = _slow({"company_name": "Acme"}, 0.2)
+
+        profile = await orchestrator.enrich("john@acme.com", "acme.com")
+
+        assert "zoominfo" in profile["data_sources"]
+        assert profile["completeness_report"]["timed_out_sources"] == []
+
+
+class TestQuickEnrichBudget:
+
+    async def test_slow_source_treated_as_missing(self):
+        with patch("app.routes.enrichment.ApolloAPI") as MockApollo, \
+             patch("app.routes.enrichment.PDLAPI") as MockPDL, \
+             patch("app.routes.enrichment.settings.QUICK_ENRICH_BUDGET_SECONDS", 0.2):
+
+            MockApollo.return_value.enrich = AsyncMock(return_value={"company_name": "Honeycomb", "title": "VP"})
+            MockPDL.return_value.enrich_company = _slow({"display_name": "Slow Co"}, 5)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                resp = await client.post("/rad/quick-enrich", json={"email": "jane@honeycomb.io"})
+
+        data = resp.json()
+        assert data["found"] is True
+        assert data["company_name"] == "Honeycomb"
+        assert data["title"] == "VP"
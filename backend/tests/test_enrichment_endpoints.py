@@ -3,10 +3,16 @@ Tests for enrichment endpoints.
 POST /rad/enrich and GET /rad/profile/{email}
 """
 
+import asyncio
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 from fastapi import status
 
+from app.services.llm_service import LLMService
+from app.services.pdf_service import PDFService
+from app.services.email_service import EmailService
+
 
 class TestEnrichmentEndpoint:
     """Tests for POST /rad/enrich endpoint."""
@@ -97,6 +103,56 @@ class TestEnrichmentEndpoint:
         finalized = mock_supabase.get_finalize_data("john@acme.com")
         assert finalized is not None
 
+    def test_enrich_runs_llm_calls_concurrently(self, test_client, mock_supabase):
+        """
+        POST /rad/enrich: ebook and legacy generation should overlap.
+        Each fake waits for the other to start; sequential awaits would time out.
+        """
+        ebook_started = asyncio.Event()
+        legacy_started = asyncio.Event()
+
+        async def fake_ebook(self, profile, user_context=None, company_news=None, on_field=None, use_cache=True):
+            ebook_started.set()
+            await asyncio.wait_for(legacy_started.wait(), timeout=2)
+            return {
+                "personalized_hook": "Hook",
+                "case_study_framing": "Framing",
+                "personalized_cta": "CTA",
+            }
+
+        async def fake_legacy(self, normalized_profile, use_opus=False, user_context=None, use_cache=True):
+            legacy_started.set()
+            await asyncio.wait_for(ebook_started.wait(), timeout=2)
+            return {"intro_hook": "Intro", "cta": "Act"}
+
+        with patch.object(LLMService, "generate_ebook_personalization", fake_ebook), \
+                patch.object(LLMService, "generate_personalization", fake_legacy):
+            response = test_client.post(
+                "/rad/enrich",
+                json={"email": "john@acme.com", "force_refresh": True}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        finalized = mock_supabase.get_finalize_data("john@acme.com")
+        assert finalized["normalized_data"]["ebook_personalization"]["personalized_hook"] == "Hook"
+        assert finalized["personalization_intro"] == "Intro"
+
+    def test_enrich_skip_legacy_personalization(self, test_client, mock_supabase):
+        """
+        POST /rad/enrich with skip_legacy_personalization: only ebook content is generated.
+        """
+        with patch.object(LLMService, "generate_personalization") as mock_legacy:
+            response = test_client.post(
+                "/rad/enrich",
+                json={"email": "john@acme.com", "skip_legacy_personalization": True}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_legacy.assert_not_called()
+        finalized = mock_supabase.get_finalize_data("john@acme.com")
+        assert finalized["normalized_data"]["ebook_personalization"]
+        assert finalized["personalization_intro"] is None
+
 
 class TestProfileEndpoint:
     """Tests for GET /rad/profile/{email} endpoint."""
@@ -234,3 +290,91 @@ class TestPDFEndpoint:
         response = test_client.post("/rad/pdf/unknown@example.com")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestDeliverEndpoint:
+    """Tests for POST /rad/deliver/{email} endpoint."""
+
+    def test_deliver_renders_once(self, test_client, mock_supabase):
+        """
+        POST /rad/deliver/{email} without the outbox: one render feeds both
+        the email and storage, and the two run concurrently.
+        """
+        mock_supabase.upsert_finalize_data(
+            email="john@acme.com",
+            normalized_data={
+                "email": "john@acme.com",
+                "first_name": "John",
+                "ebook_personalization": {
+                    "personalized_hook": "Hook",
+                    "case_study_framing": "Framing",
+                    "personalized_cta": "CTA",
+                },
+            },
+            intro="Intro",
+            cta="Act",
+        )
+        render_calls = []
+        email_started = asyncio.Event()
+        store_started = asyncio.Event()
+
+        async def fake_html_to_pdf(self, html_content):
+            render_calls.append(html_content)
+            return b"%PDF-once"
+
+        async def fake_send(self, to_email, pdf_bytes, profile, intro_hook, cta):
+            email_started.set()
+            await asyncio.wait_for(store_started.wait(), timeout=2)
+            assert pdf_bytes == b"%PDF-once"
+            return {"success": True, "provider": "mock", "message_id": "m1"}
+
+        original_store = PDFService.store_rendered_pdf
+
+        async def fake_store(self, pdf_bytes, job_id, profile):
+            store_started.set()
+            await asyncio.wait_for(email_started.wait(), timeout=2)
+            return await original_store(self, pdf_bytes, job_id, profile)
+
+        with patch.object(PDFService, "_html_to_pdf", fake_html_to_pdf), \
+                patch.object(PDFService, "store_rendered_pdf", fake_store), \
+                patch.object(EmailService, "send_ebook", fake_send), \
+                patch("app.routes.enrichment.settings.EMAIL_OUTBOX_ENABLED", False):
+            response = test_client.post("/rad/deliver/john@acme.com")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["email_sent"] is True
+        assert data["email_status"] == "sent"
+        assert data["file_size_bytes"] == len(b"%PDF-once")
+        assert len(render_calls) == 1
+
+    def test_deliver_queues_email_in_outbox(self, test_client, mock_supabase):
+        """
+        POST /rad/deliver/{email}: with the outbox enabled the email is queued
+        with the rendered PDF and the provider is not called inline.
+        """
+        mock_supabase.upsert_finalize_data(
+            email="john@acme.com",
+            normalized_data={"email": "john@acme.com", "first_name": "John"},
+            intro="Intro",
+            cta="Act",
+        )
+
+        async def fake_html_to_pdf(self, html_content):
+            return b"%PDF-queued"
+
+        with patch.object(PDFService, "_html_to_pdf", fake_html_to_pdf), \
+                patch.object(EmailService, "send_ebook") as mock_send:
+            response = test_client.post("/rad/deliver/john@acme.com")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["email_sent"] is True
+        assert data["email_status"] == "queued"
+        mock_send.assert_not_called()
+
+        queued = mock_supabase.get_outbox_email(data["outbox_id"])
+        assert queued["status"] == "pending"
+        assert queued["to_email"] == "john@acme.com"
+        assert queued["subject"].startswith("John")
+        assert queued["delivery_id"] is not None
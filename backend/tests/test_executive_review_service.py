@@ -834,3 +834,78 @@ class TestSignalAnswersInPrompt:
         )
         for label in self.signal_answers.values():
             assert label in prompt, f"Signal answer '{label}' not found in prompt"
+
+
+# =============================================================================
+# TestPromptCaching
+# =============================================================================
+
+class TestPromptCaching:
+    """Static rules and the few-shot example go in cached system blocks."""
+
+    def setup_method(self):
+        self.service = ExecutiveReviewService()
+        self.example = FEW_SHOT_EXAMPLES_POOL["Challenger"][0]
+
+    def _mock_client(self):
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=MagicMock(content=[], usage=None))
+        return client
+
+    def test_system_blocks_end_in_cache_breakpoints(self):
+        blocks = self.service._build_system_blocks(self.example)
+
+        assert len(blocks) == 2
+        assert all(block["cache_control"] == {"type": "ephemeral"} for block in blocks)
+        assert blocks[0]["text"] == self.service._build_system_prompt()
+        assert json.dumps(self.example["output"], indent=2) in blocks[1]["text"]
+
+    def test_user_prompt_leaves_example_to_system_blocks(self):
+        prompt = self.service._build_user_prompt(
+            company_name="Acme Corp",
+            industry="Technology",
+            segment="Enterprise",
+            persona="ITDM",
+            stage="Challenger",
+            priority="Improving performance",
+            challenge="Integration friction",
+            example=self.example,
+        )
+
+        assert json.dumps(self.example["output"], indent=2) not in prompt
+        assert "Acme Corp" in prompt
+
+    @pytest.mark.asyncio
+    async def test_generate_sends_cached_system_blocks(self):
+        self.service.client = self._mock_client()
+
+        await self.service.generate_executive_review(
+            company_name="Acme Corp",
+            industry="Technology",
+            segment="Enterprise",
+            persona="ITDM",
+            stage="Challenger",
+            priority="improving_performance",
+            challenge="integration_friction",
+        )
+
+        system = self.service.client.messages.create.call_args.kwargs["system"]
+        assert isinstance(system, list)
+        assert all("cache_control" in block for block in system)
+        assert not any("Acme Corp" in block["text"] for block in system)
+
+    @pytest.mark.asyncio
+    async def test_retries_reuse_the_same_system_blocks(self):
+        self.service.client = self._mock_client()
+        blocks = self.service._build_system_blocks(self.example)
+        failures = [{"field": "executive_summary", "reason": "too short", "value": "x"}]
+
+        await self.service._retry_failing_fields(
+            {"executive_summary": "x"}, failures, "Acme Corp", "Challenger",
+            "Technology", "Enterprise", "ITDM", "improving_performance",
+            "integration_friction", blocks, max_retries=2
+        )
+
+        calls = self.service.client.messages.create.call_args_list
+        assert len(calls) == 2
+        assert all(call.kwargs["system"] is blocks for call in calls)
@@ -0,0 +1,95 @@
+"""
+Tests for the shared vendor HTTP connection pool.
+Verifies client reuse, per-vendor isolation, and the lifespan fallback.
+"""
+
+import pytest
+import httpx
+from unittest.mock import patch
+
+from app.services import http_pool
+from app.services.http_pool import HTTPClientPool, pooled_client
+from app.services.enrichment_apis import PDLAPI
+
+
+@pytest.fixture
+async def pool():
+    """Install a fresh global pool for the duration of a test."""
+    pool = http_pool.init_http_pool()
+    yield pool
+    await http_pool.close_http_pool()
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool client management."""
+
+    @pytest.mark.asyncio
+    async def test_same_vendor_reuses_client(self):
+        """Repeated lookups for one vendor should return the same client."""
+        pool = HTTPClientPool()
+        assert pool.get("apollo") is pool.get("apollo")
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_vendors_get_separate_clients(self):
+        """Each vendor should get its own client (per-host limits)."""
+        pool = HTTPClientPool()
+        assert pool.get("apollo") is not pool.get("pdl")
+        await pool.aclose()
+
+    def test_unknown_vendor_returns_none(self):
+        """Vendors without config should not get a pooled client."""
+        assert HTTPClientPool().get("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_clears_clients(self):
+        """aclose should close and forget every client."""
+        pool = HTTPClientPool()
+        client = pool.get("hunter")
+        await pool.aclose()
+        assert client.is_closed
+        assert pool._clients == {}
+
+
+class TestPooledClient:
+    """Tests for the pooled_client context manager."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_pool(self):
+        """Outside the app lifespan, a short-lived client is created."""
+        assert http_pool.get_http_pool() is None
+        async with pooled_client("apollo", 5.0) as client:
+            assert isinstance(client, httpx.AsyncClient)
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_uses_pool_when_initialized(self, pool):
+        """Inside the app lifespan, the pooled client is yielded and kept open."""
+        async with pooled_client("apollo", 5.0) as client:
+            assert client is pool.get("apollo")
+        assert not client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_enrichment_calls_share_connection_pool(self, pool):
+        """Two vendor calls should go through the same pooled client."""
+        seen_clients = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"display_name": "Acme", "name": "acme"})
+
+        pool._clients["pdl"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        original_get = pool._clients["pdl"].get
+
+        async def tracking_get(*args, **kwargs):
+            seen_clients.append(pool._clients["pdl"])
+            return await original_get(*args, **kwargs)
+
+        with patch.object(pool._clients["pdl"], "get", side_effect=tracking_get):
+            api = PDLAPI(api_key="test-key")
+            first = await api.enrich_company("acme.com")
+            second = await api.enrich_company("acme.com")
+
+        assert first["display_name"] == "Acme"
+        assert second["display_name"] == "Acme"
+        assert len(seen_clients) == 2
+        assert seen_clients[0] is seen_clients[1]
@@ -0,0 +1,140 @@
+"""
+Tests for the persistent enrichment job queue.
+POST /rad/enrich?async=true, JobWorker, and GET /rad/jobs/{job_id}.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from fastapi import status
+
+from app.services.job_worker import JobWorker
+
+
+def _queue_job(test_client, email="john@acme.com"):
+    response = test_client.post(
+        "/rad/enrich?async=true",
+        json={"email": email, "company": "Acme Corp", "force_refresh": True}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+class TestAsyncEnrich:
+    """Tests for queueing and polling async enrichment jobs."""
+
+    def test_async_enrich_returns_queued_job(self, test_client, mock_supabase):
+        """?async=true persists a pending job and returns without enriching."""
+        data = _queue_job(test_client)
+
+        assert data["status"] == "queued"
+        job = mock_supabase.get_job(data["job_id"])
+        assert job["status"] == "pending"
+        assert job["request_payload"]["company"] == "Acme Corp"
+        assert mock_supabase.get_finalize_data("john@acme.com") is None
+
+    async def test_worker_completes_job(self, test_client, mock_supabase):
+        """JobWorker runs the pipeline and stores the result for polling."""
+        data = _queue_job(test_client)
+
+        worker = JobWorker(mock_supabase, concurrency=2, worker_id="w1")
+        assert await worker.run_once() == 1
+
+        job = mock_supabase.get_job(data["job_id"])
+        assert job["status"] == "completed"
+        assert mock_supabase.get_finalize_data("john@acme.com") is not None
+
+        response = test_client.get(f"/rad/jobs/{data['job_id']}")
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["status"] == "completed"
+        assert body["result"]["email"] == "john@acme.com"
+        assert "ebook_personalization" in body["result"]
+
+    def test_get_unknown_job_returns_404(self, test_client):
+        response = test_client.get("/rad/jobs/does-not-exist")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_worker_marks_failed_job(self, mock_supabase):
+        """A job without a request payload fails instead of looping forever."""
+        job = mock_supabase.create_job(email="john@acme.com")
+
+        await JobWorker(mock_supabase, worker_id="w1").run_once()
+
+        failed = mock_supabase.get_job(job["id"])
+        assert failed["status"] == "failed"
+        assert failed["error_message"]
+
+
+class TestJobLeasing:
+    """Tests for SupabaseClient.claim_jobs lease semantics (mock mode)."""
+
+    def test_claimed_job_not_claimed_twice(self, mock_supabase):
+        mock_supabase.create_job(email="a@acme.com", request_payload={"email": "a@acme.com"})
+
+        first = mock_supabase.claim_jobs("w1", limit=5)
+        second = mock_supabase.claim_jobs("w2", limit=5)
+
+        assert len(first) == 1
+        assert first[0]["leased_by"] == "w1"
+        assert first[0]["attempts"] == 1
+        assert second == []
+
+    def test_expired_lease_is_reclaimed(self, mock_supabase):
+        mock_supabase.create_job(email="a@acme.com", request_payload={"email": "a@acme.com"})
+        job = mock_supabase.claim_jobs("w1")[0]
+        job["lease_expires_at"] = (datetime.utcnow() - timedelta(seconds=1)).isoformat()
+
+        reclaimed = mock_supabase.claim_jobs("w2")
+
+        assert len(reclaimed) == 1
+        assert reclaimed[0]["leased_by"] == "w2"
+        assert reclaimed[0]["attempts"] == 2
+
+    def test_status_update_fenced_by_lease_owner(self, mock_supabase):
+        job = mock_supabase.create_job(email="a@acme.com", request_payload={"email": "a@acme.com"})
+        mock_supabase.claim_jobs("w2")
+
+        assert mock_supabase.update_job_status(job["id"], "completed", leased_by="w1") is None
+        assert mock_supabase.get_job(job["id"])["status"] == "processing"
+        assert mock_supabase.update_job_status(job["id"], "completed", leased_by="w2")["status"] == "completed"
+
+    async def test_heartbeat_keeps_long_job_leased(self, mock_supabase):
+        job = mock_supabase.create_job(email="a@acme.com", request_payload={"email": "a@acme.com"})
+        worker = JobWorker(mock_supabase, lease_seconds=0.3, worker_id="w1")
+        reclaimed = []
+
+        async def slow_pipeline(request, supabase, job_id):
+            for _ in range(4):
+                await asyncio.sleep(0.2)
+                reclaimed.extend(mock_supabase.claim_jobs("w2"))
+            return {"email": request.email}
+
+        with patch("app.services.job_worker.run_enrichment_pipeline", slow_pipeline):
+            await worker.run_once()
+
+        assert reclaimed == []
+        assert mock_supabase.get_job(job["id"])["status"] == "completed"
+
+    async def test_lost_lease_abandons_job(self, mock_supabase):
+        job = mock_supabase.create_job(email="a@acme.com", request_payload={"email": "a@acme.com"})
+        worker = JobWorker(mock_supabase, lease_seconds=0.3, worker_id="w1")
+        finished = []
+
+        async def slow_pipeline(request, supabase, job_id):
+            # Another worker takes over, e.g. after a stalled heartbeat
+            mock_supabase.get_job(job["id"])["leased_by"] = "w2"
+            await asyncio.sleep(5)
+            finished.append(job_id)
+            return {"email": request.email}
+
+        with patch("app.services.job_worker.run_enrichment_pipeline", slow_pipeline), \
+                patch.object(mock_supabase, "store_personalization_output") as store:
+            await asyncio.wait_for(worker.run_once(), timeout=2)
+
+        assert finished == []
+        store.assert_not_called()
+        stored = mock_supabase.get_job(job["id"])
+        assert stored["status"] == "processing"
+        assert stored["leased_by"] == "w2"
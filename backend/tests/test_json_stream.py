@@ -0,0 +1,50 @@
+"""
+Tests for the incremental JSON field parser used for streamed LLM output.
+"""
+
+from app.services.json_stream import JSONFieldStream
+
+
+def _feed_all(text: str, chunk_size: int):
+    parser = JSONFieldStream()
+    completed = []
+    for i in range(0, len(text), chunk_size):
+        completed.extend(parser.feed(text[i:i + chunk_size]))
+    return parser, completed
+
+
+class TestJSONFieldStream:
+
+    def test_fields_complete_as_soon_as_closed(self):
+        parser = JSONFieldStream()
+
+        assert parser.feed('{"hook": "Hel') == []
+        assert parser.feed('lo", "cta": "Go') == [("hook", "Hello")]
+        assert parser.feed('"}') == [("cta", "Go")]
+        assert parser.done is True
+
+    def test_chunk_boundaries_do_not_matter(self):
+        text = '{"a": "one \\"quoted\\" word", "b": "line\\nbreak", "c": "\\u00e9"}'
+        expected = [("a", 'one "quoted" word'), ("b", "line\nbreak"), ("c", "é")]
+
+        for size in (1, 2, 3, 5, len(text)):
+            assert _feed_all(text, size)[1] == expected
+
+    def test_skips_prose_fences_and_nested_values(self):
+        text = 'Sure!\n```json\n{"n": 3, "tags": ["x", "y"], "meta": {"k": "v"}, "hook": "Hi"}\n```'
+
+        parser, completed = _feed_all(text, 4)
+
+        assert completed == [("hook", "Hi")]
+        assert parser.fields == {"hook": "Hi"}
+
+    def test_raw_newlines_inside_strings_are_tolerated(self):
+        _, completed = _feed_all('{"hook": "two\nlines"}', 3)
+
+        assert completed == [("hook", "two\nlines")]
+
+    def test_ignores_text_after_object(self):
+        parser = JSONFieldStream()
+        parser.feed('{"a": "1"} {"b": "2"}')
+
+        assert parser.fields == {"a": "1"}
@@ -0,0 +1,150 @@
+"""
+Tests for the LLM response cache.
+Covers key canonicalisation, both tiers, TTL expiry, and the cache in front
+of ExecutiveReviewService (LLMService caching is in test_llm_service.py).
+"""
+
+import os
+import time
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from app.services import llm_cache
+from app.services.llm_cache import LLMResponseCache, llm_cache_key
+from app.services.executive_review_service import ExecutiveReviewService
+
+
+class TestLLMResponseCache:
+
+    def test_key_covers_model_and_prompts(self):
+        key = llm_cache_key("m", "system", "user", max_tokens=10)
+
+        assert key == llm_cache_key("m", "system", "user", max_tokens=10)
+        assert key != llm_cache_key("other", "system", "user", max_tokens=10)
+        assert key != llm_cache_key("m", "system", "user!", max_tokens=10)
+        assert key != llm_cache_key("m", "system", "user", max_tokens=20)
+
+    def test_key_is_independent_of_dict_order(self):
+        blocks_a = [{"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}]
+        blocks_b = [{"cache_control": {"type": "ephemeral"}, "text": "rules", "type": "text"}]
+
+        assert llm_cache_key("m", blocks_a, "u") == llm_cache_key("m", blocks_b, "u")
+
+    async def test_memory_hit_returns_a_copy(self):
+        cache = LLMResponseCache(ttl_seconds=60, memory_entries=10)
+        await cache.put("k", {"items": [1]})
+
+        first = await cache.get("k")
+        first["items"].append(2)
+
+        assert await cache.get("k") == {"items": [1]}
+        assert cache.hits == 2
+
+    async def test_expired_entries_miss(self):
+        cache = LLMResponseCache(ttl_seconds=0, memory_entries=10)
+        await cache.put("k", {"v": 1})
+        time.sleep(0.01)
+
+        assert await cache.get("k") is None
+        assert cache.misses == 1
+
+    async def test_disk_tier_survives_a_new_process(self, tmp_path):
+        writer = LLMResponseCache(ttl_seconds=60, memory_entries=10, disk_dir=str(tmp_path), disk_entries=10)
+        await writer.put("k", {"v": 1})
+
+        reader = LLMResponseCache(ttl_seconds=60, memory_entries=10, disk_dir=str(tmp_path), disk_entries=10)
+
+        assert await reader.get("k") == {"v": 1}
+
+    async def test_disk_tier_drops_expired_files(self, tmp_path):
+        cache = LLMResponseCache(ttl_seconds=0, memory_entries=0, disk_dir=str(tmp_path), disk_entries=10)
+        await cache.put("k", {"v": 1})
+        time.sleep(0.01)
+
+        assert await cache.get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+    async def test_disk_tier_evicts_oldest(self, tmp_path):
+        cache = LLMResponseCache(ttl_seconds=60, memory_entries=0, disk_dir=str(tmp_path), disk_entries=2)
+        await cache.put("old", {"v": 1})
+        os.utime(tmp_path / "old.json", (1, 1))
+        await cache.put("mid", {"v": 2})
+        await cache.put("new", {"v": 3})
+
+        assert not (tmp_path / "old.json").exists()
+        assert await cache.get("mid") == {"v": 2}
+        assert await cache.get("new") == {"v": 3}
+
+    def test_disabled_cache_is_none(self):
+        with patch.object(llm_cache.settings, "LLM_CACHE_ENABLED", False):
+            assert llm_cache.get_llm_cache() is None
+
+
+class TestExecutiveReviewCaching:
+
+    REVIEW_ARGS = dict(
+        company_name="Acme Corp",
+        industry="Technology",
+        segment="Enterprise",
+        persona="ITDM",
+        stage="Challenger",
+        priority="improving_performance",
+        challenge="integration_friction",
+    )
+
+    def _service(self, content):
+        service = ExecutiveReviewService()
+        service.client = MagicMock()
+        service.client.messages.create = AsyncMock(return_value=MagicMock(content=content, usage=None))
+        return service
+
+    def _tool_block(self):
+        block = MagicMock(type="tool_use")
+        block.input = {
+            "executive_summary": "Acme Corp summary",
+            "advantages": [], "risks": [], "recommendations": [],
+            "case_study_relevance": "Relevant",
+        }
+        return block
+
+    async def test_validated_review_is_served_from_cache(self):
+        service = self._service([self._tool_block()])
+
+        with patch("app.services.executive_review_service.validate_executive_review_content",
+                   return_value={"passed": True, "failures": []}):
+            first = await service.generate_executive_review(**self.REVIEW_ARGS)
+            second = await service.generate_executive_review(**self.REVIEW_ARGS)
+
+        assert service.client.messages.create.await_count == 1
+        assert second == first
+        assert second["_source"] == "llm"
+
+    async def test_bypass_regenerates(self):
+        service = self._service([self._tool_block()])
+
+        with patch("app.services.executive_review_service.validate_executive_review_content",
+                   return_value={"passed": True, "failures": []}):
+            await service.generate_executive_review(**self.REVIEW_ARGS)
+            await service.generate_executive_review(**self.REVIEW_ARGS, use_cache=False)
+
+        assert service.client.messages.create.await_count == 2
+
+    async def test_mock_fallback_is_not_cached(self):
+        service = self._service([])
+
+        await service.generate_executive_review(**self.REVIEW_ARGS)
+        await service.generate_executive_review(**self.REVIEW_ARGS)
+
+        assert service.client.messages.create.await_count == 2
+
+    async def test_fallback_patched_review_is_not_cached(self):
+        service = self._service([self._tool_block()])
+        failure = {"field": "executive_summary", "reason": "too short", "value": "x"}
+
+        with patch("app.services.executive_review_service.validate_executive_review_content",
+                   return_value={"passed": False, "failures": [failure]}):
+            first = await service.generate_executive_review(**self.REVIEW_ARGS)
+            calls = service.client.messages.create.await_count
+            await service.generate_executive_review(**self.REVIEW_ARGS)
+
+        assert first["_source"] == "llm_partial_fallback"
+        assert service.client.messages.create.await_count == 2 * calls
@@ -3,11 +3,13 @@ Tests for LLM service personalization generation.
 Uses mock mode (no real API calls) for predictable testing.
 """
 
+import asyncio
 import pytest
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import patch, AsyncMock
 
-from app.services.llm_service import LLMService, MAX_INTRO_LENGTH, MAX_CTA_LENGTH
+from app.services.llm_service import LLMService, MAX_INTRO_LENGTH, MAX_CTA_LENGTH, get_latency_tracker
+from app.services.llm_providers import BaseLLMProvider
 
 
 class TestLLMService:
@@ -374,3 +376,385 @@ class TestPromptBuilding:
         assert "JSON" in system_prompt
         assert "intro_hook" in system_prompt
         assert "cta" in system_prompt
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider stub that records calls and sleeps to simulate latency."""
+
+    def __init__(self, name: str, responses: list, delay: float = 0.0):
+        super().__init__(model=f"{name}-test")
+        self.name = name
+        self.responses = list(responses)
+        self.delay = delay
+        self.calls = 0
+
+    async def complete(self, system_prompt, user_prompt, max_tokens=500):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        result = self.responses.pop(0) if self.responses else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestAsyncProviderFallback:
+    """Tests for the async provider layer and fallback chain."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_provider(self):
+        """A provider that keeps failing should hand off to the next one."""
+        service = LLMService()
+        primary = FakeProvider("anthropic", [RuntimeError("down"), None])
+        secondary = FakeProvider("openai", ["ok"])
+        service.providers = [primary, secondary]
+
+        with patch("app.services.llm_service.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            content, provider_name = await service._call_with_fallback("sys", "user")
+
+        assert content == "ok"
+        assert provider_name == "openai"
+        assert primary.calls == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail_returns_none(self):
+        """When every provider fails, return (None, 'none')."""
+        service = LLMService()
+        service.providers = [FakeProvider("anthropic", []), FakeProvider("openai", [])]
+
+        with patch("app.services.llm_service.asyncio.sleep", new=AsyncMock()):
+            content, provider_name = await service._call_with_fallback("sys", "user")
+
+        assert content is None
+        assert provider_name == "none"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_do_not_serialize(self):
+        """Slow provider calls should overlap instead of blocking the event loop."""
+        service = LLMService()
+        service.providers = [FakeProvider("anthropic", ["a", "b", "c"], delay=0.2)]
+
+        start = asyncio.get_event_loop().time()
+        results = await asyncio.gather(*[
+            service._call_with_fallback("sys", "user") for _ in range(3)
+        ])
+        elapsed = asyncio.get_event_loop().time() - start
+
+        assert sorted(r[0] for r in results) == ["a", "b", "c"]
+        assert elapsed < 0.5
+
+
+class StreamingFakeProvider(BaseLLMProvider):
+    """Provider stub that streams a response in fixed chunks, optionally failing mid-way."""
+
+    def __init__(self, name: str, text: str, chunk_size: int = 7, fail_after: int = None):
+        super().__init__(model=f"{name}-test")
+        self.name = name
+        self.text = text
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+
+    async def complete(self, system_prompt, user_prompt, max_tokens=500):
+        return self.text
+
+    async def stream(self, system_prompt, user_prompt, max_tokens=500):
+        for i in range(0, len(self.text), self.chunk_size):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise RuntimeError("connection reset")
+            yield self.text[i:i + self.chunk_size]
+
+
+EBOOK_JSON = (
+    '{"personalized_hook": "Acme is scaling fast.", '
+    '"case_study_framing": "Teams like yours cut costs.", '
+    '"personalized_cta": "Book a demo."}'
+)
+
+
+class TestEbookStreaming:
+    """Tests for token-streamed ebook personalization."""
+
+    @pytest.mark.asyncio
+    async def test_fields_reported_in_order_as_they_complete(self):
+        service = LLMService()
+        service.providers = [StreamingFakeProvider("anthropic", EBOOK_JSON)]
+        fields = []
+
+        result = await service.generate_ebook_personalization(
+            {"company_name": "Acme"}, on_field=lambda f, v: fields.append((f, v))
+        )
+
+        assert fields == [
+            ("personalized_hook", "Acme is scaling fast."),
+            ("case_study_framing", "Teams like yours cut costs."),
+            ("personalized_cta", "Book a demo."),
+        ]
+        assert result["personalized_cta"] == "Book a demo."
+        assert result["model_used"] == "anthropic"
+
+    @pytest.mark.asyncio
+    async def test_failure_before_any_field_falls_back(self):
+        service = LLMService()
+        service.providers = [
+            StreamingFakeProvider("anthropic", EBOOK_JSON, fail_after=7),
+            StreamingFakeProvider("openai", EBOOK_JSON),
+        ]
+        fields = []
+
+        result = await service.generate_ebook_personalization(
+            {"company_name": "Acme"}, on_field=lambda f, v: fields.append(f)
+        )
+
+        assert result["model_used"] == "openai"
+        assert fields == ["personalized_hook", "case_study_framing", "personalized_cta"]
+
+    @pytest.mark.asyncio
+    async def test_failure_after_a_field_keeps_it_and_fills_the_rest(self):
+        service = LLMService()
+        service.providers = [
+            StreamingFakeProvider("anthropic", EBOOK_JSON, fail_after=56),
+            StreamingFakeProvider("openai", EBOOK_JSON),
+        ]
+        fields = []
+
+        result = await service.generate_ebook_personalization(
+            {"company_name": "Acme"}, on_field=lambda f, v: fields.append(f)
+        )
+
+        assert result["model_used"] == "anthropic"
+        assert result["personalized_hook"] == "Acme is scaling fast."
+        assert sorted(fields) == sorted(["personalized_hook", "case_study_framing", "personalized_cta"])
+        assert len(fields) == 3
+
+    @pytest.mark.asyncio
+    async def test_streamed_fields_respect_length_limits(self):
+        long_hook = "This sentence is fine. " * 30
+        text = EBOOK_JSON.replace("Acme is scaling fast.", long_hook)
+        service = LLMService()
+        service.providers = [StreamingFakeProvider("anthropic", text)]
+        fields = {}
+
+        await service.generate_ebook_personalization(
+            {"company_name": "Acme"}, on_field=lambda f, v: fields.__setitem__(f, v)
+        )
+
+        assert len(fields["personalized_hook"]) <= 350
+
+    @pytest.mark.asyncio
+    async def test_mock_mode_reports_every_field(self):
+        service = LLMService()
+        service.providers = []
+        fields = []
+
+        result = await service.generate_ebook_personalization(
+            {"company_name": "Acme"}, on_field=lambda f, v: fields.append(f)
+        )
+
+        assert fields == ["personalized_hook", "case_study_framing", "personalized_cta"]
+        assert result["personalized_hook"]
+
+
+class TestPromptCacheAccounting:
+    """Prompt-cache accounting, and no breakpoints on prompts too short to cache."""
+
+    @pytest.mark.asyncio
+    async def test_anthropic_complete_sends_plain_system_prompt(self):
+        from types import SimpleNamespace
+        from app.services.llm_providers import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="test-key", model="claude-test")
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="Hello")],
+            usage=SimpleNamespace(input_tokens=50, cache_read_input_tokens=2000,
+                                  cache_creation_input_tokens=0, output_tokens=20),
+        )
+        provider.client.messages.create = AsyncMock(return_value=response)
+
+        assert await provider.complete("System rules", "User input") == "Hello"
+        system = provider.client.messages.create.call_args.kwargs["system"]
+        assert system == "System rules"
+
+    def test_log_cache_usage_reports_hits_and_misses(self, caplog):
+        from types import SimpleNamespace
+        from app.services.llm_providers import log_cache_usage
+
+        with caplog.at_level("INFO", logger="app.services.llm_providers"):
+            log_cache_usage("hit_call", SimpleNamespace(
+                input_tokens=100, cache_read_input_tokens=900,
+                cache_creation_input_tokens=0, output_tokens=10))
+            log_cache_usage("miss_call", SimpleNamespace(
+                input_tokens=100, cache_read_input_tokens=0,
+                cache_creation_input_tokens=900, output_tokens=10))
+            log_cache_usage("no_usage", None)
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("hit [hit_call]" in m and "read=900" in m and "90%" in m for m in messages)
+        assert any("miss [miss_call]" in m and "write=900" in m for m in messages)
+        assert not any("no_usage" in m for m in messages)
+
+
+LEGACY_JSON = '{"intro_hook": "Acme is growing fast.", "cta": "See how peers modernize."}'
+
+
+class TestLLMServiceCaching:
+
+    async def test_identical_prompt_is_served_from_cache(self):
+        provider = FakeProvider("anthropic", [LEGACY_JSON, LEGACY_JSON])
+        service = LLMService()
+        service.providers = [provider]
+        profile = {"first_name": "Jo", "company_name": "Acme"}
+
+        first = await service.generate_personalization(profile)
+        second = await service.generate_personalization(profile)
+
+        assert provider.calls == 1
+        assert second["intro_hook"] == first["intro_hook"]
+
+    async def test_use_cache_false_regenerates(self):
+        provider = FakeProvider("anthropic", [LEGACY_JSON, LEGACY_JSON])
+        service = LLMService()
+        service.providers = [provider]
+        profile = {"first_name": "Jo", "company_name": "Acme"}
+
+        await service.generate_personalization(profile)
+        await service.generate_personalization(profile, use_cache=False)
+
+        assert provider.calls == 2
+
+    async def test_unparseable_response_is_not_cached(self):
+        provider = FakeProvider("anthropic", ["not json", LEGACY_JSON])
+        service = LLMService()
+        service.providers = [provider]
+
+        await service._call_with_fallback("s", "u", validate=service._parse_response)
+        content, _ = await service._call_with_fallback("s", "u", validate=service._parse_response)
+
+        assert provider.calls == 2
+        assert content == LEGACY_JSON
+
+    async def test_streamed_hit_replays_fields(self):
+        service = LLMService()
+        service.providers = [StreamingFakeProvider("anthropic", EBOOK_JSON)]
+        await service.generate_ebook_personalization({"company_name": "Acme"}, on_field=lambda f, v: None)
+
+        fields = []
+        with patch.object(StreamingFakeProvider, "stream", side_effect=AssertionError("not cached")):
+            result = await service.generate_ebook_personalization(
+                {"company_name": "Acme"}, on_field=lambda f, v: fields.append(f)
+            )
+
+        assert fields == ["personalized_hook", "case_study_framing", "personalized_cta"]
+        assert result["personalized_cta"] == "Book a demo."
+
+
+class CancellableProvider(BaseLLMProvider):
+    """Provider stub that never answers and records whether it was cancelled."""
+
+    def __init__(self, name: str):
+        super().__init__(model=f"{name}-test")
+        self.name = name
+        self.cancelled = False
+
+    async def complete(self, system_prompt, user_prompt, max_tokens=500):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def fast_hedge():
+    """Hedge after 50ms instead of the production default."""
+    with patch("app.services.llm_service.settings.LLM_HEDGE_ENABLED", True), \
+            patch("app.services.llm_service.settings.LLM_HEDGE_DELAY_SECONDS", 0.05), \
+            patch("app.services.llm_service.settings.LLM_HEDGE_MIN_DELAY_SECONDS", 0.05):
+        yield
+
+
+class TestHedgedProviders:
+    """Tests for hedged requests across providers."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self, fast_hedge):
+        service = LLMService()
+        primary = CancellableProvider("anthropic")
+        secondary = FakeProvider("openai", ["fast"])
+        service.providers = [primary, secondary]
+
+        start = asyncio.get_event_loop().time()
+        content, provider_name = await service._call_with_fallback("sys", "user")
+        elapsed = asyncio.get_event_loop().time() - start
+
+        assert (content, provider_name) == ("fast", "openai")
+        assert primary.cancelled is True
+        assert elapsed < 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self, fast_hedge):
+        service = LLMService()
+        primary = FakeProvider("anthropic", ["ok"])
+        secondary = FakeProvider("openai", ["unused"])
+        service.providers = [primary, secondary]
+
+        content, provider_name = await service._call_with_fallback("sys", "user")
+
+        assert (content, provider_name) == ("ok", "anthropic")
+        assert secondary.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_slower_primary_still_wins_if_first(self, fast_hedge):
+        service = LLMService()
+        primary = FakeProvider("anthropic", ["primary"], delay=0.1)
+        secondary = FakeProvider("openai", ["secondary"], delay=1)
+        service.providers = [primary, secondary]
+
+        content, provider_name = await service._call_with_fallback("sys", "user")
+
+        assert provider_name == "anthropic"
+        assert secondary.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_waits_for_next_provider(self, fast_hedge):
+        service = LLMService()
+        service.providers = [FakeProvider("anthropic", ["not json"]), FakeProvider("openai", [LEGACY_JSON])]
+
+        content, provider_name = await service._call_with_fallback(
+            "sys", "user", validate=service._parse_response
+        )
+
+        assert (content, provider_name) == (LEGACY_JSON, "openai")
+
+    @pytest.mark.asyncio
+    async def test_disabled_hedging_is_sequential(self):
+        service = LLMService()
+        primary = FakeProvider("anthropic", ["ok"], delay=0.1)
+        secondary = FakeProvider("openai", ["unused"])
+        service.providers = [primary, secondary]
+
+        with patch("app.services.llm_service.settings.LLM_HEDGE_ENABLED", False), \
+                patch("app.services.llm_service.settings.LLM_HEDGE_MIN_DELAY_SECONDS", 0):
+            content, _ = await service._call_with_fallback("sys", "user")
+
+        assert content == "ok"
+        assert secondary.calls == 0
+
+    def test_hedge_delay_tracks_observed_percentile(self):
+        provider = FakeProvider("anthropic", [])
+        tracker = get_latency_tracker()
+        for i in range(1, 101):
+            tracker.record("anthropic:anthropic-test", i / 10)
+
+        with patch("app.services.llm_service.settings.LLM_HEDGE_PERCENTILE", 95), \
+                patch("app.services.llm_service.settings.LLM_HEDGE_MIN_SAMPLES", 20), \
+                patch("app.services.llm_service.settings.LLM_HEDGE_MIN_DELAY_SECONDS", 1):
+            assert LLMService._hedge_delay(provider) == pytest.approx(9.5)
+
+    def test_hedge_delay_uses_default_until_enough_samples(self):
+        provider = FakeProvider("anthropic", [])
+        get_latency_tracker().record("anthropic:anthropic-test", 0.2)
+
+        with patch("app.services.llm_service.settings.LLM_HEDGE_DELAY_SECONDS", 8), \
+                patch("app.services.llm_service.settings.LLM_HEDGE_MIN_SAMPLES", 20):
+            assert LLMService._hedge_delay(provider) == 8
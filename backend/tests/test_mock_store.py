@@ -0,0 +1,89 @@
+"""
+Tests for the indexed in-memory tables behind SupabaseClient mock mode.
+"""
+
+import pytest
+
+from app.services.mock_store import MockTable
+from app.services.supabase_client import SupabaseClient
+
+
+class TestMockTable:
+
+    @pytest.fixture
+    def table(self):
+        return MockTable("raw_data", unique=["id"], indexes=[["email"], ["email", "source"]])
+
+    def test_find_uses_indexes_in_insertion_order(self, table):
+        table.insert({"id": 1, "email": "a@x.com", "source": "apollo"})
+        table.insert({"id": 2, "email": "b@x.com", "source": "apollo"})
+        table.insert({"id": 3, "email": "a@x.com", "source": "pdl"})
+
+        assert [r["id"] for r in table.find(email="a@x.com")] == [1, 3]
+        assert table.find_latest(source="pdl", email="a@x.com")["id"] == 3
+        assert table.find(email="nobody@x.com") == []
+
+    def test_unindexed_criteria_fall_back_to_scan(self, table):
+        table.insert({"id": 1, "email": "a@x.com", "source": "apollo"})
+
+        assert [r["id"] for r in table.find(source="apollo")] == [1]
+
+    def test_unique_key_insert_replaces(self):
+        table = MockTable("finalize_data", unique=["email"])
+        table.insert({"email": "a@x.com", "v": 1})
+        table.insert({"email": "a@x.com", "v": 2})
+
+        assert len(table) == 1
+        assert table.get("a@x.com")["v"] == 2
+
+    def test_update_reindexes_changed_fields(self):
+        table = MockTable("jobs", unique=["id"], indexes=[["status"]])
+        table.insert({"id": "j1", "status": "pending"})
+
+        table.update(("j1",), {"status": "processing"})
+
+        assert table.find(status="pending") == []
+        assert [j["id"] for j in table.find(status="processing")] == ["j1"]
+
+    def test_row_cap_evicts_oldest(self, table):
+        table.max_rows = 2
+        for i in range(3):
+            table.insert({"id": i, "email": "a@x.com", "source": "apollo"})
+
+        assert [r["id"] for r in table] == [1, 2]
+        assert table.get(0) is None
+        assert [r["id"] for r in table.find(email="a@x.com")] == [1, 2]
+
+    def test_delete_removes_from_indexes(self, table):
+        table.insert({"id": 1, "email": "a@x.com", "source": "apollo"})
+        table.delete(1)
+
+        assert len(table) == 0
+        assert table.find(email="a@x.com") == []
+
+
+class TestMockModeClient:
+
+    def test_pdf_delivery_can_be_updated(self, mock_supabase):
+        delivery = mock_supabase.create_pdf_delivery(job_id="j1", pdf_url="https://x")
+
+        updated = mock_supabase.update_pdf_delivery(delivery["id"], "delivered", delivery_channel="email")
+
+        assert updated["delivery_status"] == "delivered"
+        assert updated["delivery_channel"] == "email"
+
+    def test_pending_jobs_follow_status_changes(self, mock_supabase):
+        first = mock_supabase.create_job(email="a@x.com")
+        mock_supabase.create_job(email="b@x.com")
+        mock_supabase.update_job_status(first["id"], "completed")
+
+        assert [j["email"] for j in mock_supabase.get_pending_jobs()] == ["b@x.com"]
+
+    def test_store_row_cap(self, mock_supabase, monkeypatch):
+        monkeypatch.setattr("app.services.supabase_client.settings.MOCK_STORE_MAX_ROWS", 3)
+        client = SupabaseClient()
+        for i in range(5):
+            client.store_raw_data(f"user{i}@x.com", "apollo", {"i": i})
+
+        assert len(client._mock_raw_data) == 3
+        assert client.get_raw_data_for_email("user0@x.com") == []
@@ -16,14 +16,7 @@ from app.services.rad_orchestrator import RADOrchestrator
 @pytest.fixture
 def mock_supabase():
     """Fresh SupabaseClient in mock mode."""
-    client = SupabaseClient()
-    client._mock_raw_data = []
-    client._mock_staging = []
-    client._mock_finalize = []
-    client._mock_jobs = []
-    client._mock_outputs = []
-    client._mock_pdfs = []
-    return client
+    return SupabaseClient()
 
 
 class TestNewsCacheStorage:
@@ -57,8 +50,8 @@ class TestNewsCacheStorage:
         mock_supabase.store_news_cache("example.com", payload)
 
         # Manually set fetched_at to 25 hours ago
-        for record in mock_supabase._mock_raw_data:
-            if record.get("source") == "gnews_cache":
+        for record in mock_supabase._mock_domain_cache.values():
+            if record.get("source") == "gnews":
                 old_time = (datetime.utcnow() - timedelta(hours=25)).isoformat()
                 record["fetched_at"] = old_time
 
@@ -159,3 +152,28 @@ class TestOrchestratorCacheIntegration:
         # Should now be cached
         cached = mock_supabase.get_cached_news("newco.com")
         assert cached is not None
+
+
+class TestDomainCacheTable:
+    """Test the domain_cache upsert and TTL expiry."""
+
+    def test_upsert_keeps_one_row_per_domain_and_source(self, mock_supabase):
+        mock_supabase.store_news_cache("example.com", {"result_count": 1})
+        mock_supabase.store_news_cache("example.com", {"result_count": 2})
+        mock_supabase.store_domain_cache("example.com", "pdl_company", {"name": "example"})
+
+        assert len(mock_supabase._mock_domain_cache) == 2
+        assert len(mock_supabase._mock_raw_data) == 0
+
+    def test_expired_entry_not_returned(self, mock_supabase):
+        mock_supabase.store_domain_cache("example.com", "pdl_company", {"name": "example"}, ttl_hours=-1)
+
+        assert mock_supabase.get_domain_cache("example.com", "pdl_company") is None
+        assert len(mock_supabase._mock_domain_cache) == 0
+
+    def test_purge_removes_only_expired(self, mock_supabase):
+        mock_supabase.store_domain_cache("old.com", "gnews", {}, ttl_hours=-1)
+        mock_supabase.store_domain_cache("new.com", "gnews", {}, ttl_hours=24)
+
+        assert mock_supabase.purge_expired_domain_cache() == 1
+        assert mock_supabase.get_cached_news("new.com") is not None
@@ -0,0 +1,120 @@
+"""
+Tests for the speculative news prefetch that overlaps Phase 1.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+NEWS = {"company_name": "Acme", "result_count": 1, "results": [{"title": "Acme raises"}]}
+
+
+@pytest.fixture
+def orchestrator(mock_supabase):
+    orchestrator = RADOrchestrator(mock_supabase)
+    orchestrator.cache.enabled = False
+    return orchestrator
+
+
+def _slow_apollo(orchestrator, started: asyncio.Event, release: asyncio.Event):
+    async def enrich(email, domain):
+        started.set()
+        await release.wait()
+        return {"_mock": True}
+
+    orchestrator.apis["apollo"] = AsyncMock()
+    orchestrator.apis["apollo"].enrich = enrich
+
+
+class TestSpeculativeNews:
+
+    async def test_user_company_news_overlaps_phase1(self, orchestrator):
+        started, release = asyncio.Event(), asyncio.Event()
+        _slow_apollo(orchestrator, started, release)
+        news_started_during_phase1 = []
+
+        async def enrich_with_name(email, domain, company_name):
+            news_started_during_phase1.append(not release.is_set())
+            return NEWS
+
+        orchestrator.apis["gnews"] = AsyncMock()
+        orchestrator.apis["gnews"].enrich_with_name = enrich_with_name
+
+        fetch = asyncio.ensure_future(
+            orchestrator._fetch_all_sources("john@acme.com", "acme.com", user_company="Acme")
+        )
+        await started.wait()
+        await asyncio.sleep(0.01)
+        release.set()
+        raw_data = await fetch
+
+        assert news_started_during_phase1 == [True]
+        assert raw_data["gnews"]["results"] == NEWS["results"]
+
+    async def test_fresh_news_cache_supplies_name(self, orchestrator, mock_supabase):
+        mock_supabase.store_news_cache("acme.com", NEWS)
+        orchestrator.apis["gnews"] = AsyncMock()
+
+        raw_data = await orchestrator._fetch_all_sources("john@acme.com", "acme.com")
+
+        orchestrator.apis["gnews"].enrich_with_name.assert_not_called()
+        assert raw_data["gnews"]["results"] == NEWS["results"]
+
+    async def test_without_confident_name_uses_resolved_name(self, orchestrator):
+        orchestrator.apis["gnews"] = AsyncMock()
+        orchestrator.apis["gnews"].enrich_with_name = AsyncMock(return_value=NEWS)
+
+        await orchestrator._fetch_all_sources("john@acme.com", "acme.com")
+
+        orchestrator.apis["gnews"].enrich_with_name.assert_awaited_once_with(
+            "john@acme.com", "acme.com", "Acme"
+        )
+
+    async def test_prefetch_discarded_when_name_differs(self, orchestrator, mock_supabase):
+        mock_supabase.store_news_cache("acme.com", {**NEWS, "company_name": "Acme Old"})
+        orchestrator.apis["pdl"] = AsyncMock()
+        orchestrator.apis["pdl"].enrich_company = AsyncMock(return_value={"display_name": "Acme Inc"})
+        calls = []
+        original = orchestrator._fetch_gnews_with_name
+
+        async def spy(email, domain, company_name):
+            calls.append(company_name)
+            return await original(email, domain, company_name)
+
+        orchestrator._fetch_gnews_with_name = spy
+
+        await orchestrator._fetch_all_sources("john@acme.com", "acme.com")
+
+        assert calls == ["Acme Old", "Acme Inc"]
+
+    async def test_deadline_mode_reuses_prefetch(self, orchestrator):
+        orchestrator.apis["gnews"] = AsyncMock()
+        orchestrator.apis["gnews"].enrich_with_name = AsyncMock(return_value=NEWS)
+
+        raw_data = await orchestrator._fetch_all_sources(
+            "john@acme.com", "acme.com", user_company="Acme",
+            deadline=asyncio.get_running_loop().time() + 5
+        )
+
+        orchestrator.apis["gnews"].enrich_with_name.assert_awaited_once_with(
+            "john@acme.com", "acme.com", "Acme"
+        )
+        assert raw_data["gnews"]["results"] == NEWS["results"]
+
+    @pytest.mark.parametrize("cached", [True, False])
+    async def test_news_cache_read_once(self, orchestrator, mock_supabase, cached):
+        if cached:
+            mock_supabase.store_news_cache("acme.com", NEWS)
+        orchestrator.apis["gnews"] = AsyncMock()
+        orchestrator.apis["gnews"].enrich_with_name = AsyncMock(return_value=NEWS)
+        lookup = AsyncMock(wraps=orchestrator.supabase.get_cached_news)
+
+        with patch.object(orchestrator.supabase, "get_cached_news", lookup):
+            raw_data = await orchestrator._fetch_all_sources("john@acme.com", "acme.com")
+
+        assert lookup.await_count == 1
+        assert raw_data["gnews"]["results"] == NEWS["results"]
@@ -0,0 +1,74 @@
+"""
+Tests for the content-addressed rendered-PDF cache.
+"""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from app.services.pdf_cache import PDFCache, pdf_cache_key
+from app.services.pdf_service import PDFService
+
+
+class TestPDFCache:
+
+    def test_key_is_content_addressed(self):
+        assert pdf_cache_key("<p>a</p>") == pdf_cache_key("<p>a</p>")
+        assert pdf_cache_key("<p>a</p>") != pdf_cache_key("<p>b</p>")
+
+    async def test_memory_lru_evicts_by_size(self):
+        cache = PDFCache(memory_max_bytes=10)
+        await cache.put("a", b"12345")
+        await cache.put("b", b"12345")
+        await cache.get("a")  # a is now most recently used
+        await cache.put("c", b"12345")
+
+        assert await cache.get("a") == b"12345"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"12345"
+
+    async def test_disk_tier_survives_memory_eviction(self, tmp_path):
+        cache = PDFCache(memory_max_bytes=5, disk_dir=str(tmp_path), disk_max_bytes=100)
+        await cache.put("a", b"12345")
+        await cache.put("b", b"67890")  # pushes a out of memory
+
+        assert await cache.get("a") == b"12345"
+        assert (tmp_path / "a.pdf").exists()
+
+    async def test_disk_tier_evicts_oldest(self, tmp_path):
+        cache = PDFCache(memory_max_bytes=0, disk_dir=str(tmp_path), disk_max_bytes=10)
+        await cache.put("old", b"12345")
+        os.utime(tmp_path / "old.pdf", (1, 1))
+        await cache.put("mid", b"12345")
+        await cache.put("new", b"12345")
+
+        assert not (tmp_path / "old.pdf").exists()
+        assert await cache.get("mid") == b"12345"
+        assert await cache.get("new") == b"12345"
+
+
+class TestHtmlToPdfCaching:
+
+    @pytest.fixture
+    def renderer(self):
+        class CountingRenderer:
+            calls = 0
+
+            async def render(self, html_content):
+                self.calls += 1
+                return b"%PDF-rendered"
+
+        return CountingRenderer()
+
+    async def test_repeat_render_served_from_cache(self, renderer, tmp_path):
+        cache = PDFCache(memory_max_bytes=1024, disk_dir=str(tmp_path), disk_max_bytes=1024)
+        with patch("app.services.pdf_service.get_pdf_renderer", return_value=renderer), \
+                patch("app.services.pdf_service.get_pdf_cache", return_value=cache):
+            service = PDFService()
+            first = await service._html_to_pdf("<p>same</p>")
+            second = await service._html_to_pdf("<p>same</p>")
+            await service._html_to_pdf("<p>different</p>")
+
+        assert first == second == b"%PDF-rendered"
+        assert renderer.calls == 2
+        assert cache.hits == 1
@@ -0,0 +1,126 @@
+"""
+Tests for the process-pool PDF render service.
+Uses lightweight render functions so the tests don't depend on weasyprint's
+native libraries being installed.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch
+
+from app.services.pdf_render_service import (
+    PDFRenderService,
+    PDFRenderError,
+    PDFRenderBusyError,
+)
+from app.services.pdf_service import PDFService
+
+
+# Module-level so spawned worker processes can unpickle them
+def _echo_render(html_content: str) -> bytes:
+    return html_content.encode()
+
+
+def _slow_render(html_content: str) -> bytes:
+    time.sleep(float(html_content))
+    return b"%PDF-slow"
+
+
+@pytest.fixture
+def make_renderer():
+    created = []
+
+    def _make(**kwargs):
+        renderer = PDFRenderService(**kwargs)
+        created.append(renderer)
+        return renderer
+
+    yield _make
+    for renderer in created:
+        renderer.shutdown()
+
+
+class TestPDFRenderService:
+
+    async def test_render_runs_in_worker_process(self, make_renderer):
+        renderer = make_renderer(max_workers=1, max_queue=2, timeout=30, render_fn=_echo_render)
+        assert await renderer.render("<p>hi</p>") == b"<p>hi</p>"
+
+    async def test_renders_run_in_parallel(self, make_renderer):
+        renderer = make_renderer(max_workers=2, max_queue=0, timeout=30, render_fn=_slow_render)
+        await renderer.warm_up()
+
+        start = time.monotonic()
+        results = await asyncio.gather(renderer.render("0.5"), renderer.render("0.5"))
+        elapsed = time.monotonic() - start
+
+        assert results == [b"%PDF-slow", b"%PDF-slow"]
+        assert elapsed < 0.95
+
+    async def test_full_queue_rejects(self, make_renderer):
+        renderer = make_renderer(max_workers=1, max_queue=0, timeout=30, render_fn=_slow_render)
+        first = asyncio.create_task(renderer.render("0.5"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PDFRenderBusyError):
+            await renderer.render("0")
+        assert await first == b"%PDF-slow"
+
+    async def test_timeout_recycles_pool(self, make_renderer):
+        renderer = make_renderer(max_workers=1, max_queue=0, timeout=0.5, render_fn=_slow_render)
+        await renderer.warm_up()
+
+        with pytest.raises(PDFRenderError):
+            await renderer.render("10")
+
+        # Fresh pool still serves renders
+        assert await renderer.render("0") == b"%PDF-slow"
+
+    async def test_timeout_does_not_fail_concurrent_renders(self, make_renderer):
+        renderer = make_renderer(max_workers=2, max_queue=2, timeout=3, render_fn=_slow_render)
+        await renderer.warm_up()
+        recycles = []
+        original_recycle = renderer._recycle_executor
+
+        def counting_recycle():
+            recycles.append(1)
+            original_recycle()
+
+        renderer._recycle_executor = counting_recycle
+
+        stuck = asyncio.create_task(renderer.render("10"))
+        await asyncio.sleep(2)
+        # When "10" times out at 3s, "1.5" is still running on the retired
+        # pool and "0.1" is queued behind it; both must be resubmitted
+        running = asyncio.create_task(renderer.render("1.5"))
+        await asyncio.sleep(0.1)
+        queued = asyncio.create_task(renderer.render("0.1"))
+
+        with pytest.raises(PDFRenderError):
+            await stuck
+        assert await running == b"%PDF-slow"
+        assert await queued == b"%PDF-slow"
+        assert len(recycles) == 1
+
+
+class TestHtmlToPdf:
+
+    async def test_busy_renderer_propagates(self):
+        class BusyRenderer:
+            async def render(self, html_content):
+                raise PDFRenderBusyError("full")
+
+        with patch("app.services.pdf_service.get_pdf_renderer", return_value=BusyRenderer()):
+            with pytest.raises(PDFRenderBusyError):
+                await PDFService()._html_to_pdf("<p>hi</p>")
+
+    async def test_render_failure_falls_back(self):
+        class FailingRenderer:
+            async def render(self, html_content):
+                raise PDFRenderError("timed out")
+
+        with patch("app.services.pdf_service.get_pdf_renderer", return_value=FailingRenderer()):
+            pdf_bytes = await PDFService()._html_to_pdf("<h1>Title</h1>")
+
+        assert pdf_bytes.startswith(b"%PDF")
@@ -0,0 +1,154 @@
+"""
+Tests for per-vendor rate limiting and the shared daily quota ledger.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.async_supabase_client import AsyncSupabaseClient
+from app.services.enrichment_apis import EnrichmentAPIError, GNewsAPI, HunterAPI
+from app.services.rad_orchestrator import RADOrchestrator
+from app.services.rate_limiter import (
+    QuotaLedger,
+    TokenBucket,
+    VendorLimitError,
+    VendorRateLimiter,
+)
+
+
+LIMITS = {"gnews": {"rate_per_second": 100.0, "burst": 10, "daily_quota": 3}}
+
+
+@pytest.fixture
+def ledger(mock_supabase):
+    return QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase))
+
+
+class TestTokenBucket:
+
+    def test_burst_then_refuse(self):
+        bucket = TokenBucket(rate=1.0, capacity=2)
+
+        assert bucket.try_take() == 0
+        assert bucket.try_take() == 0
+        assert bucket.try_take() > 0
+
+    async def test_acquire_gives_up_past_max_wait(self):
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        bucket.try_take()
+
+        assert await bucket.acquire(max_wait=0.01) is False
+
+    async def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        bucket.try_take()
+
+        assert await bucket.acquire(max_wait=0.5) is True
+
+
+class TestQuotaLedger:
+
+    def test_store_refuses_charge_past_limit(self, mock_supabase):
+        assert mock_supabase.consume_api_quota("gnews", "2026-10-16", 2, 3) is True
+        assert mock_supabase.consume_api_quota("gnews", "2026-10-16", 2, 3) is False
+        assert mock_supabase.consume_api_quota("gnews", "2026-10-16", 1, 3) is True
+        assert mock_supabase.consume_api_quota("gnews", "2026-10-17", 3, 3) is True
+
+    async def test_exhaustion_remembered_locally(self, ledger):
+        assert await ledger.consume("gnews", 3, 3) is True
+        assert await ledger.consume("gnews", 1, 3) is False
+
+        assert ledger.is_exhausted("gnews")
+
+    async def test_ledger_failure_fails_open(self):
+        supabase = MagicMock()
+        supabase.consume_api_quota = AsyncMock(side_effect=RuntimeError("db down"))
+
+        assert await QuotaLedger(supabase).consume("gnews", 1, 3) is True
+
+
+class TestVendorRateLimiter:
+
+    async def test_workers_share_quota_through_store(self, mock_supabase):
+        first = VendorRateLimiter(QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase)), LIMITS)
+        second = VendorRateLimiter(QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase)), LIMITS)
+
+        await first.acquire("gnews", cost=2)
+        with pytest.raises(VendorLimitError) as exc:
+            await second.acquire("gnews", cost=2)
+
+        assert exc.value.quota_exhausted is True
+        assert second.quota_exhausted("gnews")
+
+    async def test_mark_exhausted_is_shared(self, mock_supabase):
+        first = VendorRateLimiter(QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase)), LIMITS)
+        second = VendorRateLimiter(QuotaLedger(AsyncSupabaseClient(mock_store=mock_supabase)), LIMITS)
+
+        await first.mark_exhausted("gnews")
+
+        assert first.quota_exhausted("gnews")
+        with pytest.raises(VendorLimitError):
+            await second.acquire("gnews")
+
+    async def test_rate_limited_call_costs_no_quota(self, ledger, mock_supabase):
+        limits = {"gnews": {"rate_per_second": 0.01, "burst": 1, "daily_quota": 3}}
+        limiter = VendorRateLimiter(ledger, limits, max_wait=0)
+
+        await limiter.acquire("gnews")
+        with pytest.raises(VendorLimitError) as exc:
+            await limiter.acquire("gnews")
+
+        assert exc.value.quota_exhausted is False
+        assert mock_supabase._mock_quota.find(vendor="gnews")[0]["used"] == 1
+
+    async def test_default_gnews_bucket_admits_concurrent_fetches(self, ledger):
+        limiter = VendorRateLimiter(ledger, max_wait=0)
+
+        for _ in range(5):
+            await limiter.acquire("gnews", cost=2)
+
+    async def test_unknown_vendor_is_unlimited(self, ledger):
+        await VendorRateLimiter(ledger, LIMITS).acquire("tavily", cost=100)
+
+
+class TestEnrichmentAPIIntegration:
+
+    async def test_exhausted_gnews_skips_http(self, ledger):
+        limiter = VendorRateLimiter(ledger, LIMITS)
+        await limiter.mark_exhausted("gnews")
+
+        with patch("app.services.enrichment_apis.get_rate_limiter", return_value=limiter), \
+                patch("httpx.AsyncClient") as http:
+            result = await GNewsAPI(api_key="test-key").enrich_with_name(
+                "test@datadog.com", "datadoghq.com", "Datadog"
+            )
+
+        http.assert_not_called()
+        assert result["_quota_exhausted"] is True
+        assert result["result_count"] == 0
+
+    async def test_refused_call_raises_429(self, ledger):
+        limits = {"hunter": {"rate_per_second": 0.01, "burst": 1, "daily_quota": None}}
+        limiter = VendorRateLimiter(ledger, limits, max_wait=0)
+        await limiter.acquire("hunter")
+
+        with patch("app.services.enrichment_apis.get_rate_limiter", return_value=limiter):
+            with pytest.raises(EnrichmentAPIError) as exc:
+                await HunterAPI(api_key="test-key").enrich("john@acme.com", "acme.com")
+
+        assert exc.value.status_code == 429
+
+    async def test_orchestrator_goes_straight_to_rss(self, mock_supabase, ledger):
+        limiter = VendorRateLimiter(ledger, LIMITS)
+        await limiter.mark_exhausted("gnews")
+
+        orchestrator = RADOrchestrator(mock_supabase)
+        orchestrator.apis["gnews"] = AsyncMock()
+        rss_result = {"result_count": 2, "results": [{"title": "a"}, {"title": "b"}]}
+        orchestrator.rss_fetcher.fetch_news = AsyncMock(return_value=rss_result)
+
+        with patch("app.services.rad_orchestrator.get_rate_limiter", return_value=limiter):
+            result = await orchestrator._fetch_news_layers("test@acme.com", "acme.com", "Acme")
+
+        orchestrator.apis["gnews"].enrich_with_name.assert_not_called()
+        assert result["result_count"] == 2
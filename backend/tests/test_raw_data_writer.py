@@ -0,0 +1,107 @@
+"""
+Tests for batched raw_data writes.
+Rows are buffered and flushed with one multi-row insert per batch.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.async_supabase_client import AsyncSupabaseClient
+from app.services.raw_data_writer import RawDataWriter
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+def _rows(n, email="john@acme.com"):
+    return [{"email": email, "source": f"source{i}", "payload": {"i": i}} for i in range(n)]
+
+
+class TestStoreRawDataMany:
+
+    def test_sync_client_inserts_all_rows(self, mock_supabase):
+        stored = mock_supabase.store_raw_data_many(_rows(3))
+
+        assert len(stored) == 3
+        assert all(r["fetched_at"] for r in stored)
+        assert len(mock_supabase.get_raw_data_for_email("john@acme.com")) == 3
+
+    async def test_async_client_shares_store(self, mock_supabase):
+        await AsyncSupabaseClient(mock_store=mock_supabase).store_raw_data_many(_rows(2))
+
+        assert len(mock_supabase.get_raw_data_for_email("john@acme.com")) == 2
+
+
+class TestRawDataWriter:
+
+    @pytest.fixture
+    def async_client(self, mock_supabase):
+        client = AsyncSupabaseClient(mock_store=mock_supabase)
+        client.store_raw_data_many = AsyncMock(wraps=client.store_raw_data_many)
+        return client
+
+    async def test_submissions_coalesce_into_one_insert(self, async_client, mock_supabase):
+        writer = RawDataWriter(async_client, max_buffer=100, batch_size=50, flush_interval=0.05)
+        writer.start()
+        writer.submit(_rows(3, "a@acme.com"))
+        writer.submit(_rows(3, "b@acme.com"))
+        await writer.stop()
+
+        assert async_client.store_raw_data_many.await_count == 1
+        assert len(mock_supabase._mock_raw_data) == 6
+
+    async def test_batches_capped_at_batch_size(self, async_client):
+        writer = RawDataWriter(async_client, max_buffer=100, batch_size=4, flush_interval=0.05)
+        writer.start()
+        writer.submit(_rows(10))
+        await writer.stop()
+
+        sizes = [len(call.args[0]) for call in async_client.store_raw_data_many.await_args_list]
+        assert sizes == [4, 4, 2]
+
+    async def test_full_buffer_drops_rows(self, async_client):
+        writer = RawDataWriter(async_client, max_buffer=5, batch_size=10, flush_interval=0.05)
+
+        assert writer.submit(_rows(8)) == 5
+        assert writer.dropped == 3
+
+    async def test_write_failure_does_not_stop_writer(self, async_client, mock_supabase):
+        async_client.store_raw_data_many.side_effect = [RuntimeError("db down"), []]
+        writer = RawDataWriter(async_client, max_buffer=10, batch_size=1, flush_interval=0.01)
+        writer.start()
+        writer.submit(_rows(2))
+        await writer.stop()
+
+        assert async_client.store_raw_data_many.await_count == 2
+
+    async def test_stop_does_not_hang_on_full_buffer(self, async_client):
+        async def stalled_insert(rows):
+            await asyncio.sleep(60)
+
+        async_client.store_raw_data_many.side_effect = stalled_insert
+        writer = RawDataWriter(async_client, max_buffer=2, batch_size=1, flush_interval=0.01)
+        writer.start()
+        writer.submit(_rows(1))
+        await asyncio.sleep(0.05)  # writer is now stuck inside the first insert
+        assert writer.submit(_rows(3)) == 2
+
+        await asyncio.wait_for(writer.stop(timeout=0.2), timeout=2)
+
+        assert writer.pending() == 2
+
+
+class TestOrchestratorRawDataWrites:
+
+    async def test_enrich_submits_rows_to_writer(self, mock_supabase):
+        writer = RawDataWriter(AsyncSupabaseClient(mock_store=mock_supabase))
+
+        with patch("app.services.rad_orchestrator.get_raw_data_writer", return_value=writer):
+            await RADOrchestrator(mock_supabase).enrich("john@acme.com", "acme.com")
+
+        # Queued for the background task, not written on the request path
+        assert writer.pending() > 0
+        assert mock_supabase.get_raw_data_for_email("john@acme.com") == []
+
+    async def test_enrich_writes_inline_without_writer(self, mock_supabase):
+        await RADOrchestrator(mock_supabase).enrich("john@acme.com", "acme.com")
+
+        assert len(mock_supabase.get_raw_data_for_email("john@acme.com")) > 0
@@ -0,0 +1,110 @@
+"""
+Tests for single-flight request coalescing.
+Concurrent identical company and news fetches should share one vendor call.
+"""
+
+import asyncio
+
+from app.services.single_flight import SingleFlight
+from app.services.rad_orchestrator import RADOrchestrator
+
+
+class TestSingleFlight:
+
+    async def test_concurrent_calls_share_one_fetch(self):
+        group = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(group.do("k", fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r == {"value": 42} for r in results)
+        assert group.in_flight() == 0
+
+    async def test_distinct_keys_fetch_separately(self):
+        group = SingleFlight()
+        calls = []
+
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(group.do("a", lambda: fetch("a")), group.do("b", lambda: fetch("b")))
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_exception_reaches_every_waiter(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("vendor down")
+
+        results = await asyncio.gather(group.do("k", fetch), group.do("k", fetch), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(group.do("k", fetch))
+        second = asyncio.create_task(group.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+    async def test_key_released_after_completion(self):
+        group = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert await group.do("k", fetch) == 1
+        assert await group.do("k", fetch) == 2
+
+
+class TestOrchestratorCoalescing:
+
+    async def test_concurrent_enrichments_share_company_and_news_calls(self, mock_supabase):
+        company_calls = []
+        news_calls = []
+
+        async def fake_enrich_company(domain):
+            company_calls.append(domain)
+            await asyncio.sleep(0.05)
+            return {"name": "acme", "display_name": "Acme"}
+
+        async def fake_news(email, domain, company_name):
+            news_calls.append(domain)
+            await asyncio.sleep(0.05)
+            return {"articles": [{"title": "Acme news"}], "result_count": 1}
+
+        orchestrators = []
+        for _ in range(3):
+            orchestrator = RADOrchestrator(mock_supabase)
+            orchestrator.apis["pdl"].enrich_company = fake_enrich_company
+            orchestrator.apis["gnews"].enrich_with_name = fake_news
+            orchestrators.append(orchestrator)
+
+        results = await asyncio.gather(*(
+            o.enrich(email, "acme.com")
+            for o, email in zip(orchestrators, ["a@acme.com", "b@acme.com", "c@acme.com"])
+        ))
+
+        assert len(company_calls) == 1
+        assert len(news_calls) == 1
+        assert all(r["company_name"] == "Acme" for r in results)
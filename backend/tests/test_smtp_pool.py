@@ -0,0 +1,195 @@
+"""
+Tests for the pooled SMTP transport.
+Verifies session reuse, stale-session recovery, and EmailService integration.
+"""
+
+import asyncio
+import smtplib
+import threading
+from email.message import EmailMessage
+
+import pytest
+from unittest.mock import patch
+
+from app.services import smtp_pool
+from app.services.email_service import EmailService
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """smtplib.SMTP stand-in that records handshakes and sent messages."""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.host = host
+        self.logins = 0
+        self.starttls_calls = 0
+        self.sent = []
+        self.closed = False
+        self.fail_next_send = None
+        self.threads = set()
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.starttls_calls += 1
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def send_message(self, message):
+        self.threads.add(threading.get_ident())
+        if self.fail_next_send is not None:
+            error, self.fail_next_send = self.fail_next_send, None
+            raise error
+        self.sent.append(message["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_smtp():
+    FakeSMTP.instances = []
+    yield
+
+
+def _message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["To"] = to
+    message.set_content("hello")
+    return message
+
+
+def _pool(**kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        "smtp.example.com", user="u", password="p", smtp_factory=FakeSMTP, **kwargs
+    )
+
+
+class TestSMTPConnectionPool:
+    """Tests for SMTPConnectionPool session management."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_sends_reuse_one_session(self):
+        pool = _pool(size=2)
+
+        for i in range(3):
+            await pool.send(_message(f"user{i}@example.com"))
+
+        assert len(FakeSMTP.instances) == 1
+        server = FakeSMTP.instances[0]
+        assert server.starttls_calls == 1
+        assert server.logins == 1
+        assert server.sent == ["user0@example.com", "user1@example.com", "user2@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_send_many_uses_single_session(self):
+        pool = _pool()
+
+        await pool.send_many([_message("a@example.com"), _message("b@example.com")])
+
+        assert len(FakeSMTP.instances) == 1
+        assert FakeSMTP.instances[0].sent == ["a@example.com", "b@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_smtp_io_runs_off_the_event_loop(self):
+        pool = _pool()
+
+        await pool.send(_message("a@example.com"))
+
+        assert threading.get_ident() not in FakeSMTP.instances[0].threads
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_pool_size(self):
+        pool = _pool(size=2)
+
+        await asyncio.gather(*[pool.send(_message(f"u{i}@example.com")) for i in range(6)])
+
+        assert len(FakeSMTP.instances) <= 2
+        assert sum(len(s.sent) for s in FakeSMTP.instances) == 6
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_replaced(self):
+        pool = _pool(idle_seconds=0)
+        await pool.send(_message("a@example.com"))
+        await asyncio.sleep(0.01)
+
+        await pool.send(_message("b@example.com"))
+
+        first, second = FakeSMTP.instances
+        assert first.closed is True
+        assert second.sent == ["b@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_session_retries_unsent_messages_on_fresh_connection(self):
+        pool = _pool()
+        await pool.send(_message("a@example.com"))
+        stale = FakeSMTP.instances[0]
+        stale.fail_next_send = smtplib.SMTPServerDisconnected("gone")
+
+        await pool.send_many([_message("b@example.com"), _message("c@example.com")])
+
+        assert stale.closed is True
+        assert FakeSMTP.instances[1].sent == ["b@example.com", "c@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_recipient_keeps_session(self):
+        pool = _pool()
+        await pool.send(_message("a@example.com"))
+        server = FakeSMTP.instances[0]
+        server.fail_next_send = smtplib.SMTPRecipientsRefused({"bad@example.com": (550, b"no")})
+
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            await pool.send(_message("bad@example.com"))
+        await pool.send(_message("c@example.com"))
+
+        assert len(FakeSMTP.instances) == 1
+        assert server.sent == ["a@example.com", "c@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_quits_idle_sessions(self):
+        pool = _pool()
+        await pool.send(_message("a@example.com"))
+
+        await pool.aclose()
+
+        assert FakeSMTP.instances[0].closed is True
+        with pytest.raises(RuntimeError):
+            await pool.send(_message("b@example.com"))
+
+
+class TestEmailServiceSMTP:
+    """Tests for EmailService's SMTP path."""
+
+    @pytest.fixture
+    def smtp_env(self, monkeypatch):
+        monkeypatch.setenv("SMTP_HOST", "smtp.example.com")
+        monkeypatch.delenv("SENDGRID_API_KEY", raising=False)
+        monkeypatch.delenv("RESEND_API_KEY", raising=False)
+
+    @pytest.mark.asyncio
+    async def test_uses_global_pool_when_initialized(self, smtp_env):
+        pool = smtp_pool.init_smtp_pool()
+        pool.smtp_factory = FakeSMTP
+        try:
+            service = EmailService()
+            for to in ("a@example.com", "b@example.com"):
+                result = await service.send_ebook(to, b"%PDF", {"first_name": "A"}, "Hook", "CTA")
+                assert result["success"] is True
+        finally:
+            await smtp_pool.close_smtp_pool()
+
+        assert len(FakeSMTP.instances) == 1
+        assert FakeSMTP.instances[0].sent == ["a@example.com", "b@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_one_off_session_without_pool(self, smtp_env):
+        with patch("app.services.email_service.smtplib.SMTP") as MockSMTP:
+            result = await EmailService().send_ebook("a@example.com", b"%PDF", {}, "Hook", "CTA")
+
+        assert result["success"] is True
+        MockSMTP.return_value.__enter__.return_value.send_message.assert_called_once()
@@ -0,0 +1,141 @@
+"""
+Tests for the Server-Sent Events variants of /rad/enrich and /rad/executive-review.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.enrichment_apis import ApolloAPI
+from app.services.llm_service import LLMService
+from app.services.progress import format_sse, stream_progress
+
+
+def _events(body: str):
+    """Parse an SSE body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def fake_llm():
+    async def fake_ebook(self, profile, user_context=None, company_news=None, on_field=None, use_cache=True):
+        return {"personalized_hook": "Hook", "case_study_framing": "Framing", "personalized_cta": "CTA"}
+
+    async def fake_legacy(self, normalized_profile, use_opus=False, user_context=None, use_cache=True):
+        return {"intro_hook": "Intro", "cta": "Act"}
+
+    with patch.object(LLMService, "generate_ebook_personalization", fake_ebook), \
+            patch.object(LLMService, "generate_personalization", fake_legacy):
+        yield
+
+
+class TestStreamProgress:
+
+    async def test_events_then_result(self):
+        async def run(progress):
+            progress("step", {"n": 1})
+            progress("step", {"n": 2})
+            return {"done": True}
+
+        chunks = [chunk async for chunk in stream_progress(run)]
+
+        assert chunks == [
+            format_sse("step", {"n": 1}),
+            format_sse("step", {"n": 2}),
+            format_sse("result", {"done": True}),
+        ]
+
+    async def test_failure_becomes_error_event(self):
+        async def run(progress):
+            raise RuntimeError("vendor exploded")
+
+        chunks = [chunk async for chunk in stream_progress(run, lambda e: f"failed: {e}")]
+
+        assert _events("".join(chunks)) == [("error", {"detail": "failed: vendor exploded"})]
+
+
+class TestEnrichStream:
+
+    def test_streams_sources_before_result(self, test_client, fake_llm):
+        response = test_client.post("/rad/enrich/stream", json={"email": "john@acme.com"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _events(response.text)
+        names = [name for name, _ in events]
+
+        sources = {data["source"] for name, data in events if name == "source"}
+        assert sources == {"apollo", "pdl", "hunter", "zoominfo", "pdl_company", "gnews"}
+        assert names.index("enrichment") > max(i for i, n in enumerate(names) if n == "source")
+        assert {"news_analysis", "context"} <= set(names)
+        assert {data["section"] for name, data in events if name == "llm_section"} == {
+            "ebook_personalization", "intro"
+        }
+        assert names[-1] == "result"
+        assert events[-1][1]["status"] == "completed"
+        assert events[-1][1]["personalization_intro"] == "Intro"
+
+    def test_source_events_carry_partial_profile(self, test_client, fake_llm):
+        apollo_data = {"company_name": "Acme Corp", "title": "CTO", "first_name": "John"}
+        with patch.object(ApolloAPI, "enrich", AsyncMock(return_value=apollo_data)):
+            response = test_client.post("/rad/enrich/stream", json={"email": "john@acme.com"})
+
+        apollo = next(data for name, data in _events(response.text)
+                      if name == "source" and data["source"] == "apollo")
+        assert apollo["status"] == "ok"
+        assert apollo["profile"]["company_name"] == "Acme Corp"
+        assert apollo["profile"]["title"] == "CTO"
+
+    def test_ebook_fields_stream_with_compliance_applied(self, test_client, fake_llm):
+        async def streaming_ebook(self, profile, user_context=None, company_news=None, on_field=None, use_cache=True):
+            on_field("personalized_hook", "A guaranteed win for Acme.")
+            return {"personalized_hook": "Hook", "case_study_framing": "Framing", "personalized_cta": "CTA"}
+
+        with patch.object(LLMService, "generate_ebook_personalization", streaming_ebook):
+            events = _events(test_client.post("/rad/enrich/stream", json={"email": "john@acme.com"}).text)
+
+        fields = [data for name, data in events if name == "llm_section" and "field" in data]
+        assert fields == [{
+            "section": "ebook_personalization", "field": "personalized_hook", "content": "A win for Acme."
+        }]
+
+    def test_already_enriched_email_streams_cached_result(self, test_client, mock_supabase):
+        mock_supabase.write_finalize_data("john@acme.com", {"data_quality_score": 0.7})
+
+        events = _events(test_client.post("/rad/enrich/stream", json={"email": "john@acme.com"}).text)
+
+        assert [name for name, _ in events] == ["result"]
+        assert events[0][1]["cached"] is True
+
+
+class TestExecutiveReviewStream:
+
+    def test_streams_review_section_and_result(self, test_client):
+        review = {"headline": "Modernize"}
+        with patch("app.routes.enrichment.ExecutiveReviewService") as MockService:
+            MockService.return_value.generate_executive_review = AsyncMock(return_value=review)
+            response = test_client.post(
+                "/rad/executive-review/stream", json={"email": "john@acme.com", "company": "Acme"}
+            )
+
+        events = _events(response.text)
+        names = [name for name, _ in events]
+        assert "source" in names
+        assert ("llm_section", {"section": "executive_review", "content": review}) in events
+        assert names[-1] == "result"
+        assert events[-1][1]["executive_review"] == review
+        assert events[-1][1]["company_name"] == "Acme"
+
+    def test_failure_streams_error_event(self, test_client):
+        with patch("app.routes.enrichment.ExecutiveReviewService") as MockService:
+            MockService.return_value.generate_executive_review = AsyncMock(side_effect=RuntimeError("llm down"))
+            response = test_client.post("/rad/executive-review/stream", json={"email": "john@acme.com"})
+
+        name, data = _events(response.text)[-1]
+        assert name == "error"
+        assert "llm down" in data["detail"]
@@ -0,0 +1,66 @@
+"""
+Tests for the precompiled HTML template renderer.
+CompiledTemplate must match string.Template.safe_substitute exactly.
+"""
+
+import pytest
+from string import Template
+
+from app.services.template_engine import CompiledTemplate
+from app.services.pdf_service import PDFService
+from app.services.ebook_content import EBOOK_SECTIONS, get_case_study_for_industry
+
+
+class TestCompiledTemplate:
+
+    @pytest.mark.parametrize("source,variables", [
+        ("Hello $name!", {"name": "Ada"}),
+        ("Hello ${name}s and $other", {"name": "Ada"}),
+        ("Price: $$5 for $item", {"item": "tea"}),
+        ("Broken $ sign and $1 number", {}),
+        ("Value $v", {"v": "$not_rescanned"}),
+        ("$a$b", {"a": 1, "b": None}),
+    ])
+    def test_matches_safe_substitute(self, source, variables):
+        expected = Template(source).safe_substitute(variables)
+        assert CompiledTemplate(source).render(variables) == expected
+
+    def test_static_values_baked_in(self):
+        compiled = CompiledTemplate("$greeting, $name", static={"greeting": "Hi"})
+        assert compiled.placeholders == {"name"}
+        assert compiled.render({"name": "Ada", "greeting": "ignored"}) == "Hi, Ada"
+
+
+class TestPDFTemplates:
+
+    def test_amd_ebook_bakes_static_sections(self):
+        service = PDFService()
+        profile = {"first_name": "John", "company_name": "Acme", "industry": "healthcare"}
+        case_study = get_case_study_for_industry("healthcare")
+
+        html = service._render_amd_ebook_template(
+            profile=profile,
+            personalized_hook="Hook",
+            case_study=case_study,
+            case_study_framing="Framing",
+            personalized_cta="CTA",
+            user_context={}
+        )
+
+        assert EBOOK_SECTIONS["why_amd"] in html
+        assert "$first_name" not in html
+        assert "$intro_section" not in html
+        assert "Hook" in html
+
+    def test_executive_review_renders_items(self):
+        html = PDFService()._render_executive_review_template({
+            "company_name": "Acme",
+            "stage": "Leader",
+            "advantages": [{"headline": "Fast", "description": "Quick wins"}],
+            "recommendations": [{"title": "Act", "description": "Now"}],
+        })
+
+        assert '<div class="item-number">01</div>' in html
+        assert '<div class="rec-number">1</div>' in html
+        assert "AMD Executive Review - Acme" in html
+        assert "$" not in html
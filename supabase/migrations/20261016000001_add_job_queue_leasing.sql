@@ -0,0 +1,46 @@
+-- Migration: Persistent job queue for POST /rad/enrich?async=true
+-- personalization_jobs doubles as the queue: the request body is stored with
+-- the job, and workers lease rows so a crashed worker's jobs are retried.
+
+-- Step 1: Queue columns
+ALTER TABLE personalization_jobs
+    ADD COLUMN IF NOT EXISTS request_payload JSONB,
+    ADD COLUMN IF NOT EXISTS leased_by TEXT,
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP,
+    ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0 NOT NULL;
+
+-- Step 2: Index for the claim query (oldest claimable first)
+CREATE INDEX IF NOT EXISTS idx_jobs_claimable
+    ON personalization_jobs(status, lease_expires_at, created_at)
+    WHERE status IN ('pending', 'processing');
+
+-- Step 3: Atomic claim. SKIP LOCKED lets concurrent workers each take
+-- different rows without blocking on one another.
+CREATE OR REPLACE FUNCTION claim_personalization_jobs(
+    p_worker_id TEXT,
+    p_batch_size INTEGER DEFAULT 1,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS SETOF personalization_jobs
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE personalization_jobs AS j
+    SET status = 'processing',
+        leased_by = p_worker_id,
+        lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = j.attempts + 1,
+        started_at = NOW()
+    WHERE j.id IN (
+        SELECT id
+        FROM personalization_jobs
+        WHERE status = 'pending'
+           OR (status = 'processing' AND lease_expires_at < NOW())
+        ORDER BY created_at
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.*;
+END;
+$$;
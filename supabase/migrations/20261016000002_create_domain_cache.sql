@@ -0,0 +1,51 @@
+-- Migration: Dedicated company-level cache table
+-- GNews, PDL Company and ZoomInfo responses used to live in raw_data as
+-- '<source>_cache' rows, written with DELETE + INSERT. Concurrent writers
+-- could race and leave duplicate or missing rows. domain_cache is keyed on
+-- (domain, source), so each write is a single atomic upsert and each read
+-- is a primary key lookup.
+
+-- Step 1: Table
+CREATE TABLE IF NOT EXISTS domain_cache (
+    domain VARCHAR(255) NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    fetched_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (domain, source)
+);
+
+-- Step 2: Index for purging expired entries
+CREATE INDEX IF NOT EXISTS idx_domain_cache_expires_at ON domain_cache(expires_at);
+
+-- Step 3: Move the newest existing cache rows out of raw_data
+-- (news cache TTL was 24h, company caches 30 days)
+INSERT INTO domain_cache (domain, source, payload, fetched_at, expires_at)
+SELECT DISTINCT ON (email, source)
+    email,
+    regexp_replace(source, '_cache$', ''),
+    payload,
+    fetched_at,
+    fetched_at + CASE WHEN source = 'gnews_cache' THEN INTERVAL '24 hours' ELSE INTERVAL '30 days' END
+FROM raw_data
+WHERE source IN ('gnews_cache', 'pdl_company_cache', 'zoominfo_cache')
+ORDER BY email, source, fetched_at DESC
+ON CONFLICT (domain, source) DO NOTHING;
+
+DELETE FROM raw_data WHERE source IN ('gnews_cache', 'pdl_company_cache', 'zoominfo_cache');
+
+-- Step 4: TTL expiry. Reads already skip expired rows; this reclaims space.
+-- Schedule with pg_cron where available, e.g.:
+--   SELECT cron.schedule('purge-domain-cache', '0 * * * *', 'SELECT purge_expired_domain_cache()');
+CREATE OR REPLACE FUNCTION purge_expired_domain_cache()
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    removed INTEGER;
+BEGIN
+    DELETE FROM domain_cache WHERE expires_at <= NOW();
+    GET DIAGNOSTICS removed = ROW_COUNT;
+    RETURN removed;
+END;
+$$;
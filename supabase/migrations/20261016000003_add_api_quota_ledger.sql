@@ -0,0 +1,40 @@
+-- Migration: Shared daily quota ledger for enrichment vendors
+-- Vendors with hard daily caps (GNews free tier: 100 requests/day) return
+-- 403 once the cap is hit. Every worker charges its calls here first, so
+-- once the day's quota is spent the call is skipped instead of wasted.
+
+-- Step 1: Table
+CREATE TABLE IF NOT EXISTS api_quota_usage (
+    vendor VARCHAR(50) NOT NULL,
+    usage_date DATE NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (vendor, usage_date)
+);
+
+-- Step 2: Atomic check-and-increment. Returns FALSE (and charges nothing)
+-- when the requested amount would push today's usage past the limit.
+CREATE OR REPLACE FUNCTION consume_api_quota(
+    p_vendor VARCHAR,
+    p_usage_date DATE,
+    p_amount INTEGER,
+    p_limit INTEGER
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_amount > p_limit THEN
+        RETURN FALSE;
+    END IF;
+
+    INSERT INTO api_quota_usage (vendor, usage_date, used, updated_at)
+    VALUES (p_vendor, p_usage_date, p_amount, NOW())
+    ON CONFLICT (vendor, usage_date) DO UPDATE
+        SET used = api_quota_usage.used + EXCLUDED.used,
+            updated_at = NOW()
+        WHERE api_quota_usage.used + EXCLUDED.used <= p_limit;
+
+    RETURN FOUND;
+END;
+$$;
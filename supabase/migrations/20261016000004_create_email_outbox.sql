@@ -0,0 +1,62 @@
+-- Migration: Durable outbound email queue for POST /rad/deliver
+-- /rad/deliver writes the fully built message here and returns; the email
+-- sender leases due rows in batches, hands them to the provider, and
+-- reschedules failures with exponential backoff.
+
+-- Step 1: Outbox table
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    to_email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    html_body TEXT NOT NULL,
+    text_body TEXT NOT NULL,
+    attachment_base64 TEXT,  -- cleared once the email is sent
+    attachment_filename TEXT,
+    delivery_id BIGINT,      -- pdf_deliveries.id updated when the send settles
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'sending', 'sent', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    leased_by TEXT,
+    lease_expires_at TIMESTAMP,
+    provider TEXT,
+    message_id TEXT,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT NOW(),
+    sent_at TIMESTAMP
+);
+
+-- Step 2: Index for the claim query (due rows, oldest first)
+CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+    ON email_outbox(status, next_attempt_at)
+    WHERE status IN ('pending', 'sending');
+
+-- Step 3: Atomic claim. Due pending rows, plus rows whose sender died
+-- mid-batch (lease expired). SKIP LOCKED lets several senders run at once.
+CREATE OR REPLACE FUNCTION claim_email_outbox(
+    p_worker_id TEXT,
+    p_batch_size INTEGER DEFAULT 50,
+    p_lease_seconds INTEGER DEFAULT 120
+)
+RETURNS SETOF email_outbox
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE email_outbox AS o
+    SET status = 'sending',
+        leased_by = p_worker_id,
+        lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = o.attempts + 1
+    WHERE o.id IN (
+        SELECT id
+        FROM email_outbox
+        WHERE (status = 'pending' AND next_attempt_at <= NOW())
+           OR (status = 'sending' AND lease_expires_at < NOW())
+        ORDER BY next_attempt_at
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.*;
+END;
+$$;
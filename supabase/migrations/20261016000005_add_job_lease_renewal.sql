@@ -0,0 +1,23 @@
+-- Migration: Lease renewal for personalization_jobs
+-- Workers heartbeat their lease while a job runs, so an enrichment that
+-- outlives JOB_LEASE_SECONDS is not reclaimed and run a second time.
+-- Renewal (and the final status update) only applies while the caller
+-- still holds the lease.
+
+CREATE OR REPLACE FUNCTION renew_personalization_job_lease(
+    p_job_id BIGINT,
+    p_worker_id TEXT,
+    p_lease_seconds INTEGER DEFAULT 300
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE personalization_jobs
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE id = p_job_id
+      AND status = 'processing'
+      AND leased_by = p_worker_id;
+    RETURN FOUND;
+END;
+$$;